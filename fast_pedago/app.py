@@ -1,6 +1,8 @@
 import logging
 
 import os
+import secrets
+from multiprocessing import Process, Queue
 from pathlib import Path
 
 from argparse import (
@@ -29,10 +31,52 @@ class Main:
             formatter_class=_CustomFormatter,
         )
 
+    @staticmethod
+    def _start_job_server(workers: int):
+        """
+        Starts the job server shared by all kernels in a dedicated process, and
+        gives its address to the kernels through environment variables.
+
+        :param workers: the number of processes allowed to run at the same time.
+        """
+        # Imported here as it is only needed when serving with a job server
+        from fast_pedago.processes.job_server import (
+            run_job_server,
+            JOB_SERVER_ADDRESS_ENV,
+            JOB_SERVER_AUTHKEY_ENV,
+        )
+
+        authkey = secrets.token_hex(16)
+        address_queue = Queue()
+        job_server = Process(
+            target=run_job_server,
+            args=(workers, authkey.encode(), address_queue),
+            daemon=True,
+        )
+        job_server.start()
+
+        host, port = address_queue.get()
+        os.environ[JOB_SERVER_ADDRESS_ENV] = host + ":" + str(port)
+        os.environ[JOB_SERVER_AUTHKEY_ENV] = authkey
+
     @staticmethod
     def _run(args):
         """Run FAST pedagogical branch locally or with server configuration."""
         machine = "server" if args.server else "local"
+        if args.job_server:
+            Main._start_job_server(args.workers)
+        # The options of the processes are given to the kernels through
+        # environment variables
+        if args.timings:
+            # Imported here as it is only needed with the option
+            from fast_pedago.processes.process_timer import TIMINGS_FILE_ENV
+
+            os.environ[TIMINGS_FILE_ENV] = "1"
+        if args.recording_profile:
+            # Imported here as it is only needed with the option
+            from fast_pedago.processes.recording_profiles import RECORDING_PROFILE_ENV
+
+            os.environ[RECORDING_PROFILE_ENV] = args.recording_profile
         print(MAIN_NOTEBOOK_NAME)
         if machine == "server":
             command = (
@@ -43,6 +87,13 @@ class Main:
                 r"""--VoilaConfiguration.file_whitelist="['.*\."""
                 """(png|jpg|gif|xlsx|ico|pdf|json)']" """
             )
+            # Kernels that already ran the notebook, with the app modules
+            # imported and the paths built, are handed to new sessions.
+            if args.kernel_pool > 0:
+                command += (
+                    "--preheat_kernel=True "
+                    "--pool_size=" + str(args.kernel_pool) + " "
+                )
         else:
             command = (
                 "voila "
@@ -56,6 +107,85 @@ class Main:
         except KeyboardInterrupt:
             exit()
 
+    @staticmethod
+    def _run_doe(args):
+        """
+        Runs a design of experiments of the MDA of a reference aircraft, for
+        the sensitivity analysis exercises. The results are streamed to a .csv
+        file of the outputs of the app, and converged cases are added to its
+        results catalogue.
+        """
+        # Imported here as FAST-OAD is heavy to import and only needed to run
+        # the cases
+        from fast_pedago.processes.design_of_experiments import (
+            DesignOfExperiments,
+            DOE_METHODS,
+        )
+        from fast_pedago.processes.mda_inputs import MDA_INPUT_NAMES
+        from fast_pedago.processes.results_catalogue import ResultsCatalogue
+        from fast_pedago.utils import (
+            PathManager,
+            REFERENCE_AIRCRAFT,
+            RESULTS_CATALOGUE_FILE,
+            SEPARATOR,
+        )
+
+        methods = {method.lower().replace(" ", "-"): method for method in DOE_METHODS}
+        if args.method not in methods:
+            exit("Unknown method " + args.method)
+
+        # Inputs are given as name or name:lower:upper
+        bounds = {}
+        for varied_input in args.inputs:
+            name, *name_bounds = varied_input.split(":")
+            try:
+                name_bounds = tuple(float(bound) for bound in name_bounds)
+            except ValueError:
+                name_bounds = None
+            if (
+                name not in MDA_INPUT_NAMES
+                or name_bounds is None
+                or len(name_bounds) not in (0, 2)
+            ):
+                exit(
+                    "Invalid input %s, use name or name:lower:upper with a name "
+                    "in: %s" % (varied_input, ", ".join(MDA_INPUT_NAMES))
+                )
+            bounds[name] = name_bounds or None
+
+        reference_name = args.reference or REFERENCE_AIRCRAFT.replace(SEPARATOR, " ")
+        if reference_name not in PathManager.list_available_reference_file():
+            exit("Unknown reference aircraft " + reference_name)
+
+        # The paths are the ones of the app, for the results to be shown in it
+        results_file_path = args.output and Path(args.output).resolve()
+        os.chdir(MAIN_NOTEBOOK_NAME.parent)
+        PathManager.build_paths()
+
+        design_of_experiments = DesignOfExperiments(
+            reference_name,
+            bounds,
+            method=methods[args.method],
+            samples=args.samples,
+            results_file_path=results_file_path,
+            seed=args.seed,
+            workers=args.workers,
+            results_catalogue=ResultsCatalogue(
+                PathManager.path_to("work", RESULTS_CATALOGUE_FILE)
+            ),
+        )
+
+        def log_case(case, outputs, is_converged):
+            logging.info(
+                "Case %d %s", case, "converged" if is_converged else "did not converge"
+            )
+
+        try:
+            design_of_experiments.run(log_case)
+        except KeyboardInterrupt:
+            exit("Interrupted, run the same command again to resume")
+        logging.info("Results written in %s", design_of_experiments.results_file_path)
+
     # ENTRY POINT ============================================================
     def run(self):
         """Main function."""
@@ -73,8 +203,91 @@ class Main:
             action="store_true",
             help="to be used if ran on server",
         )
+        parser_run.add_argument(
+            "--job-server",
+            action="store_true",
+            help="limits the number of processes computing at the same time for all "
+            "sessions with a shared job server",
+        )
+        parser_run.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="number of processes the job server allows to compute at the same time",
+        )
+        parser_run.add_argument(
+            "--kernel-pool",
+            type=int,
+            default=0,
+            help="number of pre-warmed kernels kept ready for new sessions when ran on "
+            "server, 0 to start a kernel for each session",
+        )
+        parser_run.add_argument(
+            "--timings",
+            action="store_true",
+            help="writes the duration of each phase of the processes as JSON lines "
+            "in a file next to their outputs",
+        )
+        parser_run.add_argument(
+            "--recording-profile",
+            choices=["minimal", "live-plot", "full-debug"],
+            help="what the processes record in their recorder file: minimal, what "
+            "the app needs, live-plot, the coupled variables at each MDA iteration "
+            "too, or full-debug, everything. Minimal if not given",
+        )
         parser_run.set_defaults(func=self._run)
 
+        # sub-command for running a design of experiments ---------------------
+        parser_doe = subparsers.add_parser(
+            "doe",
+            help="run a design of experiments of the MDA",
+            description="run a design of experiments of the MDA of a reference "
+            "aircraft, the inputs not varied keeping their reference values. An "
+            "interrupted design of experiments is resumed by running the same "
+            "command again.",
+        )
+        parser_doe.add_argument(
+            "inputs",
+            nargs="+",
+            help="MDA inputs to vary, as name to vary them between the bounds of "
+            "the sliders of the app, or as name:lower:upper",
+        )
+        parser_doe.add_argument(
+            "--reference",
+            help="name of the reference aircraft, as shown in the app, the default "
+            "reference aircraft if not given",
+        )
+        parser_doe.add_argument(
+            "--method",
+            default="latin-hypercube",
+            help="sampling method: full-factorial, latin-hypercube or sobol",
+        )
+        parser_doe.add_argument(
+            "--samples",
+            type=int,
+            default=100,
+            help="number of cases, or number of levels of each input for the full "
+            "factorial method",
+        )
+        parser_doe.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="seed of the random sampling methods",
+        )
+        parser_doe.add_argument(
+            "--workers",
+            type=int,
+            default=os.cpu_count(),
+            help="number of cases computed at the same time",
+        )
+        parser_doe.add_argument(
+            "--output",
+            help="the .csv file the results are written to, by default a file "
+            "named after the reference aircraft in the outputs of the app",
+        )
+        parser_doe.set_defaults(func=self._run_doe)
+
         # Parse --------------------------------------------------------------
         args = self.parser.parse_args()
         try:
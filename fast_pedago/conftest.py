@@ -0,0 +1,9 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def run_in_temporary_directory(tmp_path, monkeypatch):
+    # OpenMDAO writes the outputs and reports of the problems in the current
+    # directory, they are kept out of the repository
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENMDAO_REPORTS", "0")
@@ -9,10 +9,7 @@ from .components import (
     ProcessFiguresContainer,
     TutorialContainer,
 )
-from fast_pedago.processes import (
-    ProcessLauncher,
-    ProcessPlotter,
-)
+from fast_pedago.processes import ProcessPlotter
 from fast_pedago.utils import PathManager
 
 
@@ -29,6 +26,10 @@ class AppInterface(v.App):
 
         PathManager.build_paths()
 
+        # Imported here as the launcher imports FAST-OAD, heavy to import, so
+        # that importing the app stays fast
+        from fast_pedago.processes import ProcessLauncher
+
         # Sets the residuals and objectives plotter, and the MDA/MDO launcher
         # to run MDA/MDO and plot there evolution.
         self.process_plotter = ProcessPlotter()
@@ -254,6 +255,9 @@ class AppInterface(v.App):
             if self.process_launcher.get_MDA_success():
                 snackbar_to_open = self.process_figures.mda_success_snackbar
             else:
+                self.process_figures.set_mda_failure(
+                    self.process_launcher.get_MDA_failure()
+                )
                 snackbar_to_open = self.process_figures.mda_failure_snackbar
         self.process_figures.open_snackbar(snackbar_to_open)
 
@@ -138,20 +138,30 @@ class Snackbar(v.Snackbar):
         )
         close_snackbar_button.on_event("click", self.disappear)
 
+        self._text = v.Col(
+            cols=9,
+            children=[text],
+        )
+
         self.children = [
             v.Row(
                 justify="center",
                 align="center",
                 children=[
-                    v.Col(
-                        cols=9,
-                        children=[text],
-                    ),
+                    self._text,
                     close_snackbar_button,
                 ],
             ),
         ]
 
+    def set_text(self, text: str):
+        """
+        Changes the text of the snackbar.
+
+        :param text: The new text to put in the snackbar.
+        """
+        self._text.children = [text]
+
     def display(self, widget=None, event=None, data=None):
         """
         Opens the snackbar.
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 import ipyvuetify as v
 
 from .input_widgets import (
@@ -5,9 +7,13 @@ from .input_widgets import (
     SliderInput,
     RangeSliderInput,
 )
-from fast_pedago.processes import ProcessLauncher
+from fast_pedago.processes.mda_inputs import MDA_INPUT_NAMES, MDA_INPUT_BOUNDS
 from fast_pedago.utils import PathManager
 
+# The launcher imports FAST-OAD, it is only imported when the inputs are built
+if TYPE_CHECKING:
+    from fast_pedago.processes import ProcessLauncher
+
 
 # Min and max values for sliders input values
 OPT_AR_MIN = 9.0
@@ -18,13 +24,23 @@ OPT_SWEEP_W_MAX = 45.0
 
 OPT_WING_SPAN_MAX = 60.0
 
+OPT_STARTS = 4
+OPT_STARTS_MAX = 16
+
+# Choices of the second objective of the Pareto front, valued as the objective
+PARETO_OBJECTIVES = [
+    {"text": "Fuel sizing", "value": 0},
+    {"text": "MTOW", "value": 1},
+    {"text": "OWE", "value": 2},
+]
+
 
 class InputsContainer(v.List):
     """
     An input container that can switch to set inputs for MDA and MDO.
     """
 
-    def __init__(self, process_launcher: ProcessLauncher, **kwargs):
+    def __init__(self, process_launcher: "ProcessLauncher", **kwargs):
         """
         :param source_data_file: the path to the source file to initialize *
             the inputs from.
@@ -176,6 +192,9 @@ class InputsContainer(v.List):
         """
         Generates the layout for the MDO inputs.
         """
+        # Imported here as the launcher imports FAST-OAD, heavy to import
+        from fast_pedago.processes.process_launcher import MDO_STRATEGIES
+
         self._objective_selection = v.BtnToggle(
             v_model="toggle_exclusive",
             mandatory=True,
@@ -227,6 +246,47 @@ class InputsContainer(v.List):
             with_checkbox=True,
         )
 
+        self._strategy_selection = v.Select(
+            items=MDO_STRATEGIES,
+            v_model=MDO_STRATEGIES[0],
+            label="Strategy",
+            hint="Optimizer: the optimizer of the MDO configuration. "
+            + "Surrogate: optimization on a model fitted on a few MDA, faster. "
+            + "Parallel gradients: gradients computed on several processes. "
+            + "Multi-start: optimizations from several starting points at once. "
+            + "Pareto front: trade-off between the objective and a second one",
+            persistent_hint=True,
+            class_="pb-2",
+        )
+        self._pareto_objective_selection = v.Select(
+            items=PARETO_OBJECTIVES,
+            v_model=1,
+            label="Second objective",
+            hint="Second objective of the Pareto front strategy",
+            persistent_hint=True,
+            class_="pb-2",
+        )
+        self._starts_input = SliderInput(
+            min=2,
+            max=OPT_STARTS_MAX,
+            step=1,
+            value=OPT_STARTS,
+            label="Starts",
+            tooltip="Number of starting points of the Multi-start strategy, the "
+            + "first one being the current design",
+        )
+        self._resume_checkbox = v.Checkbox(
+            v_model=False,
+            label="Resume the interrupted optimization of the same name",
+            hint="Replays its recorded evaluations, and records this one to "
+            + "resume it if interrupted. Optimizer strategy only",
+            persistent_hint=True,
+        )
+
+        # The second objective is chosen among the other objectives
+        self._objective_selection.observe(self._update_pareto_objectives, "v_model")
+        self._update_pareto_objectives()
+
         self._sweep_w_design_var_input.checkbox.on_event(
             "change", self._ensure_one_design_var
         )
@@ -273,64 +333,78 @@ class InputsContainer(v.List):
                     self._wing_span_constraint_input,
                 ],
             ),
+            _InputsCategory(
+                "Options",
+                [
+                    self._strategy_selection,
+                    self._pareto_objective_selection,
+                    self._starts_input,
+                    self._resume_checkbox,
+                    self._profile_checkbox,
+                ],
+            ),
         ]
 
     def _build_layout_mda(self):
         """
         Generates the layout for the MDA inputs.
         """
+        # Imported here as they import OpenMDAO and FAST-OAD, heavy to import
+        from fast_pedago.processes import SurrogatePreview
+        from fast_pedago.processes.process_launcher import MDA_SOLVERS
+
         self._n_pax_input = SliderInput(
-            min=20,
-            max=400,
+            min=MDA_INPUT_BOUNDS["n_pax"][0],
+            max=MDA_INPUT_BOUNDS["n_pax"][1],
             step=1,
             label="NPAX",
             tooltip="Number of passengers",
         )
         self._v_app_input = SliderInput(
-            min=45,
-            max=170,
+            min=MDA_INPUT_BOUNDS["v_app"][0],
+            max=MDA_INPUT_BOUNDS["v_app"][1],
             step=0.1,
             label="Vapp",
             tooltip="Approach speed [kts]",
         )
         self._cruise_mach_input = SliderInput(
-            min=0.0,
-            max=1.0,
+            min=MDA_INPUT_BOUNDS["cruise_mach"][0],
+            max=MDA_INPUT_BOUNDS["cruise_mach"][1],
             step=0.01,
             label="Mcruise",
             tooltip="Cruise mach",
         )
         self._range_input = SliderInput(
-            min=0,
-            max=10000,
+            min=MDA_INPUT_BOUNDS["range"][0],
+            max=MDA_INPUT_BOUNDS["range"][1],
             step=10,
             label="Range",
             tooltip="Aircraft range [NM]",
         )
         self._payload_input = SliderInput(
-            min=0,
-            max=100000,
+            min=MDA_INPUT_BOUNDS["payload"][0],
+            max=MDA_INPUT_BOUNDS["payload"][1],
             step=10,
             label="Payload",
             tooltip="Aircraft payload [kg]",
         )
         self._max_payload_input = SliderInput(
-            min=0,
-            max=100000,
+            min=MDA_INPUT_BOUNDS["max_payload"][0],
+            max=MDA_INPUT_BOUNDS["max_payload"][1],
             step=10,
             label="Max Payload",
             tooltip="Aircraft max payload [kg]",
         )
         self._wing_aspect_ratio_input = SliderInput(
-            min=4,
-            max=25,
+            min=MDA_INPUT_BOUNDS["wing_aspect_ratio"][0],
+            max=MDA_INPUT_BOUNDS["wing_aspect_ratio"][1],
             step=0.1,
             label="Wing AR",
             tooltip="Aspect Ratio of the wing",
         )
         self._bpr_input = SliderInput(
-            min=2,
-            max=15,
+            min=MDA_INPUT_BOUNDS["bypass_ratio"][0],
+            max=MDA_INPUT_BOUNDS["bypass_ratio"][1],
             step=0.1,
             label="BPR",
             tooltip="ByPass Ratio of the engine",
@@ -345,7 +419,43 @@ class InputsContainer(v.List):
         )
         self._cruise_mach_input.slider.on_event("change", self._mach_alert)
 
+        # Shared by the options of the MDA and of the MDO
+        self._profile_checkbox = v.Checkbox(
+            v_model=False,
+            label="Profile the disciplines",
+            hint="Records the compute time of each discipline, shown in the "
+            + "Discipline profile figure. Makes the process slightly slower",
+            persistent_hint=True,
+        )
+
+        self._solver_selection = v.Select(
+            items=MDA_SOLVERS,
+            v_model=MDA_SOLVERS[0],
+            label="Solver",
+            hint="Solver of the coupling between disciplines. Aitken relaxation "
+            + "and Newton-Krylov usually need fewer iterations",
+            persistent_hint=True,
+            class_="pb-2",
+        )
+
+        # Instant estimation of the main outputs by a surrogate model fitted
+        # on the converged sizings, updated when inputs move.
+        self._surrogate_preview = SurrogatePreview(
+            self.process_launcher.results_catalogue
+        )
+        self.process_launcher.add_result_listener(self._add_preview_result)
+        self._preview_text = v.Html(tag="div", class_="px-3", children=[])
+        for input in self._mda_sliders():
+            input.slider.observe(self._update_preview, "v_model")
+
         self._mda_input = [
+            _InputsCategory(
+                "Preview",
+                [
+                    self._preview_text,
+                ],
+                is_open=True,
+            ),
             _InputsCategory(
                 "TLARs",
                 [
@@ -375,9 +485,80 @@ class InputsContainer(v.List):
                     self._bpr_input,
                 ],
             ),
+            _InputsCategory(
+                "Options",
+                [
+                    self._solver_selection,
+                    self._profile_checkbox,
+                ],
+            ),
             self._snackbar,
         ]
 
+    def _mda_sliders(self) -> list:
+        """
+        :return: the MDA inputs widgets, in the order of the MDA inputs.
+        """
+        return [
+            self._n_pax_input,
+            self._v_app_input,
+            self._cruise_mach_input,
+            self._range_input,
+            self._payload_input,
+            self._max_payload_input,
+            self._wing_aspect_ratio_input,
+            self._bpr_input,
+        ]
+
+    def _update_preview(self, change=None):
+        """
+        Updates the preview of the sizing outputs with the current inputs.
+
+        To be called when an input value changes.
+        """
+        inputs = dict(
+            zip(
+                MDA_INPUT_NAMES,
+                [input.slider.v_model for input in self._mda_sliders()],
+            )
+        )
+        prediction = self._surrogate_preview.predict(inputs)
+
+        if prediction is None:
+            self._preview_text.children = [
+                "Not enough converged sizings yet to estimate the outputs."
+            ]
+            return
+
+        self._preview_text.children = [
+            v.Html(tag="div", children=[label + ": " + value])
+            for label, value in [
+                ("MTOW", f"{prediction['MTOW']:,.0f} kg"),
+                ("OWE", f"{prediction['OWE']:,.0f} kg"),
+                ("Block fuel", f"{prediction['block_fuel']:,.0f} kg"),
+                ("Wing span", f"{prediction['wing_span']:.1f} m"),
+            ]
+        ] + [
+            v.Html(
+                tag="div",
+                class_="text-caption",
+                children=[
+                    "Estimated from "
+                    + str(self._surrogate_preview.training_points)
+                    + " converged sizings"
+                ],
+            )
+        ]
+
+    def _add_preview_result(self, inputs, outputs):
+        """
+        Refits the preview surrogate with a newly converged sizing.
+
+        To be given as a result listener to the process launcher.
+        """
+        self._surrogate_preview.add(inputs, outputs)
+        self._update_preview()
+
     def _ensure_one_design_var(self, widget, event, data):
         """
         Ensures that at least one design variable is chosen
@@ -397,6 +578,23 @@ class InputsContainer(v.List):
                 if self._sweep_w_design_var_input.checkbox.v_model:
                     self._sweep_w_design_var_input.checkbox.v_model = False
 
+    def _update_pareto_objectives(self, change=None):
+        """
+        Removes the objective from the choices of the second objective of the
+        Pareto front, choosing an other one if it was the second objective.
+
+        To be called when the objective changes.
+        """
+        # As in the launcher, the objective is OWE until a button is pressed
+        objective = self._objective_selection.v_model
+        if objective not in (0, 1):
+            objective = 2
+
+        items = [item for item in PARETO_OBJECTIVES if item["value"] != objective]
+        self._pareto_objective_selection.items = items
+        if self._pareto_objective_selection.v_model == objective:
+            self._pareto_objective_selection.v_model = items[0]["value"]
+
     def _mach_alert(self, widget, event, data):
         """
         Opens the snackbar to alert the user if the mach is above the value
@@ -438,6 +636,8 @@ class InputsContainer(v.List):
         self._max_payload_input.disable()
         self._wing_aspect_ratio_input.disable()
         self._bpr_input.disable()
+        self._solver_selection.disabled = True
+        self._profile_checkbox.disabled = True
 
         # MDO inputs
         self._objective_selection.children[0].disabled = True
@@ -446,6 +646,10 @@ class InputsContainer(v.List):
         self._ar_design_var_input.disable()
         self._sweep_w_design_var_input.disable()
         self._wing_span_constraint_input.disable()
+        self._strategy_selection.disabled = True
+        self._pareto_objective_selection.disabled = True
+        self._starts_input.disable()
+        self._resume_checkbox.disabled = True
 
     def enable(self):
         """
@@ -467,6 +671,8 @@ class InputsContainer(v.List):
         self._max_payload_input.enable()
         self._wing_aspect_ratio_input.enable()
         self._bpr_input.enable()
+        self._solver_selection.disabled = False
+        self._profile_checkbox.disabled = False
 
         # MDO inputs
         self._objective_selection.children[0].disabled = False
@@ -475,6 +681,10 @@ class InputsContainer(v.List):
         self._ar_design_var_input.enable()
         self._sweep_w_design_var_input.enable()
         self._wing_span_constraint_input.enable()
+        self._strategy_selection.disabled = False
+        self._pareto_objective_selection.disabled = False
+        self._starts_input.enable()
+        self._resume_checkbox.disabled = False
 
     def retrieve_mda_inputs(self):
         """
@@ -490,6 +700,8 @@ class InputsContainer(v.List):
             max_payload=self._max_payload_input.slider.v_model,
             wing_aspect_ratio=self._wing_aspect_ratio_input.slider.v_model,
             bypass_ratio=self._bpr_input.slider.v_model,
+            solver=self._solver_selection.v_model,
+            is_profiled=self._profile_checkbox.v_model,
         )
 
     def retrieve_mdo_inputs(self):
@@ -507,6 +719,11 @@ class InputsContainer(v.List):
             self._sweep_w_design_var_input.slider.v_model[1],
             not self._wing_span_constraint_input.checkbox.v_model,
             self._wing_span_constraint_input.slider.v_model,
+            strategy=self._strategy_selection.v_model,
+            pareto_objective=self._pareto_objective_selection.v_model,
+            is_resumed=self._resume_checkbox.v_model,
+            is_profiled=self._profile_checkbox.v_model,
+            starts=self._starts_input.slider.v_model,
         )
 
     def set_initial_value_mda(self, source_data_file_name: str):
@@ -531,6 +748,9 @@ class InputsContainer(v.List):
         self._wing_aspect_ratio_input.slider.v_model = reference_inputs[6]
         self._bpr_input.slider.v_model = reference_inputs[7]
 
+        self._surrogate_preview.set_reference(source_data_file_name)
+        self._update_preview()
+
 
 class _InputsCategory(v.ListGroup):
     """
@@ -5,6 +5,8 @@ import ipyvuetify as v
 
 
 from . import Snackbar
+from fast_pedago.processes.diagram_generator import DiagramGenerator, N2, XDSM
+from fast_pedago.processes.residual_monitor import DIVERGED, STAGNATED
 from fast_pedago.utils import _image_from_path, PathManager
 
 
@@ -14,6 +16,15 @@ N2_HTML = "n2.html"
 XDSM_PNG = "xdsm.png"
 XDSM_HTML = "xdsm.html"
 
+# Messages of the MDA failure snackbar, by reason the MDA was stopped for
+MDA_FAILURE_MESSAGES = {
+    None: "Analysis did not converged. Try again with more reasonable values.",
+    DIVERGED: "Analysis diverged and was stopped early. Try again with more "
+    "reasonable values.",
+    STAGNATED: "Analysis was not converging and was stopped early. Try again "
+    "with more reasonable values.",
+}
+
 
 class ProcessFiguresContainer(v.Col):
     """
@@ -49,7 +60,7 @@ class ProcessFiguresContainer(v.Col):
         self._specific_button.children = ["Residuals"]
         self._specific_button.tooltip = "Displays a graph of the evolution "
         "of residuals with the number of iterations"
-        self._display.children = [self._residuals_figure]
+        self._display.children = self._mda_figures
 
     def set_loading(self, message):
         """
@@ -83,7 +94,14 @@ class ProcessFiguresContainer(v.Col):
             ),
         ]
 
-    def plot(self, iterations, main, limit=None, is_aircraft_green: bool = False):
+    def plot(
+        self,
+        iterations,
+        main,
+        limit=None,
+        is_aircraft_green: bool = False,
+        other_traces=(),
+    ):
         """
         Plots the graphs on the active figure
 
@@ -93,6 +111,8 @@ class ProcessFiguresContainer(v.Col):
         :param limit: a limit to plot (threshold/minimum objective), y axis
             value. Default to None will trace nothing
         :param is_aircraft_green: if true, the main graph will be green.
+        :param other_traces: (x, y) values of other graphs to plot alongside
+            the main one, such as the other starts of a multi-start MDO.
         """
         if self._is_MDA:
             active_figure = self._residuals_figure
@@ -102,23 +122,96 @@ class ProcessFiguresContainer(v.Col):
         main_graph: go.Scatter = active_figure.data[0]
         limit_graph: go.Scatter = active_figure.data[1]
 
-        main_graph.x = iterations
-        main_graph.y = main
+        line_color = "green" if is_aircraft_green else "blue"
 
-        limit_graph.x = iterations
-        limit_graph.y = [limit for _ in iterations]
-        if is_aircraft_green:
-            main_graph.line.color = "green"
-        else:
-            main_graph.line.color = "blue"
-        self._display.children = [active_figure]
+        # Traces can't be added during a batch update, the missing ones are
+        # added beforehand and the ones of a previous process removed.
+        trace_count = len(other_traces) + 2
+        if len(active_figure.data) > trace_count:
+            active_figure.data = active_figure.data[:trace_count]
+        for index in range(len(active_figure.data) - 1, trace_count - 1):
+            active_figure.add_scatter(
+                x=[], y=[], mode="lines+markers", name="Start " + str(index + 1)
+            )
+
+        # All the changes are sent to the front-end in a single message
+        with active_figure.batch_update():
+            main_graph.x = iterations
+            main_graph.y = main
+            main_name = "Start 1" if other_traces else active_figure.main_scatter_name
+            if main_graph.name != main_name:
+                main_graph.name = main_name
+
+            for graph, (other_iterations, other_main) in zip(
+                active_figure.data[2:], other_traces
+            ):
+                graph.x = other_iterations
+                graph.y = other_main
+
+            # The limit is an horizontal line, its two ends are enough
+            all_iterations = [iterations] + [trace[0] for trace in other_traces]
+            if iterations:
+                limit_graph.x = [
+                    min(trace[0] for trace in all_iterations),
+                    max(trace[-1] for trace in all_iterations),
+                ]
+                limit_graph.y = [limit, limit]
+
+            if main_graph.line.color != line_color:
+                main_graph.line.color = line_color
+
+        # Replacing the children re-renders the figure, only do it when it is
+        # not the one displayed yet (when it replaces the loading screen).
+        is_displayed = any(child is active_figure for child in self._display.children)
+        if not is_displayed:
+            if self._is_MDA:
+                self._display.children = self._mda_figures
+            else:
+                self._display.children = [active_figure]
+
+    def plot_variables(self, variable_traces):
+        """
+        Plots the coupled variables tracked during the MDA, relatively to their
+        last value so that their convergence can be compared.
+
+        :param variable_traces: the (iterations, values) of each variable, by
+            label.
+        """
+        figure = self._variables_figure
+
+        # Traces can't be added during a batch update, they are rebuilt
+        # beforehand if the variables changed.
+        labels = list(variable_traces)
+        if [graph.name for graph in figure.data] != labels:
+            figure.data = ()
+            for label in labels:
+                figure.add_scatter(
+                    x=[],
+                    y=[],
+                    mode="lines+markers",
+                    name=label,
+                    hovertemplate="%{customdata:.6g}",
+                )
+
+        with figure.batch_update():
+            for graph, label in zip(figure.data, labels):
+                iterations, values = variable_traces[label]
+                last_value = values[-1]
+                graph.x = iterations
+                graph.y = [
+                    100.0 * (value / last_value - 1.0) if last_value else 0.0
+                    for value in values
+                ]
+                graph.customdata = values
 
-    # TODO: Implement the generation of the graphs
     def _generate_n2_xdsm(self):
         """
-        Generate the N2 diagram and the XDSM, located them in data folder.
-        Also, since the take a lot of time to generate, before actually
-        generating them, we check if they exist.
+        Loads the N2 diagram and the XDSM, located in data folder.
+        Also, since they take a lot of time to generate, the interactive
+        diagrams of the MDA configuration are only generated in the background
+        once they are displayed, the diagrams of the data folder being opened
+        until then. The XDSM is generated by the WhatsOpt server, so only when
+        the user asks for it.
         """
 
         # N2 and XDSM images are wrapped in a tooltip to indicate to click on
@@ -126,13 +219,23 @@ class ProcessFiguresContainer(v.Col):
         # This is because it is impossible to load directly the .html into a
         # frame (bugs)
         n2_image_path = PathManager.path_to("data", N2_PNG)
-        n2_file_path = PathManager.path_to("data", N2_HTML)
+        xdsm_image_path = PathManager.path_to("data", XDSM_PNG)
+
+        self._diagrams = DiagramGenerator(
+            PathManager.mda_configuration_file_path,
+            {
+                N2: PathManager.path_to("data", N2_HTML),
+                XDSM: PathManager.path_to("data", XDSM_HTML),
+            },
+        )
 
         n2_image = _image_from_path(n2_image_path, max_height="60vh")
         n2_image.v_on = "tooltip.on"
         n2_image.on_event(
             "click",
-            lambda *args: webbrowser.open_new_tab(n2_file_path),
+            lambda *args: webbrowser.open_new_tab(
+                str(self._diagrams.get_file_path(N2))
+            ),
         )
 
         self._n2_widget = v.Tooltip(
@@ -148,13 +251,13 @@ class ProcessFiguresContainer(v.Col):
             children=["Click me to open interactive N2 graph"],
         )
 
-        xdsm_image_path = PathManager.path_to("data", XDSM_PNG)
-        xdsm_file_path = PathManager.path_to("data", XDSM_HTML)
-
         xdsm_image = _image_from_path(xdsm_image_path, max_height="60vh")
         xdsm_image.v_on = "tooltip.on"
         xdsm_image.on_event(
-            "click", lambda *args: webbrowser.open_new_tab(xdsm_file_path)
+            "click",
+            lambda *args: webbrowser.open_new_tab(
+                str(self._diagrams.get_file_path(XDSM))
+            ),
         )
 
         self._xdsm_widget = v.Tooltip(
@@ -170,6 +273,53 @@ class ProcessFiguresContainer(v.Col):
             children=["Click me to open interactive XDSM graph"],
         )
 
+        self._xdsm_generation_button = v.Btn(
+            text=True,
+            small=True,
+            children=["Generate from the configuration with WhatsOpt"],
+        )
+        self._xdsm_generation_button.on_event(
+            "click", lambda *args: self._generate_xdsm()
+        )
+
+        self._xdsm_display = v.Col(
+            class_="pa-0",
+            children=[
+                self._xdsm_widget,
+                v.Row(
+                    justify="center",
+                    children=[
+                        v.Tooltip(
+                            bottom=True,
+                            v_slots=[
+                                {
+                                    "name": "activator",
+                                    "variable": "tooltip",
+                                    "children": v.Html(
+                                        tag="div",
+                                        v_on="tooltip.on",
+                                        children=[self._xdsm_generation_button],
+                                    ),
+                                }
+                            ],
+                            children=[
+                                "The configuration file is sent to the external "
+                                "WhatsOpt server to draw its XDSM"
+                            ],
+                        ),
+                    ],
+                ),
+            ],
+        )
+
+    def _generate_xdsm(self):
+        """
+        Generates the XDSM of the configuration with the WhatsOpt server, on
+        the user demand. It is opened instead of the default one once ready.
+        """
+        self._xdsm_generation_button.disabled = True
+        self._diagrams.request(XDSM)
+
     def _build_layout(self):
         """
         Builds the layout of the graph visualization container
@@ -225,11 +375,28 @@ class ProcessFiguresContainer(v.Col):
             is_log=False,
         )
 
+        self._variables_figure = go.FigureWidget()
+        self._variables_figure.update_layout(
+            title_text="Evolution of the coupled variables",
+            title_x=0.5,
+            autosize=True,
+            height=350,
+            margin=go.layout.Margin(
+                l=0,
+                r=20,
+                b=0,
+                t=30,
+            ),
+        )
+        self._variables_figure.update_xaxes(title_text="Number of iterations")
+        self._variables_figure.update_yaxes(title_text="Gap to last value (%)")
+
+        # The coupled variables are plotted under the residuals
+        self._mda_figures = [self._residuals_figure, self._variables_figure]
+
         self.mdo_end_snackbar = Snackbar("Optimization ended.")
         self.mda_success_snackbar = Snackbar("Analysis converged successfully!")
-        self.mda_failure_snackbar = Snackbar(
-            "Analysis did not converged. Try again with more reasonable values."
-        )
+        self.mda_failure_snackbar = Snackbar(MDA_FAILURE_MESSAGES[None])
         self._snackbars = [
             self.mdo_end_snackbar,
             self.mda_failure_snackbar,
@@ -272,18 +439,30 @@ class ProcessFiguresContainer(v.Col):
         # None: Residuals/Objective 1: N2 2: N2(browser)
         # 3: XDSM 4: XDSM(browser)
         if data == 1:
+            self._diagrams.request(N2)
             self._display.children = [self._n2_widget]
 
         elif data == 2:
-            self._display.children = [self._xdsm_widget]
+            self._display.children = [self._xdsm_display]
 
         else:
             if self._is_MDA:
-                self._display.children = [self._residuals_figure]
+                self._display.children = self._mda_figures
 
             else:
                 self._display.children = [self._objectives_figure]
 
+    def set_mda_failure(self, failure: str = None):
+        """
+        Sets the message of the MDA failure snackbar.
+
+        :param failure: the reason the MDA was stopped for, DIVERGED or
+            STAGNATED, None if it ran all its iterations.
+        """
+        self.mda_failure_snackbar.set_text(
+            MDA_FAILURE_MESSAGES.get(failure, MDA_FAILURE_MESSAGES[None])
+        )
+
     def open_snackbar(self, snackbar_to_open: Snackbar):
         """
         Opens the chosen snackbar and closes the other one that may still be open.
@@ -331,6 +510,8 @@ class _ProcessFigure(go.FigureWidget):
             **kwargs,
         )
 
+        self._main_scatter_name = main_scatter_name
+
         self.update_layout(
             title_text=title,
             title_x=0.5,
@@ -354,3 +535,10 @@ class _ProcessFigure(go.FigureWidget):
                 title_text=y_axes_label,
                 type="log",
             )
+
+    @property
+    def main_scatter_name(self) -> str:
+        """
+        The name of the main plot, when it is the only one.
+        """
+        return self._main_scatter_name
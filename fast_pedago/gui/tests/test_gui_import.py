@@ -0,0 +1,42 @@
+import json
+import subprocess
+import sys
+
+from pathlib import Path
+
+import fast_pedago
+
+
+# Modules that must only be imported when a process is run or a figure plotted
+HEAVY_MODULES = ["fastoad.api", "openmdao.api", "scipy.optimize", "pandas", "stdatm"]
+
+_IMPORT_SCRIPT = """
+import json
+import sys
+
+import fast_pedago.gui
+
+print(json.dumps(list(sys.modules)))
+"""
+
+
+def _import_gui() -> list:
+    """
+    :return: the names of the modules imported with the GUI.
+    """
+    # In a new interpreter, for no module to be already imported
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        cwd=Path(fast_pedago.__file__).parents[1],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_gui_import_does_not_import_heavy_modules():
+    modules = _import_gui()
+
+    for module in HEAVY_MODULES:
+        assert module not in modules
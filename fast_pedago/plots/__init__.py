@@ -14,8 +14,18 @@ from .plot_signatures import (
     variable_viewer,
     polar_with_L_R_ratio_plot,
     static_margin_plot,
+    discipline_profile_plot,
+    pareto_front_plot,
 )
 
-from .functions import BetterMissionViewer
-
 from .output_graphs_plotter import OutputGraphsPlotter, GRAPH
+
+
+def __getattr__(name: str):
+    # The mission viewer and the comparison table are only imported on first
+    # use, see functions
+    if name in ("BetterMissionViewer", "ComparisonTable"):
+        from . import functions
+
+        return getattr(functions, name)
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
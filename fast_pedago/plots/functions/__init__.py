@@ -1,10 +1,41 @@
-from .aircraft_front_view import _aircraft_front_view_plot
-from .aircraft_side_view import _aircraft_side_view_plot
-from .aircraft_top_view import _aircraft_top_view_plot
-from .flaps_and_slats import _flaps_and_slats_plot
-from .polar_with_lift_to_drag_ratio import _polar_with_L_R_ratio_plot
-from .simplified_payload_range import _simplified_payload_range_plot
-from .stability_diagram import _stability_diagram_plot
-from .static_margin import _static_margin_plot
-from .wing import _wing_plot
-from .better_mission_viewer import BetterMissionViewer
+"""
+The plot functions, each in its own module. They are only imported on first use,
+as their modules import heavy dependencies (FAST-OAD, pandas, scipy...) that
+would otherwise slow down the start of each kernel.
+"""
+
+import importlib
+
+
+# Module of each plot function
+_FUNCTION_MODULES = {
+    "_aircraft_front_view_plot": ".aircraft_front_view",
+    "_aircraft_side_view_plot": ".aircraft_side_view",
+    "_aircraft_top_view_plot": ".aircraft_top_view",
+    "_flaps_and_slats_plot": ".flaps_and_slats",
+    "_polar_with_L_R_ratio_plot": ".polar_with_lift_to_drag_ratio",
+    "_simplified_payload_range_plot": ".simplified_payload_range",
+    "_stability_diagram_plot": ".stability_diagram",
+    "_static_margin_plot": ".static_margin",
+    "_wing_plot": ".wing",
+    "_discipline_profile_plot": ".discipline_profile",
+    "_pareto_front_plot": ".pareto_front",
+    "BetterMissionViewer": ".better_mission_viewer",
+    "ComparisonTable": ".comparison_table",
+}
+
+__all__ = list(_FUNCTION_MODULES)
+
+
+def __getattr__(name: str):
+    if name not in _FUNCTION_MODULES:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    value = getattr(importlib.import_module(_FUNCTION_MODULES[name], __name__), name)
+    # Next accesses do not go through this function
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
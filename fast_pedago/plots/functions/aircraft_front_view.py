@@ -1,7 +1,7 @@
 import numpy as np
 import plotly.graph_objects as go
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 
 from ..plot_constants import (
     COLORS,
@@ -12,6 +12,18 @@ from ..plot_constants import (
 )
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:geometry:wing:tip:y",
+    "data:geometry:horizontal_tail:span",
+    "data:geometry:vertical_tail:span",
+    "data:geometry:fuselage:maximum_height",
+    "data:geometry:fuselage:maximum_width",
+    "data:geometry:propulsion:nacelle:diameter",
+    "data:geometry:propulsion:nacelle:y",
+]
+
+
 def _aircraft_front_view_plot(
     aircraft_file_path: str,
     name=None,
@@ -34,7 +46,7 @@ def _aircraft_front_view_plot(
     :param width : width of the image
     :return: wing plot figure
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     # Wing parameters
     wing_tip_y = variables["data:geometry:wing:tip:y"].value[0]
@@ -1,7 +1,7 @@
 import numpy as np
 import plotly.graph_objects as go
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 
 from ..plot_constants import (
     COLORS,
@@ -13,6 +13,37 @@ from ..plot_constants import (
 )
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:geometry:wing:tip:leading_edge:x:local",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:wing:kink:chord",
+    "data:geometry:wing:kink:leading_edge:x:local",
+    "data:geometry:wing:MAC:at25percent:x",
+    "data:geometry:wing:MAC:leading_edge:x:local",
+    "data:geometry:wing:MAC:length",
+    "data:geometry:horizontal_tail:center:chord",
+    "data:geometry:horizontal_tail:tip:chord",
+    "data:geometry:horizontal_tail:sweep_0",
+    "data:geometry:horizontal_tail:MAC:at25percent:x:local",
+    "data:geometry:horizontal_tail:MAC:at25percent:x:from_wingMAC25",
+    "data:geometry:horizontal_tail:span",
+    "data:geometry:vertical_tail:root:chord",
+    "data:geometry:vertical_tail:tip:chord",
+    "data:geometry:vertical_tail:sweep_0",
+    "data:geometry:vertical_tail:MAC:at25percent:x:local",
+    "data:geometry:vertical_tail:MAC:at25percent:x:from_wingMAC25",
+    "data:geometry:vertical_tail:span",
+    "data:geometry:fuselage:maximum_height",
+    "data:geometry:fuselage:length",
+    "data:geometry:fuselage:front_length",
+    "data:geometry:fuselage:rear_length",
+    "data:geometry:propulsion:nacelle:diameter",
+    "data:geometry:propulsion:nacelle:length",
+]
+
+
 def _aircraft_side_view_plot(
     aircraft_file_path: str,
     name=None,
@@ -35,7 +66,7 @@ def _aircraft_side_view_plot(
     :param width : width of the image
     :return: wing plot figure
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     # Wing parameters
     wing_tip_leading_edge_x = variables[
@@ -1,7 +1,7 @@
 import numpy as np
 import plotly.graph_objects as go
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 
 from ..plot_constants import (
     COLORS,
@@ -12,6 +12,42 @@ from ..plot_constants import (
 )
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:geometry:wing:kink:leading_edge:x:local",
+    "data:geometry:wing:tip:leading_edge:x:local",
+    "data:geometry:wing:root:y",
+    "data:geometry:wing:kink:y",
+    "data:geometry:wing:tip:y",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:kink:chord",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:propulsion:nacelle:diameter",
+    "data:geometry:propulsion:nacelle:length",
+    "data:geometry:propulsion:nacelle:y",
+    "data:geometry:wing:sweep_100_outer",
+    "data:geometry:slat:chord_ratio",
+    "data:geometry:slat:span_ratio",
+    "data:geometry:wing:span",
+    "data:geometry:flap:span_ratio",
+    "data:geometry:flap:chord_ratio",
+    "data:geometry:wing:MAC:length",
+    "data:geometry:wing:MAC:at25percent:x",
+    "data:geometry:wing:MAC:leading_edge:x:local",
+    "data:geometry:horizontal_tail:center:chord",
+    "data:geometry:horizontal_tail:tip:chord",
+    "data:geometry:horizontal_tail:span",
+    "data:geometry:horizontal_tail:sweep_0",
+    "data:geometry:horizontal_tail:sweep_100",
+    "data:geometry:fuselage:maximum_width",
+    "data:geometry:fuselage:length",
+    "data:geometry:fuselage:front_length",
+    "data:geometry:fuselage:rear_length",
+    "data:geometry:horizontal_tail:MAC:at25percent:x:local",
+    "data:geometry:horizontal_tail:MAC:at25percent:x:from_wingMAC25",
+]
+
+
 def _aircraft_top_view_plot(
     aircraft_file_path: str,
     name=None,
@@ -34,7 +70,7 @@ def _aircraft_top_view_plot(
     :param width : width of the image
     :return: wing plot figure
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     # Wing parameters
     wing_kink_leading_edge_x = variables[
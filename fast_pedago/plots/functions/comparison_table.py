@@ -0,0 +1,176 @@
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+import ipywidgets as widgets
+import ipyvuetify as v
+
+from fast_pedago.utils import (
+    PathManager,
+    OUTPUT_FILE_SUFFIX,
+    _read_variables,
+)
+
+
+# Rows displayed at most, the prefix filter narrows down the others
+MAX_ROWS = 200
+
+
+@lru_cache(maxsize=64)
+def _scalar_variables(
+    output_file_path: str, modification_time: float
+) -> Tuple[pd.Series, Dict[str, str]]:
+    """
+    Reads the scalar variables of an output file. Each file is read once per
+    modification, so that the comparison only aligns cached columns.
+
+    :param output_file_path: path to the output file.
+    :param modification_time: modification time of the output file.
+    :return: the values of the scalar variables by name, and their units.
+    """
+    values = {}
+    units = {}
+    for variable in _read_variables(output_file_path):
+        try:
+            value = np.asarray(variable.value, dtype=float)
+        except (TypeError, ValueError):
+            continue
+        if value.size == 1:
+            values[variable.name] = float(value.ravel()[0])
+            units[variable.name] = variable.units or ""
+
+    return pd.Series(values, dtype=float), units
+
+
+class ComparisonTable(v.Col):
+    """
+    A table comparing the scalar variables of several aircraft, with the
+    relative deltas to a reference aircraft. Variables can be filtered by
+    the beginning of their name.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # Variables x aircraft matrix, and units of the variables
+        self._matrix = pd.DataFrame()
+        self._units = pd.Series(dtype=object)
+
+        self._prefix_field = v.TextField(
+            label="Variable name prefix",
+            placeholder="data:geometry:wing",
+            clearable=True,
+            dense=True,
+        )
+        self._prefix_field.on_event("change", lambda *args: self._show_table())
+
+        self._reference_selector = v.Select(
+            label="Reference aircraft",
+            dense=True,
+        )
+        self._reference_selector.observe(lambda change: self._show_table(), "v_model")
+
+        self._table = widgets.HTML()
+
+        self.class_ = "pa-0"
+        self.children = [
+            v.Row(
+                class_="pa-0 ma-0",
+                children=[
+                    v.Col(class_="py-0", children=[self._prefix_field]),
+                    v.Col(class_="py-0", children=[self._reference_selector]),
+                ],
+            ),
+            self._table,
+        ]
+
+    def set_aircraft(self, aircraft_names: List[str]):
+        """
+        Builds the comparison matrix of the given aircraft and shows it.
+
+        :param aircraft_names: the names of the aircraft to compare.
+        """
+        columns = {}
+        units = {}
+        for aircraft_name in aircraft_names:
+            output_file_path = Path(
+                PathManager.path_to("output", aircraft_name + OUTPUT_FILE_SUFFIX)
+            )
+            # Aircraft whose process did not write outputs are not compared
+            if not Path.exists(output_file_path):
+                continue
+            values, aircraft_units = _scalar_variables(
+                str(output_file_path), output_file_path.stat().st_mtime
+            )
+            columns[aircraft_name] = values
+            units.update(aircraft_units)
+
+        # Columns are aligned on the union of the variable names
+        self._matrix = pd.DataFrame(columns).sort_index()
+        self._units = pd.Series(units, dtype=object)
+
+        # The reference aircraft is compared against by default, and the
+        # chosen one is kept as long as it is compared
+        aircraft = list(self._matrix.columns)
+        reference = self._reference_selector.v_model
+        if reference not in aircraft:
+            if PathManager.reference_aircraft in aircraft:
+                reference = PathManager.reference_aircraft
+            elif aircraft:
+                reference = aircraft[0]
+            else:
+                reference = None
+
+        # Setting the reference shows the table when it changes
+        self._reference_selector.items = aircraft
+        if reference == self._reference_selector.v_model:
+            self._show_table()
+        else:
+            self._reference_selector.v_model = reference
+
+    def _show_table(self):
+        """
+        Shows the filtered variables, with the deltas to the reference aircraft.
+        """
+        matrix = self._matrix
+        reference = self._reference_selector.v_model
+        if matrix.empty or reference not in matrix.columns:
+            self._table.value = ""
+            return
+
+        prefix = self._prefix_field.v_model
+        if prefix:
+            matrix = matrix[matrix.index.str.startswith(prefix.strip())]
+        row_count = len(matrix)
+        matrix = matrix.iloc[:MAX_ROWS]
+
+        # A null reference value gives no delta
+        reference_values = matrix[reference].abs().replace(0.0, np.nan)
+        deltas = matrix.sub(matrix[reference], axis=0).div(reference_values, axis=0)
+
+        table = pd.DataFrame({"Units": self._units.reindex(matrix.index)})
+        for aircraft in matrix.columns:
+            table[aircraft] = matrix[aircraft].map(_format_value)
+            if aircraft != reference:
+                table["Δ " + aircraft] = (100.0 * deltas[aircraft]).map(_format_delta)
+
+        caption = ""
+        if row_count > MAX_ROWS:
+            caption = (
+                "<p>%d variables out of %d shown, filter them by the beginning "
+                "of their name.</p>" % (MAX_ROWS, row_count)
+            )
+        self._table.value = caption + table.to_html(
+            na_rep="", border=0, classes="comparison-table"
+        )
+
+
+def _format_value(value: float) -> str:
+    return "" if np.isnan(value) else "%.6g" % value
+
+
+def _format_delta(delta: float) -> str:
+    return "" if np.isnan(delta) else "%+.2f %%" % delta
@@ -0,0 +1,58 @@
+from os import PathLike
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from ..plot_constants import COLORS
+
+
+def _discipline_profile_plot(
+    profile_file_path: Union[str, PathLike],
+    name=None,
+    fig=None,
+) -> go.FigureWidget:
+    """
+    Returns a bar plot of the compute time spent in each discipline during a
+    process run with profiling enabled.
+    Different runs can be superposed by providing an existing fig.
+    Each run can be provided a name.
+
+    :param profile_file_path: path of the profile file written by the process
+        profiler
+    :param name: name to give to the trace added to the figure
+    :param fig: existing figure to which add the plot
+    :return: discipline profile figure
+    """
+    if fig is None:
+        fig = go.Figure()
+
+    # Runs without profiling have no profile file, there is nothing to add
+    if Path.exists(Path(profile_file_path)):
+        profile = pd.read_csv(profile_file_path)
+        disciplines = profile.groupby("discipline").agg({"time": "sum", "calls": "sum"})
+
+        color_index = len(fig.data) % 10
+
+        bar = go.Bar(
+            x=disciplines.index,
+            y=disciplines["time"],
+            customdata=disciplines["calls"],
+            hovertemplate="%{x}: %{y:.3f} s, %{customdata} calls",
+            name=name,
+            marker=dict(color=COLORS[color_index]),
+        )
+        fig.add_trace(bar)
+
+    fig = go.FigureWidget(fig)
+
+    fig.update_layout(
+        title_text="Compute time per discipline",
+        title_x=0.5,
+        xaxis_title="Discipline",
+        yaxis_title="Time [s]",
+        barmode="group",
+    )
+
+    return fig
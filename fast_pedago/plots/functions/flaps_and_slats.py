@@ -1,11 +1,33 @@
 import numpy as np
 import plotly.graph_objects as go
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 
 from ..plot_constants import COLORS
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:geometry:wing:kink:leading_edge:x:local",
+    "data:geometry:wing:tip:leading_edge:x:local",
+    "data:geometry:wing:root:y",
+    "data:geometry:wing:kink:y",
+    "data:geometry:wing:tip:y",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:kink:chord",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:wing:sweep_100_outer",
+    "data:geometry:slat:chord_ratio",
+    "data:geometry:slat:span_ratio",
+    "data:geometry:wing:span",
+    "data:geometry:flap:span_ratio",
+    "data:geometry:flap:chord_ratio",
+    "data:geometry:wing:MAC:length",
+    "data:geometry:wing:MAC:at25percent:x",
+    "data:geometry:wing:MAC:leading_edge:x:local",
+]
+
+
 def _flaps_and_slats_plot(
     aircraft_file_path: str,
     name=None,
@@ -28,7 +50,7 @@ def _flaps_and_slats_plot(
     :param width : width of the image
     :return: plot figure of wing the wing with flaps and slats
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     wing_kink_leading_edge_x = variables[
         "data:geometry:wing:kink:leading_edge:x:local"
@@ -0,0 +1,74 @@
+from os import PathLike
+from pathlib import Path
+from typing import Union
+
+import pandas as pd
+import plotly.graph_objects as go
+
+from ..plot_constants import COLORS
+
+
+def _pareto_front_plot(
+    pareto_file_path: Union[str, PathLike],
+    name=None,
+    fig=None,
+) -> go.FigureWidget:
+    """
+    Returns a plot of the Pareto front computed by a Pareto MDO, the two
+    objectives being the axes.
+    Different fronts can be superposed by providing an existing fig.
+    Each front can be provided a name.
+
+    :param pareto_file_path: path of the Pareto front file written by the
+        Pareto MDO
+    :param name: name to give to the trace added to the figure
+    :param fig: existing figure to which add the plot
+    :return: Pareto front figure
+    """
+    if fig is None:
+        fig = go.Figure()
+
+    x_title = "First objective [kg]"
+    y_title = "Second objective [kg]"
+
+    # Other processes have no Pareto front file, there is nothing to add
+    if Path.exists(Path(pareto_file_path)):
+        front = pd.read_csv(pareto_file_path)
+        front = front[front["feasible"]]
+
+        # The two objectives are the columns before the feasibility
+        first_objective, second_objective = front.columns[-3:-1]
+        x_title = first_objective.split(":")[-1] + " [kg]"
+        y_title = second_objective.split(":")[-1] + " [kg]"
+
+        # The optimizations stop at a tolerance, so some of their results may
+        # be dominated by others: only the non-dominated ones make the front.
+        front = front.sort_values([first_objective, second_objective])
+        best_second_objective = (
+            front[second_objective].cummin().shift(fill_value=float("inf"))
+        )
+        front = front[front[second_objective] < best_second_objective]
+
+        color_index = len(fig.data) % 10
+
+        scatter = go.Scatter(
+            x=front[first_objective],
+            y=front[second_objective],
+            customdata=front["weight"],
+            hovertemplate="%{x:.0f} kg, %{y:.0f} kg (weight %{customdata:.2f})",
+            mode="lines+markers",
+            name=name,
+            line=dict(color=COLORS[color_index]),
+        )
+        fig.add_trace(scatter)
+
+    fig = go.FigureWidget(fig)
+
+    fig.update_layout(
+        title_text="Pareto front",
+        title_x=0.5,
+        xaxis_title=x_title,
+        yaxis_title=y_title,
+    )
+
+    return fig
@@ -4,11 +4,19 @@ from typing import Union
 import numpy as np
 import plotly.graph_objects as go
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 
 from ..plot_constants import COLORS
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:aerodynamics:aircraft:cruise:CD",
+    "data:aerodynamics:aircraft:cruise:CL",
+    "data:aerodynamics:aircraft:cruise:L_D_max",
+]
+
+
 def _polar_with_L_R_ratio_plot(
     aircraft_file_path: Union[str, PathLike],
     name=None,
@@ -28,7 +36,7 @@ def _polar_with_L_R_ratio_plot(
                            default format will be assumed.
     :return: wing plot figure
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     # pylint: disable=invalid-name # that's a common naming
     cd = np.asarray(variables["data:aerodynamics:aircraft:cruise:CD"].value)
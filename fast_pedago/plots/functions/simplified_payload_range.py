@@ -6,11 +6,24 @@ import scipy.constants as sc
 
 import plotly.graph_objects as go
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 
 from ..plot_constants import COLORS
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:weight:aircraft:MTOW",
+    "data:weight:aircraft:OWE",
+    "data:weight:aircraft:MFW",
+    "data:weight:aircraft:max_payload",
+    "data:mission:sizing:needed_block_fuel",
+    "data:mission:sizing:main_route:fuel",
+    "data:TLAR:range",
+    "data:weight:aircraft:payload",
+]
+
+
 def _simplified_payload_range_plot(
     aircraft_file_path: str,
     flight_data_file_path: str,
@@ -35,7 +48,7 @@ def _simplified_payload_range_plot(
     :return: wing plot figure
     """
 
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     mtow = variables["data:weight:aircraft:MTOW"].value[0]
     owe = variables["data:weight:aircraft:OWE"].value[0]
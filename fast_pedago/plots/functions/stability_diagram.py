@@ -1,5 +1,5 @@
 import plotly.graph_objects as go
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 import numpy as np
 from stdatm import Atmosphere
 
@@ -12,6 +12,29 @@ cm0_wing = -0.2
 ths_deportation = -5 * np.pi / 180  # rad
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:aerodynamics:aircraft:cruise:CL_alpha",
+    "data:aerodynamics:aircraft:landing:CL_max_clean",
+    "data:aerodynamics:high_lift_devices:landing:CL",
+    "data:aerodynamics:horizontal_tail:cruise:CL_alpha",
+    "data:geometry:wing:MAC:length",
+    "data:geometry:horizontal_tail:MAC:length",
+    "data:geometry:wing:MAC:at25percent:x",
+    "data:geometry:horizontal_tail:MAC:at25percent:x:from_wingMAC25",
+    "data:geometry:horizontal_tail:area",
+    "data:geometry:wing:area",
+    "data:geometry:wing:aspect_ratio",
+    "data:geometry:wing:span",
+    "data:weight:aircraft:MTOW",
+    "data:geometry:fuselage:front_length",
+    "data:geometry:fuselage:length",
+    "data:geometry:fuselage:maximum_height",
+    "data:geometry:fuselage:maximum_width",
+    "data:geometry:fuselage:rear_length",
+]
+
+
 def _stability_diagram_plot(
     aircraft_file_path: str, name=None, fig=None, file_formatter=None
 ) -> go.FigureWidget:
@@ -28,7 +51,7 @@ def _stability_diagram_plot(
         default format will be assumed.
     :return: wing plot figure
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     cl_alpha_wing = variables["data:aerodynamics:aircraft:cruise:CL_alpha"].value[0]
     cl_max_clean_wing = variables[
@@ -1,11 +1,20 @@
 import numpy as np
 import plotly.graph_objects as go
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
 
 from ..plot_constants import COLORS
 
 
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:geometry:wing:thickness_ratio",
+    "data:weight:aircraft:CG:aft:MAC_position",
+    "settings:weight:aircraft:CG:range",
+    "data:handling_qualities:static_margin",
+]
+
+
 def _static_margin_plot(
     aircraft_file_path: str,
     name=None,
@@ -28,7 +37,7 @@ def _static_margin_plot(
     :param width : width of the image
     :return: plot figure of wing the wing with flaps and slats
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     mean_thickness = variables["data:geometry:wing:thickness_ratio"].value[0]
     CG_aft = variables["data:weight:aircraft:CG:aft:MAC_position"].value[0]
@@ -4,7 +4,28 @@ import plotly.graph_objects as go
 from ipywidgets import widgets
 from IPython.display import display
 
-from fastoad.io import VariableIO
+from fast_pedago.utils import _read_variables
+
+
+# Variables of the output file used by the figure
+VARIABLE_NAMES = [
+    "data:geometry:wing:kink:leading_edge:x:local",
+    "data:geometry:wing:tip:leading_edge:x:local",
+    "data:geometry:wing:root:y",
+    "data:geometry:wing:kink:y",
+    "data:geometry:wing:tip:y",
+    "data:geometry:wing:area",
+    "data:geometry:wing:root:chord",
+    "data:geometry:wing:kink:chord",
+    "data:geometry:wing:tip:chord",
+    "data:geometry:wing:sweep_100_outer",
+    "data:geometry:wing:sweep_0",
+    "data:geometry:wing:span",
+    "data:geometry:wing:MAC:length",
+    "data:geometry:wing:MAC:y",
+    "data:geometry:wing:MAC:at25percent:x",
+    "data:geometry:wing:MAC:leading_edge:x:local",
+]
 
 
 def _wing_plot(
@@ -29,7 +50,7 @@ def _wing_plot(
     :param width : width of the image
     :return: wing plot figure
     """
-    variables = VariableIO(aircraft_file_path, file_formatter).read()
+    variables = _read_variables(aircraft_file_path, file_formatter, VARIABLE_NAMES)
 
     wing_kink_leading_edge_x = variables[
         "data:geometry:wing:kink:leading_edge:x:local"
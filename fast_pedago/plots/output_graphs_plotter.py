@@ -23,7 +23,8 @@ from fast_pedago.plots import (
     aircraft_geometry_plot,
     polar_with_L_R_ratio_plot,
     static_margin_plot,
-    BetterMissionViewer,
+    discipline_profile_plot,
+    pareto_front_plot,
 )
 
 from fast_pedago.utils import (
@@ -46,6 +47,14 @@ GRAPH = {
             variable_viewer,
             True,
         ],
+        "Discipline profile": [
+            discipline_profile_plot,
+            False,
+        ],
+        "Comparison table": [
+            None,
+            False,
+        ],
     },
     "Geometry": {
         "Aircraft": [
@@ -114,6 +123,10 @@ GRAPH = {
             simplified_payload_range_plot,
             False,
         ],
+        "Pareto front": [
+            pareto_front_plot,
+            False,
+        ],
     },
 }
 
@@ -133,6 +146,9 @@ class OutputGraphsPlotter:
         self.data = []
         self.is_single_output = False
 
+        # Kept between plots for the filter and reference to be kept
+        self._comparison_table = None
+
         self._build_layout()
 
     def _build_layout(self):
@@ -217,7 +233,25 @@ class OutputGraphsPlotter:
             # Clear actual graphs :
             clear_output()
             fig: go.Figure = None
+
+            # Comparison table works differently, all aircraft are compared at
+            # once
+            if self.plot_name == "Comparison table":
+                # Imported here as pandas is heavy to import
+                from fast_pedago.plots import ComparisonTable
+
+                if self._comparison_table is None:
+                    self._comparison_table = ComparisonTable()
+                self._comparison_table.set_aircraft(
+                    [name for name in sizing_process_to_display if name]
+                )
+                display(self._comparison_table)
+                return
+
             if self.plot_name == "Mission":
+                # Imported here as FAST-OAD mission viewer is heavy to import
+                from fast_pedago.plots import BetterMissionViewer
+
                 mission_viewer = BetterMissionViewer()
 
             # Add every aircraft to the plot :
@@ -6,20 +6,16 @@ so they can be plotted using the same base function.
 
 import plotly.graph_objects as go
 
-from .functions import (
-    _aircraft_front_view_plot,
-    _aircraft_side_view_plot,
-    _aircraft_top_view_plot,
-    _flaps_and_slats_plot,
-    _polar_with_L_R_ratio_plot,
-    _simplified_payload_range_plot,
-    _stability_diagram_plot,
-    _static_margin_plot,
-    _wing_plot,
+# The plot functions are imported on first call, and so is FAST-OAD by the
+# functions that use its plots
+from . import functions
+
+from fast_pedago.utils import (
+    OUTPUT_FILE_SUFFIX,
+    PROFILE_FILE_SUFFIX,
+    PARETO_FILE_SUFFIX,
 )
 
-import fastoad.api as oad
-
 
 # TODO: Have a decorator to convert an aircraft name directly into aircraft_file_path and
 # TODO: flight_data_file_path to avoid having long signatures ?
@@ -31,7 +27,7 @@ def aircraft_front_view_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _aircraft_front_view_plot(aircraft_file_path, name, fig)
+    return functions._aircraft_front_view_plot(aircraft_file_path, name, fig)
 
 
 def aircraft_side_view_plot(
@@ -40,7 +36,7 @@ def aircraft_side_view_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _aircraft_side_view_plot(aircraft_file_path, name, fig)
+    return functions._aircraft_side_view_plot(aircraft_file_path, name, fig)
 
 
 def aircraft_top_view_plot(
@@ -49,7 +45,7 @@ def aircraft_top_view_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _aircraft_top_view_plot(aircraft_file_path, name, fig)
+    return functions._aircraft_top_view_plot(aircraft_file_path, name, fig)
 
 
 def flaps_and_slats_plot(
@@ -58,7 +54,7 @@ def flaps_and_slats_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _flaps_and_slats_plot(aircraft_file_path, name, fig)
+    return functions._flaps_and_slats_plot(aircraft_file_path, name, fig)
 
 
 def simplified_payload_range_plot(
@@ -67,7 +63,7 @@ def simplified_payload_range_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _simplified_payload_range_plot(
+    return functions._simplified_payload_range_plot(
         aircraft_file_path, flight_data_file_path, name, fig
     )
 
@@ -78,7 +74,7 @@ def stability_diagram_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _stability_diagram_plot(aircraft_file_path, name, fig)
+    return functions._stability_diagram_plot(aircraft_file_path, name, fig)
 
 
 def wing_plot(
@@ -87,7 +83,7 @@ def wing_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _wing_plot(aircraft_file_path, name, fig)
+    return functions._wing_plot(aircraft_file_path, name, fig)
 
 
 def variable_viewer(
@@ -96,6 +92,8 @@ def variable_viewer(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
+    import fastoad.api as oad
+
     return oad.variable_viewer(aircraft_file_path)
 
 
@@ -105,6 +103,8 @@ def aircraft_geometry_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
+    import fastoad.api as oad
+
     return oad.aircraft_geometry_plot(aircraft_file_path, name, fig)
 
 
@@ -114,6 +114,8 @@ def drag_polar_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
+    import fastoad.api as oad
+
     return oad.drag_polar_plot(aircraft_file_path, name, fig)
 
 
@@ -123,6 +125,8 @@ def mass_breakdown_bar_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
+    import fastoad.api as oad
+
     return oad.mass_breakdown_bar_plot(aircraft_file_path, name, fig)
 
 
@@ -132,6 +136,8 @@ def mass_breakdown_sun_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
+    import fastoad.api as oad
+
     return oad.mass_breakdown_sun_plot(aircraft_file_path)
 
 
@@ -141,6 +147,8 @@ def wing_geometry_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
+    import fastoad.api as oad
+
     return oad.wing_geometry_plot(aircraft_file_path, name, fig)
 
 
@@ -150,7 +158,7 @@ def polar_with_L_R_ratio_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _polar_with_L_R_ratio_plot(aircraft_file_path, name, fig)
+    return functions._polar_with_L_R_ratio_plot(aircraft_file_path, name, fig)
 
 
 def static_margin_plot(
@@ -159,4 +167,32 @@ def static_margin_plot(
     name: str = None,
     fig: go.Figure = None,
 ) -> go.FigureWidget:
-    return _static_margin_plot(aircraft_file_path, name, fig)
+    return functions._static_margin_plot(aircraft_file_path, name, fig)
+
+
+def discipline_profile_plot(
+    aircraft_file_path: str,
+    flight_data_file_path: str,
+    name: str = None,
+    fig: go.Figure = None,
+) -> go.FigureWidget:
+    # The profile file is written next to the output file by the process
+    # profiler
+    profile_file_path = str(aircraft_file_path).replace(
+        OUTPUT_FILE_SUFFIX, PROFILE_FILE_SUFFIX
+    )
+    return functions._discipline_profile_plot(profile_file_path, name, fig)
+
+
+def pareto_front_plot(
+    aircraft_file_path: str,
+    flight_data_file_path: str,
+    name: str = None,
+    fig: go.Figure = None,
+) -> go.FigureWidget:
+    # The Pareto front file is written next to the output file by the Pareto
+    # MDO
+    pareto_file_path = str(aircraft_file_path).replace(
+        OUTPUT_FILE_SUFFIX, PARETO_FILE_SUFFIX
+    )
+    return functions._pareto_front_plot(pareto_file_path, name, fig)
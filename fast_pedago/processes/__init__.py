@@ -1,2 +1,37 @@
+import importlib
+
 from .process_plotter import ProcessPlotter
-from .process_launcher import ProcessLauncher
+from .process_timer import ProcessTimer
+from .diagram_generator import DiagramGenerator
+from .job_server import JobServerClient, SlotScheduler, run_job_server
+
+
+# The modules that import OpenMDAO or FAST-OAD, and the MDO strategies and the
+# design of experiments that import scipy, are imported on first use, so that
+# the GUI is imported without them.
+_LAZY_MODULES = {
+    "ProcessRecorder": ".process_recorder",
+    "ResidualMonitor": ".residual_monitor",
+    "ProcessProfiler": ".process_profiler",
+    "ResultsCatalogue": ".results_catalogue",
+    "SurrogatePreview": ".surrogate_preview",
+    "DesignPointEvaluator": ".design_point_evaluator",
+    "MDOCheckpoint": ".mdo_checkpoint",
+    "EvaluationCache": ".evaluation_cache",
+    "ProcessLauncher": ".process_launcher",
+    "SurrogateOptimizer": ".surrogate_optimizer",
+    "ParallelGradientOptimizer": ".parallel_gradient_optimizer",
+    "MultiStartOptimizer": ".multi_start_optimizer",
+    "ParetoExplorer": ".pareto_explorer",
+    "DesignOfExperiments": ".design_of_experiments",
+    "generate_cases": ".design_of_experiments",
+}
+
+
+def __getattr__(name: str):
+    if name not in _LAZY_MODULES:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+    value = getattr(importlib.import_module(_LAZY_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
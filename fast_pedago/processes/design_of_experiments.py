@@ -0,0 +1,322 @@
+import csv
+import itertools
+import logging
+import os
+import tempfile
+import warnings
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import PathLike
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple, Union
+
+import numpy as np
+
+import openmdao.api as om
+
+from openmdao.solvers.solver import NonlinearSolver
+
+import fastoad.api as oad
+
+from scipy.stats import qmc
+
+from fast_pedago.utils import (
+    PathManager,
+    INPUT_FILE_SUFFIX,
+    OUTPUT_FILE_SUFFIX,
+    DOE_FILE_SUFFIX,
+)
+from .mda_inputs import (
+    MDA_INPUT_NAMES,
+    MDA_INPUT_BOUNDS,
+    INTEGER_MDA_INPUTS,
+    apply_mda_inputs,
+    get_reference_mda_inputs,
+)
+from .results_catalogue import ResultsCatalogue, CATALOGUE_OUTPUTS
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sampling methods
+FULL_FACTORIAL = "Full factorial"
+LATIN_HYPERCUBE = "Latin hypercube"
+SOBOL = "Sobol"
+DOE_METHODS = [FULL_FACTORIAL, LATIN_HYPERCUBE, SOBOL]
+
+CASE_COLUMN = "case"
+CONVERGED_COLUMN = "converged"
+
+
+def generate_cases(
+    method: str,
+    bounds: Dict[str, Tuple[float, float]],
+    samples: int,
+    seed: int = 0,
+) -> List[Dict[str, float]]:
+    """
+    Samples the space of the varied MDA inputs.
+
+    :param method: the sampling method, one of DOE_METHODS.
+    :param bounds: the (lower, upper) bounds of the varied inputs, by name.
+    :param samples: the number of cases for the Latin hypercube and Sobol
+        methods, the number of levels of each input for the full factorial.
+    :param seed: the seed of the random sampling methods. The same seed gives
+        the same cases, which is needed to resume a DOE.
+    :return: the values of the varied inputs of each case, by name.
+    """
+    names = list(bounds)
+    lower = np.array([bounds[name][0] for name in names], dtype=float)
+    upper = np.array([bounds[name][1] for name in names], dtype=float)
+
+    if method == FULL_FACTORIAL:
+        unit_samples = np.array(
+            list(itertools.product(np.linspace(0.0, 1.0, samples), repeat=len(names)))
+        )
+    elif method == LATIN_HYPERCUBE:
+        unit_samples = qmc.LatinHypercube(d=len(names), seed=seed).random(samples)
+    elif method == SOBOL:
+        # Sobol sequences are balanced for powers of 2 only, but any number
+        # of samples is allowed.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            unit_samples = qmc.Sobol(d=len(names), seed=seed).random(samples)
+    else:
+        raise ValueError("Unknown design of experiments method: " + method)
+
+    cases = []
+    for unit_sample in unit_samples:
+        values = lower + unit_sample * (upper - lower)
+        case = dict(zip(names, values.tolist()))
+        for name in INTEGER_MDA_INPUTS:
+            if name in case:
+                case[name] = int(round(case[name]))
+        cases.append(case)
+
+    return cases
+
+
+def is_solver_converged(solver: NonlinearSolver) -> bool:
+    """
+    Tells if a nonlinear solver converged in its last run, from its final
+    residual, as the solver itself does. It can converge at its last iteration.
+
+    :param solver: the solver, after it was run.
+    :return: True if the final residual is below the absolute or relative
+        tolerance of the solver.
+    """
+    norm = solver._iter_get_norm()
+    return bool(
+        norm <= solver.options["atol"] or norm <= solver.options["rtol"] * solver._norm0
+    )
+
+
+def _run_case(
+    case: int,
+    inputs: Dict[str, float],
+    source_data_file_path: Union[str, PathLike],
+    configuration_file_path: Union[str, PathLike],
+) -> Tuple[int, bool, Dict[str, float]]:
+    """
+    Runs the MDA of a case on a new problem. Made to be run in a worker
+    process.
+
+    :return: the case, whether the MDA converged, and the catalogue outputs.
+    """
+    new_inputs = oad.DataFile(source_data_file_path)
+    apply_mda_inputs(new_inputs, **inputs)
+
+    # Each case has its own input and output files, removed once read
+    with tempfile.TemporaryDirectory() as case_directory:
+        configurator = oad.FASTOADProblemConfigurator(configuration_file_path)
+        configurator.input_file_path = Path(case_directory) / (
+            "case" + INPUT_FILE_SUFFIX
+        )
+        configurator.output_file_path = Path(case_directory) / (
+            "case" + OUTPUT_FILE_SUFFIX
+        )
+        new_inputs.save_as(configurator.input_file_path, overwrite=True)
+
+        # Some FAST-OAD errors, such as missing inputs, can not be sent back
+        # from the worker process
+        try:
+            problem = configurator.get_problem(read_inputs=True)
+            problem.setup()
+        except Exception as error:
+            raise RuntimeError(str(error)) from None
+
+        solver = problem.model.nonlinear_solver
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter(action="ignore", category=FutureWarning)
+                problem.run_model()
+        except om.AnalysisError:
+            return case, False, {name: np.nan for name in CATALOGUE_OUTPUTS}
+
+        outputs = {
+            name: float(problem.get_val(variable_name, units=units)[0])
+            for name, (variable_name, units) in CATALOGUE_OUTPUTS.items()
+        }
+        is_converged = is_solver_converged(solver) and all(
+            np.isfinite(list(outputs.values()))
+        )
+
+        return case, is_converged, outputs
+
+
+class DesignOfExperiments:
+    """
+    Runs the MDA of a reference aircraft for a sample of its inputs, the other
+    inputs keeping their reference values. Cases run at the same time in
+    worker processes, and each case is appended to a .csv results file as soon
+    as it ends.
+
+    A DOE that was interrupted can be resumed: the cases already in the results
+    file are not run again.
+    """
+
+    def __init__(
+        self,
+        reference_name: str,
+        bounds: Dict[str, Tuple[float, float]],
+        method: str = LATIN_HYPERCUBE,
+        samples: int = 100,
+        results_file_path: Union[str, PathLike] = None,
+        seed: int = 0,
+        workers: int = None,
+        results_catalogue: ResultsCatalogue = None,
+        **kwargs,
+    ):
+        """
+        :param reference_name: the name of the reference aircraft.
+        :param bounds: the (lower, upper) bounds of the varied inputs, by name.
+            Use None to take the bounds of the input sliders.
+        :param method: the sampling method, one of DOE_METHODS.
+        :param samples: the number of cases, or of levels of each input for
+            the full factorial.
+        :param results_file_path: the .csv file the results are streamed to, by
+            default a file named after the reference in the outputs folder.
+        :param seed: the seed of the random sampling methods.
+        :param workers: the number of worker processes, one per core by
+            default.
+        :param results_catalogue: if given, the converged cases are also added
+            to this catalogue.
+        """
+        super().__init__(**kwargs)
+
+        self.reference_name = reference_name
+        self.source_data_file_path = PathManager.to_full_source_file_name(
+            reference_name
+        )
+        if results_file_path is None:
+            results_file_path = PathManager.path_to(
+                "output", reference_name + DOE_FILE_SUFFIX
+            )
+        self.results_file_path = Path(results_file_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.results_catalogue = results_catalogue
+
+        self.bounds = {
+            name: MDA_INPUT_BOUNDS[name] if name_bounds is None else name_bounds
+            for name, name_bounds in bounds.items()
+        }
+        self.reference_inputs = get_reference_mda_inputs(
+            oad.DataFile(self.source_data_file_path)
+        )
+        self.cases = [
+            {**self.reference_inputs, **varied_inputs}
+            for varied_inputs in generate_cases(method, self.bounds, samples, seed)
+        ]
+
+        self.columns = (
+            [CASE_COLUMN]
+            + MDA_INPUT_NAMES
+            + list(CATALOGUE_OUTPUTS)
+            + [CONVERGED_COLUMN]
+        )
+
+    def get_completed_cases(self) -> List[int]:
+        """
+        :return: the cases already in the results file. A case is only
+            considered if its inputs are the ones of the current sampling.
+        """
+        completed_cases = []
+        if not Path.exists(self.results_file_path):
+            return completed_cases
+
+        with open(self.results_file_path, newline="") as results_file:
+            for row in csv.DictReader(results_file):
+                try:
+                    case = int(row[CASE_COLUMN])
+                    inputs = [float(row[name]) for name in MDA_INPUT_NAMES]
+                except (KeyError, TypeError, ValueError):
+                    # Row of an interrupted write
+                    continue
+                if case < len(self.cases) and np.allclose(
+                    inputs, [self.cases[case][name] for name in MDA_INPUT_NAMES]
+                ):
+                    completed_cases.append(case)
+
+        return completed_cases
+
+    def run(self, case_listener: Callable[[int, Dict[str, float], bool], None] = None):
+        """
+        Runs the cases that are not in the results file yet.
+
+        :param case_listener: a function called when a case ends, with the case,
+            its outputs and whether it converged.
+        """
+        completed_cases = set(self.get_completed_cases())
+        pending_cases = [
+            case for case in range(len(self.cases)) if case not in completed_cases
+        ]
+        _LOGGER.info(
+            "Design of experiments: %d cases completed, %d to run",
+            len(completed_cases),
+            len(pending_cases),
+        )
+        if not pending_cases:
+            return
+
+        is_new_file = not Path.exists(self.results_file_path)
+        configuration_file_path = PathManager.mda_configuration_file_path
+
+        with open(
+            self.results_file_path, "a", newline=""
+        ) as results_file, ProcessPoolExecutor(max_workers=self.workers) as pool:
+            writer = csv.writer(results_file)
+            if is_new_file:
+                writer.writerow(self.columns)
+
+            futures = [
+                pool.submit(
+                    _run_case,
+                    case,
+                    {name: self.cases[case][name] for name in MDA_INPUT_NAMES},
+                    self.source_data_file_path,
+                    configuration_file_path,
+                )
+                for case in pending_cases
+            ]
+
+            for future in as_completed(futures):
+                try:
+                    case, is_converged, outputs = future.result()
+                except Exception as error:
+                    _LOGGER.warning("A design of experiments case failed: %s", error)
+                    continue
+
+                inputs = self.cases[case]
+                writer.writerow(
+                    [case]
+                    + [inputs[name] for name in MDA_INPUT_NAMES]
+                    + [outputs[name] for name in CATALOGUE_OUTPUTS]
+                    + [is_converged]
+                )
+                # Streamed: the case is in the file even if the DOE dies
+                results_file.flush()
+
+                if is_converged and self.results_catalogue is not None:
+                    self.results_catalogue.add(self.reference_name, inputs, outputs)
+                if case_listener is not None:
+                    case_listener(case, outputs, is_converged)
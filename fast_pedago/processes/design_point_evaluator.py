@@ -0,0 +1,200 @@
+import warnings
+
+from os import PathLike
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import openmdao.api as om
+
+import fastoad.api as oad
+
+
+# Constraint violation below which a design point is considered feasible
+FEASIBILITY_TOLERANCE = 1e-6
+
+
+class DesignPointEvaluator:
+    """
+    Evaluates the objective and constraints of an MDO problem at given values of
+    its design variables, by running the MDA of the problem. It lets the MDO
+    strategies other than the OpenMDAO driver use the sizing process.
+
+    The design variables, objective and constraints are described by the
+    dictionaries given to add_design_var, add_objective and add_constraint.
+    """
+
+    def __init__(
+        self,
+        problem: om.Problem,
+        design_variables: List[dict],
+        objective: dict,
+        constraints: List[dict],
+        **kwargs,
+    ):
+        """
+        :param problem: the set up MDO problem.
+        :param design_variables: the design variables of the problem.
+        :param objective: the objective of the problem.
+        :param constraints: the constraints of the problem.
+        """
+        super().__init__(**kwargs)
+
+        self.problem = problem
+        self.design_variables = design_variables
+        self.objective = objective
+        self.constraints = constraints
+
+        # Number of MDA run so far
+        self.evaluations = 0
+
+    @staticmethod
+    def from_configuration(
+        configuration_file_path: Union[str, PathLike],
+        input_file_path: Union[str, PathLike],
+        design_variables: List[dict],
+        objective: dict,
+        constraints: List[dict],
+        settings: Dict[str, float] = None,
+        output_directory_path: Union[str, PathLike] = None,
+    ) -> "DesignPointEvaluator":
+        """
+        Builds an evaluator with its own problem, made to evaluate design points
+        in an other process than the one of the main problem.
+
+        :param configuration_file_path: the MDO configuration file.
+        :param input_file_path: the input file of the main problem.
+        :param design_variables: the design variables of the problem.
+        :param objective: the objective of the problem.
+        :param constraints: the constraints of the problem.
+        :param settings: values to set in the problem after its setup.
+        :param output_directory_path: if given, the files written by the model,
+            such as the flight points, are written in this directory instead,
+            for problems running at the same time not to write the same files.
+        :return: the evaluator of the new problem.
+        """
+        configurator = oad.FASTOADProblemConfigurator(configuration_file_path)
+        configurator.input_file_path = input_file_path
+        problem = configurator.get_problem(read_inputs=True)
+
+        problem.model.add_objective(**objective)
+        for design_variable in design_variables:
+            problem.model.add_design_var(**design_variable)
+        for constraint in constraints:
+            problem.model.add_constraint(**constraint)
+        problem.model.approx_totals()
+        problem.setup()
+
+        # The options of the FAST-OAD models are only set by their setup
+        if output_directory_path is not None:
+            for system in problem.model.system_iter(recurse=True):
+                if "out_file" in system.options and system.options["out_file"]:
+                    system.options["out_file"] = str(
+                        Path(output_directory_path)
+                        / Path(system.options["out_file"]).name
+                    )
+
+        for name, value in (settings or {}).items():
+            problem.set_val(name=name, val=value)
+
+        return DesignPointEvaluator(problem, design_variables, objective, constraints)
+
+    @property
+    def lower_bounds(self) -> np.ndarray:
+        return np.array([variable["lower"] for variable in self.design_variables])
+
+    @property
+    def upper_bounds(self) -> np.ndarray:
+        return np.array([variable["upper"] for variable in self.design_variables])
+
+    def get_design_point(self) -> np.ndarray:
+        """
+        :return: the current values of the design variables in the problem.
+        """
+        return np.array(
+            [
+                self.problem.get_val(
+                    variable["name"], units=variable.get("units")
+                ).item()
+                for variable in self.design_variables
+            ]
+        )
+
+    def set_design_point(self, design_point: np.ndarray):
+        """
+        :param design_point: the values of the design variables to set in the
+            problem.
+        """
+        for variable, value in zip(self.design_variables, design_point):
+            self.problem.set_val(variable["name"], value, units=variable.get("units"))
+
+    def evaluate(self, design_point: np.ndarray) -> Optional[Tuple[float, np.ndarray]]:
+        """
+        Runs the MDA at a design point.
+
+        :param design_point: the values of the design variables.
+        :return: the scaled objective and the constraint margins (negative
+            when a bound is violated), or None if the MDA failed.
+        """
+        self.set_design_point(design_point)
+
+        self.evaluations += 1
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter(action="ignore", category=FutureWarning)
+                self.problem.run_model()
+        except om.AnalysisError:
+            return None
+
+        return self.get_result()
+
+    def get_result(self) -> Tuple[float, np.ndarray]:
+        """
+        :return: the scaled objective and the constraint margins of the last
+            run of the problem.
+        """
+        return self.get_objective(self.objective), self.get_constraint_margins()
+
+    def get_objective(self, objective: dict) -> float:
+        """
+        :param objective: an objective, as given to add_objective. It can be an
+            other one than the objective of the problem.
+        :return: the scaled value of the objective in the last run of the
+            problem.
+        """
+        return self.problem.get_val(
+            objective["name"], units=objective.get("units")
+        ).item() * objective.get("scaler", 1.0)
+
+    def get_constraint_margins(self) -> np.ndarray:
+        """
+        :return: the distance of each constraint to its bounds, negative when
+            a bound is violated.
+        """
+        margins = []
+        for constraint in self.constraints:
+            value = self.problem.get_val(
+                constraint["name"], units=constraint.get("units")
+            ).item()
+            margin = np.inf
+            if constraint.get("lower") is not None:
+                margin = min(margin, value - constraint["lower"])
+            if constraint.get("upper") is not None:
+                margin = min(margin, constraint["upper"] - value)
+            margins.append(margin)
+
+        return np.array(margins)
+
+    @staticmethod
+    def rank(objective: float, margins: np.ndarray) -> Tuple[float, float]:
+        """
+        Gives a key to sort results from the best to the worst: feasible results
+        by objective first, then the other ones by constraint violation.
+
+        :param objective: the objective of the result.
+        :param margins: the constraint margins of the result.
+        :return: the sorting key of the result.
+        """
+        violation = float(np.sum(np.maximum(-margins, 0.0)))
+        return max(violation, FEASIBILITY_TOLERANCE), objective
@@ -0,0 +1,132 @@
+import hashlib
+import logging
+import os
+
+from importlib.metadata import version, PackageNotFoundError
+from os import PathLike
+from pathlib import Path
+from threading import Lock, Thread
+from typing import Dict, Set, Union
+
+from fast_pedago.utils import PathManager, DIAGRAMS_DIRECTORY
+
+
+_LOGGER = logging.getLogger(__name__)
+
+N2 = "n2"
+XDSM = "xdsm"
+
+# Generations running in this process, by diagram file, for each one to be
+# generated once even if several widgets ask for it, and the ones that failed,
+# not to try them again
+_running_generations: Dict[Path, Thread] = {}
+_failed_generations: Set[Path] = set()
+_generations_lock = Lock()
+
+
+class DiagramGenerator:
+    """
+    Generates the interactive N2 and XDSM diagrams of a configuration file.
+
+    Diagrams are generated in a background thread the first time they are asked
+    for, and cached on disk for all the sessions, named after a hash of the
+    configuration file and of the FAST-OAD version. Until a diagram is
+    generated, or if it can't be, the diagram shipped with the app is used.
+
+    The XDSM is generated by the WhatsOpt server, to which the configuration
+    is sent: it must only be asked for on an explicit action of the user.
+    """
+
+    def __init__(
+        self,
+        configuration_file_path: Union[str, PathLike],
+        default_file_paths: Dict[str, Union[str, PathLike]],
+        **kwargs,
+    ):
+        """
+        :param configuration_file_path: the configuration file to draw the
+            diagrams of.
+        :param default_file_paths: the .html files used until the diagrams are
+            generated, by diagram (N2 or XDSM).
+        """
+        super().__init__(**kwargs)
+
+        self.configuration_file_path = Path(configuration_file_path)
+        self.default_file_paths = {
+            diagram: Path(file_path)
+            for diagram, file_path in default_file_paths.items()
+        }
+
+        content_hash = hashlib.sha256(self.configuration_file_path.read_bytes())
+        # The diagrams also depend on the models of the installed FAST-OAD
+        try:
+            content_hash.update(version("fast-oad-core").encode())
+        except PackageNotFoundError:
+            pass
+
+        self.file_paths = {
+            diagram: PathManager.cache_directory_path
+            / DIAGRAMS_DIRECTORY
+            / (content_hash.hexdigest() + "_" + diagram + ".html")
+            for diagram in (N2, XDSM)
+        }
+
+    def get_file_path(self, diagram: str) -> Path:
+        """
+        :param diagram: N2 or XDSM.
+        :return: the generated diagram if it is, else the default one.
+        """
+        if Path.exists(self.file_paths[diagram]):
+            return self.file_paths[diagram]
+        return self.default_file_paths[diagram]
+
+    def request(self, diagram: str):
+        """
+        Starts the generation of a diagram in a background thread, if it is
+        not generated nor being generated. Asking for the XDSM sends the
+        configuration to the WhatsOpt server.
+
+        :param diagram: N2 or XDSM.
+        """
+        file_path = self.file_paths[diagram]
+        if Path.exists(file_path):
+            return
+
+        with _generations_lock:
+            if file_path in _running_generations or file_path in _failed_generations:
+                return
+            thread = Thread(target=self._generate, args=(diagram,), daemon=True)
+            _running_generations[file_path] = thread
+            thread.start()
+
+    def _generate(self, diagram: str):
+        file_path = self.file_paths[diagram]
+        # Written then renamed, so that other sessions never read a partial file
+        temporary_file_path = file_path.with_name(
+            file_path.name + "." + str(os.getpid()) + ".html"
+        )
+
+        try:
+            # Imported here as FAST-OAD is heavy to import
+            import fastoad.api as oad
+
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            if diagram == N2:
+                oad.write_n2(
+                    self.configuration_file_path, temporary_file_path, overwrite=True
+                )
+            else:
+                oad.write_xdsm(
+                    self.configuration_file_path, temporary_file_path, overwrite=True
+                )
+            os.replace(temporary_file_path, file_path)
+        except Exception as error:
+            # The default diagram keeps being used
+            _LOGGER.warning("Could not generate the %s diagram: %s", diagram, error)
+            if Path.exists(temporary_file_path):
+                Path.unlink(temporary_file_path)
+            with _generations_lock:
+                _failed_generations.add(file_path)
+        finally:
+            with _generations_lock:
+                _running_generations.pop(file_path, None)
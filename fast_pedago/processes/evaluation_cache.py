@@ -0,0 +1,134 @@
+import logging
+import sqlite3
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from os import PathLike
+from typing import Dict, Union
+
+import numpy as np
+
+import openmdao.api as om
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default maximum number of evaluations kept in the cache
+CACHE_SIZE = 128
+
+# Decimals the design variables are rounded to. It must stay well below the
+# finite difference steps for perturbed points to be different entries.
+KEY_DECIMALS = 9
+
+# Table of the recorder database the cache statistics are written in
+CACHE_TABLE = "evaluation_cache"
+
+
+class EvaluationCache:
+    """
+    Memoizes the model evaluations of an MDO problem by design point. When an
+    optimizer comes back to a design point it has already evaluated, the
+    outputs of the model are restored instead of running the MDA again.
+
+    The least recently used evaluations are dropped when the cache is full.
+    """
+
+    def __init__(self, max_size: int = CACHE_SIZE, **kwargs):
+        """
+        :param max_size: the maximum number of evaluations kept.
+        """
+        super().__init__(**kwargs)
+
+        self.max_size = max_size
+        self.is_enabled = True
+
+        self.hits = 0
+        self.misses = 0
+        # True if the outputs of the model were restored at the last
+        # evaluation, files written by the model during the run (such as the
+        # flight points) may then be the ones of an other design point.
+        self.is_last_evaluation_cached = False
+
+        self._entries: Dict[tuple, np.ndarray] = OrderedDict()
+
+    def install(self, problem: om.Problem):
+        """
+        Makes the model of the set up problem use the cache.
+
+        :param problem: the set up MDO problem, before it is run.
+        """
+        driver = problem.driver
+        model = problem.model
+
+        run_solve_nonlinear = model.run_solve_nonlinear
+
+        def cached_run_solve_nonlinear():
+            if not self.is_enabled:
+                self.is_last_evaluation_cached = False
+                return run_solve_nonlinear()
+
+            key = self._key(driver.get_design_var_values(driver_scaling=False))
+            outputs = self._entries.get(key)
+
+            if outputs is not None:
+                self._entries.move_to_end(key)
+                model._outputs.set_val(outputs)
+                self.hits += 1
+                self.is_last_evaluation_cached = True
+                return
+
+            run_solve_nonlinear()
+            self.misses += 1
+            self.is_last_evaluation_cached = False
+
+            self._entries[key] = model._outputs.asarray(copy=True)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        model.run_solve_nonlinear = cached_run_solve_nonlinear
+
+    @contextmanager
+    def disabled(self):
+        """
+        Context manager in which the model is always evaluated.
+        """
+        self.is_enabled = False
+        try:
+            yield
+        finally:
+            self.is_enabled = True
+
+    def write(self, recorder_database_file_path: Union[str, PathLike]):
+        """
+        Writes the hit and miss counts in the recorder database of the run, once
+        the recorder is shut down, and logs them.
+
+        :param recorder_database_file_path: the recorder database of the run.
+        """
+        _LOGGER.info("Evaluation cache: %d hits, %d misses", self.hits, self.misses)
+
+        connection = sqlite3.connect(str(recorder_database_file_path))
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS "
+                    + CACHE_TABLE
+                    + " (hits INT, misses INT, max_size INT)"
+                )
+                connection.execute(
+                    "INSERT INTO " + CACHE_TABLE + " VALUES (?, ?, ?)",
+                    (self.hits, self.misses, self.max_size),
+                )
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _key(design_variables: Dict[str, np.ndarray]) -> tuple:
+        return tuple(
+            np.round(
+                np.concatenate(
+                    [np.atleast_1d(value) for value in design_variables.values()]
+                ),
+                KEY_DECIMALS,
+            )
+        )
@@ -0,0 +1,317 @@
+"""
+A local job server shared by all the application kernels of a machine, that
+limits the number of processes (MDA/MDO) computing at the same time.
+
+Each Voila kernel runs its own process, so without it, a whole class launching
+sizings at once means as many CPU-bound kernels fighting for the cores. The
+server grants a fixed number of slots, sized to the machine, and serves the
+waiting sessions in turn so that one session can't monopolize the slots.
+"""
+
+import logging
+import os
+
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from multiprocessing import Queue
+from multiprocessing.managers import BaseManager
+from threading import Condition, Event, Thread
+from time import monotonic
+from typing import Iterable, Iterator, List, Optional
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Environment variables used to give the job server address and authentication
+# key to the kernels.
+JOB_SERVER_ADDRESS_ENV = "FAST_PEDAGO_JOB_SERVER_ADDRESS"
+JOB_SERVER_AUTHKEY_ENV = "FAST_PEDAGO_JOB_SERVER_AUTHKEY"
+
+# A slot is leased for this duration (in s), and its lease is renewed by the
+# heartbeat of the client that holds it. A slot whose client died (kernel
+# culled or crashed, even while waiting for the slot) is granted again once
+# its lease expires.
+SLOT_LEASE_DURATION = 30.0
+
+# Period (in s) at which clients renew the leases of their slots
+HEARTBEAT_PERIOD = 10.0
+
+# Period (in s) at which waiting sessions check for expired slots.
+WAIT_PERIOD = 5.0
+
+
+class _JobServerManager(BaseManager):
+    pass
+
+
+class SlotScheduler:
+    """
+    Grants a fixed number of slots to the sessions that request them. When all
+    slots are taken, requests are queued per session, and freed slots are
+    given to the waiting sessions in turn (round robin).
+
+    Slots are leased: a slot whose lease is not renewed is considered lost and
+    is granted again.
+    """
+
+    def __init__(self, slots: int, **kwargs):
+        """
+        :param slots: the number of processes allowed to run at the same time.
+        """
+        super().__init__(**kwargs)
+
+        self._slots = max(1, slots)
+        self._condition = Condition()
+        self._last_ticket = 0
+
+        # Granted tickets and the time their lease expires at
+        self._granted = {}
+        # Waiting tickets of each session, sessions being ordered by turn
+        self._waiting = OrderedDict()
+
+    def acquire(self, session_id: str) -> int:
+        """
+        Waits for a slot to be granted to the session.
+
+        :param session_id: identifier of the session requesting a slot.
+        :return: the ticket of the granted slot, to release it afterwards.
+        """
+        with self._condition:
+            self._last_ticket += 1
+            ticket = self._last_ticket
+            self._waiting.setdefault(session_id, deque()).append(ticket)
+
+            # The ticket may already have expired when the thread wakes up, if
+            # the client died while waiting
+            self._dispatch()
+            while ticket in self._waiting.get(session_id, ()):
+                self._condition.wait(WAIT_PERIOD)
+                self._dispatch()
+
+            return ticket
+
+    def acquire_free(self, count: int) -> List[int]:
+        """
+        Grants up to a number of slots among the free ones, without waiting.
+        Slots are only granted if no session waits for one, so that they do
+        not delay the other sessions.
+
+        :param count: the maximum number of slots to grant.
+        :return: the tickets of the granted slots, to release them afterwards.
+        """
+        with self._condition:
+            self._dispatch()
+
+            tickets = []
+            expiry_time = monotonic() + SLOT_LEASE_DURATION
+            while (
+                not self._waiting
+                and len(self._granted) < self._slots
+                and len(tickets) < count
+            ):
+                self._last_ticket += 1
+                self._granted[self._last_ticket] = expiry_time
+                tickets.append(self._last_ticket)
+
+            return tickets
+
+    def renew(self, tickets: Iterable[int]) -> bool:
+        """
+        Renews the leases of granted slots.
+
+        :param tickets: the tickets of the slots.
+        :return: False if a slot was lost, its lease having expired.
+        """
+        with self._condition:
+            expiry_time = monotonic() + SLOT_LEASE_DURATION
+            is_renewed = True
+            for ticket in tickets:
+                if ticket in self._granted:
+                    self._granted[ticket] = expiry_time
+                else:
+                    is_renewed = False
+            return is_renewed
+
+    def release(self, ticket: int):
+        """
+        Releases a granted slot.
+
+        :param ticket: the ticket returned when the slot was acquired.
+        """
+        with self._condition:
+            self._granted.pop(ticket, None)
+            self._dispatch()
+
+    def status(self) -> dict:
+        """
+        :return: the number of slots, of running and of waiting processes.
+        """
+        with self._condition:
+            return {
+                "slots": self._slots,
+                "running": len(self._granted),
+                "waiting": sum(len(tickets) for tickets in self._waiting.values()),
+            }
+
+    def _dispatch(self):
+        """
+        Grants the free slots to the waiting sessions, each session in turn.
+        Must be called with the condition acquired.
+        """
+        now = monotonic()
+        for ticket, expiry_time in list(self._granted.items()):
+            if now > expiry_time:
+                _LOGGER.warning("Slot %d expired, it is granted again", ticket)
+                del self._granted[ticket]
+
+        is_granted = False
+        while self._waiting and len(self._granted) < self._slots:
+            session_id, tickets = self._waiting.popitem(last=False)
+            self._granted[tickets.popleft()] = now + SLOT_LEASE_DURATION
+            is_granted = True
+
+            # The session goes back at the end of the line if it still waits
+            if tickets:
+                self._waiting[session_id] = tickets
+
+        if is_granted:
+            self._condition.notify_all()
+
+
+def run_job_server(slots: int, authkey: bytes, address_queue: Queue = None):
+    """
+    Runs the job server until the process is killed. Made to be the target of a
+    dedicated process.
+
+    :param slots: the number of processes allowed to run at the same time.
+    :param authkey: the authentication key the kernels must provide.
+    :param address_queue: a queue to send the address of the server in, once
+        it listens.
+    """
+    scheduler = SlotScheduler(slots)
+    _JobServerManager.register("scheduler", callable=lambda: scheduler)
+
+    # Port 0 lets the system choose a free port
+    manager = _JobServerManager(address=("127.0.0.1", 0), authkey=authkey)
+    server = manager.get_server()
+
+    if address_queue is not None:
+        address_queue.put(server.address)
+
+    _LOGGER.info("Job server listening on %s:%d with %d slots", *server.address, slots)
+    server.serve_forever()
+
+
+class JobServerClient:
+    """
+    Connection of a session to the job server.
+    """
+
+    def __init__(self, address: tuple, authkey: bytes, **kwargs):
+        """
+        :param address: the (host, port) address of the job server.
+        :param authkey: the authentication key of the job server.
+        """
+        super().__init__(**kwargs)
+
+        _JobServerManager.register("scheduler")
+        manager = _JobServerManager(address=address, authkey=authkey)
+        manager.connect()
+        self._scheduler = manager.scheduler()
+
+    @contextmanager
+    def slot(self, session_id: str):
+        """
+        Context manager that waits for a slot, renews its lease while it is
+        held, and releases it when exiting.
+
+        :param session_id: identifier of the session requesting a slot.
+        """
+        ticket = self._scheduler.acquire(session_id)
+        try:
+            with self._heartbeat([ticket]):
+                yield
+        finally:
+            self._scheduler.release(ticket)
+
+    @contextmanager
+    def extra_slots(self, count: int) -> Iterator[int]:
+        """
+        Context manager that leases up to a number of slots among the free ones,
+        for a session that holds a slot to run more processes. It does not
+        wait for the slots, and releases them when exiting.
+
+        :param count: the maximum number of slots to lease.
+        :return: the number of leased slots.
+        """
+        tickets = self._scheduler.acquire_free(count) if count > 0 else []
+        try:
+            with self._heartbeat(tickets):
+                yield len(tickets)
+        finally:
+            for ticket in tickets:
+                self._scheduler.release(ticket)
+
+    @contextmanager
+    def _heartbeat(self, tickets: List[int]):
+        """
+        Context manager that renews the leases of slots in a thread, so that
+        they are kept as long as this client lives.
+
+        :param tickets: the tickets of the slots.
+        """
+        if not tickets:
+            yield
+            return
+
+        stopped = Event()
+
+        def renew():
+            while not stopped.wait(HEARTBEAT_PERIOD):
+                try:
+                    is_renewed = self._scheduler.renew(tickets)
+                except (OSError, EOFError) as error:
+                    _LOGGER.warning("Could not renew the slot leases: %s", error)
+                    continue
+                if not is_renewed:
+                    _LOGGER.warning("A slot lease expired before it was renewed")
+
+        heartbeat = Thread(target=renew, daemon=True)
+        heartbeat.start()
+        try:
+            yield
+        finally:
+            stopped.set()
+            heartbeat.join()
+
+    def status(self) -> dict:
+        """
+        :return: the number of slots, of running and of waiting processes.
+        """
+        return self._scheduler.status()
+
+    @staticmethod
+    def from_environment() -> Optional["JobServerClient"]:
+        """
+        Connects to the job server given by the environment variables, if
+        any.
+
+        :return: the client, or None if there is no job server or it can't be
+            reached.
+        """
+        address = os.environ.get(JOB_SERVER_ADDRESS_ENV)
+        authkey = os.environ.get(JOB_SERVER_AUTHKEY_ENV)
+        if not address or not authkey:
+            return None
+
+        host, port = address.rsplit(":", 1)
+        try:
+            return JobServerClient((host, int(port)), authkey.encode())
+        except (OSError, EOFError) as error:
+            _LOGGER.warning(
+                "Could not connect to the job server at %s, processes will "
+                "run without it: %s",
+                address,
+                error,
+            )
+            return None
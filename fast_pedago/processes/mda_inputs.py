@@ -0,0 +1,142 @@
+"""
+The inputs of the MDA, as set by the user, and their conversion to and from a
+FAST-OAD input file.
+"""
+
+from typing import TYPE_CHECKING, Dict
+
+import numpy as np
+
+# FAST-OAD is heavy to import and only needed here for the annotations, this
+# module being imported by the GUI for the names and bounds of the inputs
+if TYPE_CHECKING:
+    import fastoad.api as oad
+
+
+# Names of the MDA inputs, as given to ProcessLauncher.set_mda_inputs
+MDA_INPUT_NAMES = [
+    "n_pax",
+    "v_app",
+    "cruise_mach",
+    "range",
+    "payload",
+    "max_payload",
+    "wing_aspect_ratio",
+    "bypass_ratio",
+]
+
+# Bounds of the MDA inputs, the ones of the input sliders. Units are the ones of
+# set_mda_inputs.
+MDA_INPUT_BOUNDS = {
+    "n_pax": (20, 400),
+    "v_app": (45, 170),
+    "cruise_mach": (0.0, 1.0),
+    "range": (0, 10000),
+    "payload": (0, 100000),
+    "max_payload": (0, 100000),
+    "wing_aspect_ratio": (4, 25),
+    "bypass_ratio": (2, 15),
+}
+
+# Inputs that can only take integer values
+INTEGER_MDA_INPUTS = ["n_pax"]
+
+
+def get_reference_mda_inputs(reference_inputs: "oad.DataFile") -> Dict[str, float]:
+    """
+    Reads the MDA inputs of a reference aircraft.
+
+    :param reference_inputs: the source data file of the reference aircraft.
+    :return: the MDA inputs, by name.
+    """
+    # Imported here as OpenMDAO is heavy to import
+    import openmdao.api as om
+
+    n_pax = reference_inputs["data:TLAR:NPAX"].value[0]
+    v_app = om.convert_units(
+        reference_inputs["data:TLAR:approach_speed"].value[0],
+        reference_inputs["data:TLAR:approach_speed"].units,
+        "kn",
+    )
+    cruise_mach = reference_inputs["data:TLAR:cruise_mach"].value[0]
+    range = om.convert_units(
+        reference_inputs["data:TLAR:range"].value[0],
+        reference_inputs["data:TLAR:range"].units,
+        "NM",
+    )
+    payload = om.convert_units(
+        reference_inputs["data:weight:aircraft:payload"].value[0],
+        reference_inputs["data:weight:aircraft:payload"].units,
+        "kg",
+    )
+    max_payload = om.convert_units(
+        reference_inputs["data:weight:aircraft:max_payload"].value[0],
+        reference_inputs["data:weight:aircraft:max_payload"].units,
+        "kg",
+    )
+    wing_aspect_ratio = reference_inputs["data:geometry:wing:aspect_ratio"].value[0]
+    bypass_ratio = reference_inputs["data:propulsion:rubber_engine:bypass_ratio"]
+    bypass_ratio = bypass_ratio.value[0]
+
+    return dict(
+        n_pax=n_pax,
+        v_app=v_app,
+        cruise_mach=cruise_mach,
+        range=range,
+        payload=payload,
+        max_payload=max_payload,
+        wing_aspect_ratio=wing_aspect_ratio,
+        bypass_ratio=bypass_ratio,
+    )
+
+
+def apply_mda_inputs(
+    reference_inputs: "oad.DataFile",
+    n_pax: int,
+    v_app: float,
+    cruise_mach: float,
+    range: float,
+    payload: float,
+    max_payload: float,
+    wing_aspect_ratio: float,
+    bypass_ratio: float,
+):
+    """
+    Sets the MDA inputs in a copy of the source data file of a reference
+    aircraft.
+
+    :param reference_inputs: the source data file to modify, it must be a copy
+        of the one of the reference.
+    """
+    # No need to provide list or numpy array for scalar values.
+    reference_inputs["data:TLAR:NPAX"].value = n_pax
+
+    reference_inputs["data:TLAR:approach_speed"].value = v_app
+    # Unit from the widget
+    reference_inputs["data:TLAR:approach_speed"].units = "kn"
+
+    # If the Mach get too high and because we originally didn't plan on
+    # changing sweep, the compressibility drag might get too high causing
+    # the code to not converge ! We will thus adapt the sweep based on the
+    # mach number with a message to let the student know about it. We'll
+    # keep the product M_cr * cos(phi_25) constant at the value obtain with
+    # M_cr = 0.78 and phi_25 = 24.54 deg
+    if cruise_mach > 0.78:
+        cos_phi_25 = 0.78 / cruise_mach * np.cos(np.deg2rad(24.54))
+        phi_25 = np.arccos(cos_phi_25)
+        reference_inputs["data:geometry:wing:sweep_25"].value = phi_25
+        reference_inputs["data:geometry:wing:sweep_25"].units = "rad"
+
+    reference_inputs["data:TLAR:cruise_mach"].value = cruise_mach
+
+    reference_inputs["data:TLAR:range"].value = range
+    reference_inputs["data:TLAR:range"].units = "NM"
+
+    reference_inputs["data:weight:aircraft:payload"].value = payload
+    reference_inputs["data:weight:aircraft:payload"].units = "kg"
+    reference_inputs["data:weight:aircraft:max_payload"].value = max_payload
+    reference_inputs["data:weight:aircraft:max_payload"].units = "kg"
+
+    reference_inputs["data:geometry:wing:aspect_ratio"].value = wing_aspect_ratio
+
+    reference_inputs["data:propulsion:rubber_engine:bypass_ratio"].value = bypass_ratio
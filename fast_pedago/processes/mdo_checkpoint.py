@@ -0,0 +1,183 @@
+import hashlib
+import logging
+import sqlite3
+
+from os import PathLike
+from pathlib import Path
+from typing import Dict, Union
+
+import numpy as np
+
+import openmdao.api as om
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Decimals the design variables are rounded to when looking for a recorded
+# evaluation.
+KEY_DECIMALS = 10
+
+# Table of the recorder database the hash of the input file of the MDO is
+# written in
+INPUT_FILE_TABLE = "mdo_input_file"
+
+
+def get_input_file_hash(input_file_path: Union[str, PathLike]) -> str:
+    """
+    :param input_file_path: the input file of an MDO.
+    :return: the hash of the content of the input file.
+    """
+    return hashlib.sha256(Path(input_file_path).read_bytes()).hexdigest()
+
+
+class MDOCheckpoint:
+    """
+    Uses the recorder database of an interrupted MDO as a checkpoint to resume
+    it.
+
+    The driver is run again from the same starting point, but the model
+    evaluations recorded for a design point are replayed from the recorder
+    instead of being computed. As the optimizer is deterministic, it follows
+    its previous path almost instantly, and only computes the evaluations
+    after the interruption. For the evaluations to be replayed, the driver
+    must record all the outputs of the model, and the hash of the input file
+    must be written in the recorder database with write_input_file_hash.
+    """
+
+    def __init__(self, recorder_database_file_path: Union[str, PathLike], **kwargs):
+        """
+        :param recorder_database_file_path: the recorder database of the
+            interrupted MDO. It is read at once, so it can then be deleted.
+        """
+        super().__init__(**kwargs)
+
+        # Recorded outputs, by design point
+        self.cases: Dict[tuple, Dict[str, np.ndarray]] = {}
+        self.design_variable_names = []
+        self.objective_names = []
+        self.input_file_hash = None
+
+        # Number of evaluations replayed
+        self.replayed = 0
+
+        if Path.exists(Path(recorder_database_file_path)):
+            try:
+                self._read(recorder_database_file_path)
+            except (sqlite3.Error, RuntimeError, ValueError, KeyError) as error:
+                _LOGGER.warning("Could not read the MDO checkpoint: %s", error)
+                self.cases = {}
+
+    @staticmethod
+    def write_input_file_hash(
+        recorder_database_file_path: Union[str, PathLike],
+        input_file_path: Union[str, PathLike],
+    ):
+        """
+        Writes the hash of the input file of the MDO in its recorder database,
+        once the recorder is started, for the MDO to only be resumed with the
+        same inputs.
+
+        :param recorder_database_file_path: the recorder database of the MDO.
+        :param input_file_path: the input file of the MDO.
+        """
+        connection = sqlite3.connect(str(recorder_database_file_path))
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS " + INPUT_FILE_TABLE + " (hash TEXT)"
+                )
+                connection.execute(
+                    "INSERT INTO " + INPUT_FILE_TABLE + " VALUES (?)",
+                    (get_input_file_hash(input_file_path),),
+                )
+        finally:
+            connection.close()
+
+    def _read(self, recorder_database_file_path: Union[str, PathLike]):
+        # The table is missing if the MDO was not recorded to be resumed
+        connection = sqlite3.connect(str(recorder_database_file_path))
+        try:
+            row = connection.execute("SELECT hash FROM " + INPUT_FILE_TABLE).fetchone()
+        finally:
+            connection.close()
+        self.input_file_hash = row[0] if row else None
+
+        reader = om.CaseReader(str(recorder_database_file_path))
+
+        for case_id in reader.list_cases("driver", recurse=False, out_stream=None):
+            case = reader.get_case(case_id)
+            design_variables = case.get_design_vars(scaled=False)
+            if not self.design_variable_names:
+                self.design_variable_names = sorted(design_variables)
+                self.objective_names = sorted(case.get_objectives(scaled=False))
+
+            self.cases[self._key(design_variables)] = {
+                name: value for name, value in case.outputs.items()
+            }
+
+    def install(
+        self, problem: om.Problem, input_file_path: Union[str, PathLike]
+    ) -> bool:
+        """
+        Makes the set up MDO problem replay the recorded evaluations. The
+        checkpoint is only used if it has the same design variables and
+        objective as the problem, and was recorded with the same input file.
+
+        :param problem: the MDO problem, after its final setup and before it
+            is run.
+        :param input_file_path: the input file the problem was read from.
+        :return: True if evaluations will be replayed.
+        """
+        if not self.cases:
+            return False
+
+        if self.input_file_hash != get_input_file_hash(input_file_path):
+            _LOGGER.warning(
+                "The MDO checkpoint was recorded with other inputs, it is not used"
+            )
+            return False
+
+        driver = problem.driver
+        model = problem.model
+
+        if self.design_variable_names != sorted(
+            model.get_design_vars()
+        ) or self.objective_names != sorted(model.get_objectives()):
+            _LOGGER.warning(
+                "The MDO checkpoint does not match the problem, it is not used"
+            )
+            return False
+
+        run_solve_nonlinear = model.run_solve_nonlinear
+
+        def replay_or_run_solve_nonlinear():
+            outputs = self.cases.get(
+                self._key(driver.get_design_var_values(driver_scaling=False))
+            )
+            if outputs is None:
+                return run_solve_nonlinear()
+
+            for name, value in outputs.items():
+                try:
+                    problem.set_val(name, value)
+                except KeyError:
+                    continue
+            self.replayed += 1
+
+        model.run_solve_nonlinear = replay_or_run_solve_nonlinear
+
+        _LOGGER.info("Resuming MDO with %d recorded evaluations", len(self.cases))
+        return True
+
+    def _key(self, design_variables: Dict[str, np.ndarray]) -> tuple:
+        return tuple(
+            np.round(
+                np.concatenate(
+                    [
+                        np.atleast_1d(design_variables[name])
+                        for name in self.design_variable_names
+                    ]
+                ),
+                KEY_DECIMALS,
+            )
+        )
@@ -0,0 +1,239 @@
+import logging
+import os
+import tempfile
+import warnings
+
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import ExitStack
+from multiprocessing import Manager
+from os import PathLike
+from pathlib import Path
+from queue import Empty, Queue
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+import openmdao.api as om
+
+from scipy.stats import qmc
+
+from .design_point_evaluator import DesignPointEvaluator
+from .process_recorder import ProcessRecorder
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default maximum number of optimizations run from different starting points
+MAX_STARTS = 4
+
+# Seed of the sampling of the starting points, for a launch to give the same
+# results when run again
+SEED = 0
+
+# Period (in s) at which the points published by the optimizations are
+# forwarded to the plotting queue.
+FORWARD_PERIOD = 0.1
+
+
+class _StartQueue:
+    """
+    Tags the (iteration, value) points published by the recorder of an
+    optimization with the index of its starting point.
+    """
+
+    def __init__(self, point_queue: Queue, start_index: int, **kwargs):
+        super().__init__(**kwargs)
+
+        self.point_queue = point_queue
+        self.start_index = start_index
+
+    def put(self, point: tuple):
+        self.point_queue.put(point + (self.start_index,))
+
+
+def _optimize_from_start(
+    start_index: int,
+    start_point: np.ndarray,
+    point_queue: Queue,
+    output_directory_path: Union[str, PathLike],
+    *configuration,
+) -> Optional[Tuple[np.ndarray, float, np.ndarray]]:
+    """
+    Runs the driver of a new MDO problem from a starting point. Made to be run
+    in a worker process.
+
+    :param output_directory_path: the directory the files of the model are
+        written in.
+    :return: the design point reached, its objective and constraint margins,
+        or None if the optimization failed.
+    """
+    evaluator = DesignPointEvaluator.from_configuration(
+        *configuration, output_directory_path=output_directory_path
+    )
+    driver = evaluator.problem.driver
+    driver.add_recorder(ProcessRecorder(_StartQueue(point_queue, start_index)))
+    driver.recording_options["record_objectives"] = True
+
+    evaluator.set_design_point(start_point)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter(action="ignore", category=FutureWarning)
+            evaluator.problem.run_driver()
+    except om.AnalysisError:
+        return None
+
+    return (evaluator.get_design_point(),) + evaluator.get_result()
+
+
+class MultiStartOptimizer:
+    """
+    Runs the driver of an MDO problem from several starting points at the same
+    time, in worker processes that each have their own copy of the problem.
+    The first starting point is the current design point of the problem, so
+    that it does at least as well as a single optimization, the other ones are
+    spread in the design space by a Latin hypercube sampling. As the optimizer
+    of the course is a local one, it gives a better chance to find the global
+    optimum, for the wall time of one optimization on a multi-core server.
+    """
+
+    def __init__(
+        self,
+        evaluator: DesignPointEvaluator,
+        configuration_file_path: Union[str, PathLike],
+        input_file_path: Union[str, PathLike],
+        settings: Dict[str, float] = None,
+        point_queue: Queue = None,
+        starts: int = None,
+        workers: int = None,
+        seed: int = SEED,
+        **kwargs,
+    ):
+        """
+        :param evaluator: the evaluator running the MDA of the main problem.
+        :param configuration_file_path: the MDO configuration file, to build
+            the problems of the workers.
+        :param input_file_path: the input file of the main problem.
+        :param settings: values set in the main problem after its setup.
+        :param point_queue: queue in which (iteration, objective, start)
+            points are published for each iteration of each optimization.
+        :param starts: the number of starting points, by default one per core
+            up to MAX_STARTS.
+        :param workers: the number of worker processes, by default one per
+            starting point.
+        :param seed: the seed of the sampling of the starting points.
+        """
+        super().__init__(**kwargs)
+
+        self.evaluator = evaluator
+        self.point_queue = point_queue
+        self.starts = int(starts or min(MAX_STARTS, os.cpu_count() or 1))
+        self.workers = workers or self.starts
+        self.seed = seed
+
+        self._configuration = (
+            configuration_file_path,
+            input_file_path,
+            evaluator.design_variables,
+            evaluator.objective,
+            evaluator.constraints,
+            settings,
+        )
+
+        # Results of each optimization, by starting point index
+        self.results: Dict[int, Tuple[np.ndarray, float, np.ndarray]] = {}
+
+    def get_starting_points(self) -> List[np.ndarray]:
+        """
+        :return: the current design point of the problem, then starting points
+            spread inside the bounds of the design variables.
+        """
+        lower_bounds = self.evaluator.lower_bounds
+        # Equal bounds are not allowed by qmc.scale
+        upper_bounds = np.maximum(self.evaluator.upper_bounds, lower_bounds + 1e-12)
+
+        current_point = np.clip(
+            self.evaluator.get_design_point(), lower_bounds, upper_bounds
+        )
+        if self.starts <= 1:
+            return [current_point]
+
+        sampler = qmc.LatinHypercube(d=len(lower_bounds), seed=self.seed)
+        return [current_point] + list(
+            qmc.scale(sampler.random(self.starts - 1), lower_bounds, upper_bounds)
+        )
+
+    def optimize(self) -> Optional[np.ndarray]:
+        """
+        Runs the optimizations. The main problem is left evaluated at the best
+        design point found.
+
+        :return: the best design point, or None if all optimizations failed.
+        """
+        with ExitStack() as stack:
+            # Each optimization writes the files of its model in its own
+            # directory
+            output_directory = stack.enter_context(tempfile.TemporaryDirectory())
+            worker_queue = stack.enter_context(Manager()).Queue()
+            pool = stack.enter_context(ProcessPoolExecutor(max_workers=self.workers))
+            futures = {
+                pool.submit(
+                    _optimize_from_start,
+                    start_index,
+                    start_point,
+                    worker_queue,
+                    Path(output_directory) / str(start_index),
+                    *self._configuration,
+                ): start_index
+                for start_index, start_point in enumerate(self.get_starting_points())
+            }
+
+            pending = set(futures)
+            while pending:
+                _, pending = wait(
+                    pending, timeout=FORWARD_PERIOD, return_when=FIRST_COMPLETED
+                )
+                self._forward_points(worker_queue)
+            self._forward_points(worker_queue)
+
+            for future, start_index in futures.items():
+                try:
+                    result = future.result()
+                except Exception as error:
+                    _LOGGER.warning("Optimization %d failed: %s", start_index, error)
+                    continue
+                if result is not None:
+                    self.results[start_index] = result
+
+        if not self.results:
+            _LOGGER.warning("Multi-start optimization failed: no optimization ended")
+            return None
+
+        best = min(
+            self.results,
+            key=lambda start_index: DesignPointEvaluator.rank(
+                *self.results[start_index][1:]
+            ),
+        )
+        _LOGGER.info(
+            "Multi-start optimization: best objective %f reached from start %d",
+            self.results[best][1],
+            best,
+        )
+
+        # Leave the main problem at the optimum for outputs to be written
+        best_design_point = self.results[best][0]
+        self.evaluator.evaluate(best_design_point)
+
+        return best_design_point
+
+    def _forward_points(self, worker_queue: Queue):
+        """
+        Forwards the points published by the workers to the plotting queue.
+        """
+        while True:
+            try:
+                point = worker_queue.get_nowait()
+            except Empty:
+                return
+            if self.point_queue is not None:
+                self.point_queue.put(point)
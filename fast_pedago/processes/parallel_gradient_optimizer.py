@@ -0,0 +1,279 @@
+import logging
+import os
+import tempfile
+import warnings
+
+from concurrent.futures import ProcessPoolExecutor
+from os import PathLike
+from pathlib import Path
+from queue import Queue
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from scipy.optimize import minimize
+
+from .design_point_evaluator import DesignPointEvaluator
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Finite difference step, in fraction of the design variable ranges. It is
+# kept large compared to the MDA convergence tolerance for the differences to
+# be meaningful.
+FINITE_DIFFERENCE_STEP = 1e-2
+
+# Default stopping tolerance on the objective and maximum number of iterations
+# of the optimizer
+TOLERANCE = 1e-2
+MAX_ITERATIONS = 50
+
+# Evaluator of the worker processes, each one has its own problem
+_worker_evaluator: Optional[DesignPointEvaluator] = None
+
+
+def _initialize_worker(output_directory_path: Union[str, PathLike], *configuration):
+    global _worker_evaluator
+    # Each worker writes the files of its model in its own directory
+    _worker_evaluator = DesignPointEvaluator.from_configuration(
+        *configuration,
+        output_directory_path=Path(output_directory_path) / str(os.getpid()),
+    )
+
+
+def _evaluate_in_worker(design_point: np.ndarray):
+    return _worker_evaluator.evaluate(design_point)
+
+
+class _EvaluationError(Exception):
+    pass
+
+
+class ParallelGradientOptimizer:
+    """
+    Optimizes an MDO problem with the SLSQP gradient-based optimizer, the
+    gradients being approximated by finite differences. A design point and its
+    perturbed points are run at the same time, in worker processes that each
+    have their own copy of the problem, so that a point and its gradient cost a
+    single MDA of wall time whatever the number of design variables.
+    """
+
+    def __init__(
+        self,
+        evaluator: DesignPointEvaluator,
+        configuration_file_path: Union[str, PathLike],
+        input_file_path: Union[str, PathLike],
+        settings: Dict[str, float] = None,
+        point_queue: Queue = None,
+        tolerance: float = TOLERANCE,
+        max_iterations: int = MAX_ITERATIONS,
+        workers: int = None,
+        **kwargs,
+    ):
+        """
+        :param evaluator: the evaluator running the MDA of the main problem.
+        :param configuration_file_path: the MDO configuration file, to build
+            the problems of the workers.
+        :param input_file_path: the input file of the main problem.
+        :param settings: values set in the main problem after its setup.
+        :param point_queue: queue in which (iteration, objective) points are
+            published for each design point of the optimizer.
+        :param tolerance: the stopping tolerance on the objective.
+        :param max_iterations: the maximum number of iterations.
+        :param workers: the number of worker processes, by default one per
+            design variable plus one for the design point, up to the number of
+            cores.
+        """
+        super().__init__(**kwargs)
+
+        self.evaluator = evaluator
+        self.point_queue = point_queue
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.workers = workers or min(
+            len(evaluator.design_variables) + 1, os.cpu_count() or 1
+        )
+
+        self._worker_arguments = (
+            configuration_file_path,
+            input_file_path,
+            evaluator.design_variables,
+            evaluator.objective,
+            evaluator.constraints,
+            settings,
+        )
+
+        # A design variable with equal bounds is kept from dividing by zero
+        self._lower = evaluator.lower_bounds
+        self._range = evaluator.upper_bounds - self._lower
+        self._range[self._range <= 0.0] = 1.0
+
+        # Results and gradients by normalized design point
+        self._results: Dict[tuple, Tuple[float, np.ndarray]] = {}
+        self._gradients: Dict[tuple, Tuple[np.ndarray, np.ndarray]] = {}
+        self._pool = None
+
+        self.iterations = 0
+
+    def optimize(self) -> Optional[np.ndarray]:
+        """
+        Runs the optimization from the current design point of the problem.
+        The problem is left evaluated at the best point found.
+
+        :return: the best design point, or None if no MDA succeeded.
+        """
+        start = np.clip(self._normalize(self.evaluator.get_design_point()), 0.0, 1.0)
+        variable_count = len(start)
+
+        constraints = []
+        if len(self.evaluator.constraints):
+            constraints.append(
+                {
+                    "type": "ineq",
+                    "fun": lambda point: self._evaluate(point)[1],
+                    "jac": lambda point: self._gradient(point)[1],
+                }
+            )
+
+        with tempfile.TemporaryDirectory() as output_directory, ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_initialize_worker,
+            initargs=(output_directory,) + self._worker_arguments,
+        ) as self._pool:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    result = minimize(
+                        lambda point: self._evaluate(point)[0],
+                        start,
+                        jac=lambda point: self._gradient(point)[0],
+                        method="SLSQP",
+                        bounds=[(0.0, 1.0)] * variable_count,
+                        constraints=constraints,
+                        options={
+                            "ftol": self.tolerance,
+                            "maxiter": self.max_iterations,
+                        },
+                    )
+                self.iterations = result.nit
+                _LOGGER.info("Parallel gradient optimization: %s", result.message)
+            except _EvaluationError:
+                _LOGGER.warning("Parallel gradient optimization stopped: an MDA failed")
+        self._pool = None
+
+        if not self._results:
+            return None
+
+        best = min(
+            self._results,
+            key=lambda point: DesignPointEvaluator.rank(*self._results[point]),
+        )
+
+        # Leave the problem at the optimum for outputs to be written, the MDA
+        # of the design points having been run by the workers
+        self.evaluator.evaluate(self._denormalize(np.array(best)))
+
+        return self._denormalize(np.array(best))
+
+    def _evaluate(self, point: np.ndarray) -> Tuple[float, np.ndarray]:
+        """
+        Runs the MDA at a normalized design point, if not already done. Its
+        gradients are computed at the same time, as the optimizer asks for
+        them at most of the points it evaluates.
+
+        :return: the objective and the constraint margins.
+        """
+        key = tuple(point)
+        if key not in self._results:
+            self._run(point)
+
+        return self._results[key]
+
+    def _gradient(self, point: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximates the gradients at a normalized design point by finite
+        differences, if not already done.
+
+        :return: the gradient of the objective and the jacobian of the
+            constraint margins.
+        """
+        key = tuple(point)
+        if key not in self._gradients:
+            self._run(point)
+
+        return self._gradients[key]
+
+    def _run(self, point: np.ndarray):
+        """
+        Runs the MDA at a normalized design point and at its perturbed points,
+        each one in a worker. A perturbed point whose MDA fails is run again on
+        the other side of the design point, and if it fails again, the
+        corresponding gradient components are taken as zero.
+        """
+        key = tuple(point)
+        unit_vectors = np.eye(len(point))
+
+        # The design point is submitted first, for its MDA to start first
+        design_point_future = None
+        if key not in self._results:
+            design_point_future = self._pool.submit(
+                _evaluate_in_worker, self._denormalize(point)
+            )
+
+        # Backward differences at the upper bounds
+        steps = np.where(
+            point + FINITE_DIFFERENCE_STEP <= 1.0,
+            FINITE_DIFFERENCE_STEP,
+            -FINITE_DIFFERENCE_STEP,
+        )
+        perturbed_futures = [
+            self._pool.submit(
+                _evaluate_in_worker, self._denormalize(point + step * unit_vector)
+            )
+            for step, unit_vector in zip(steps, unit_vectors)
+        ]
+
+        if design_point_future is not None:
+            result = design_point_future.result()
+            if result is None:
+                for perturbed_future in perturbed_futures:
+                    perturbed_future.cancel()
+                raise _EvaluationError()
+
+            self._results[key] = result
+            if self.point_queue is not None:
+                self.point_queue.put((len(self._results), result[0]))
+        objective, margins = self._results[key]
+
+        results = [future.result() for future in perturbed_futures]
+        retried_futures = {
+            index: self._pool.submit(
+                _evaluate_in_worker,
+                self._denormalize(point - steps[index] * unit_vectors[index]),
+            )
+            for index, result in enumerate(results)
+            if result is None and 0.0 <= point[index] - steps[index] <= 1.0
+        }
+        for index, future in retried_futures.items():
+            steps[index] = -steps[index]
+            results[index] = future.result()
+
+        objective_gradient = np.zeros(len(point))
+        margins_jacobian = np.zeros((len(margins), len(point)))
+        for index, (result, step) in enumerate(zip(results, steps)):
+            if result is None:
+                _LOGGER.warning(
+                    "The MDA failed on both sides of %s, its gradient is taken as zero",
+                    self.evaluator.design_variables[index]["name"],
+                )
+                continue
+            objective_gradient[index] = (result[0] - objective) / step
+            margins_jacobian[:, index] = (result[1] - margins) / step
+
+        self._gradients[key] = (objective_gradient, margins_jacobian)
+
+    def _normalize(self, design_point: np.ndarray) -> np.ndarray:
+        return (design_point - self._lower) / self._range
+
+    def _denormalize(self, point: np.ndarray) -> np.ndarray:
+        return self._lower + point * self._range
@@ -0,0 +1,285 @@
+import csv
+import logging
+import os
+import tempfile
+import warnings
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from os import PathLike
+from pathlib import Path
+from queue import Queue
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from scipy.optimize import minimize
+
+from .design_point_evaluator import DesignPointEvaluator, FEASIBILITY_TOLERANCE
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Default number of points of the front, including the optimum of each
+# objective
+PARETO_POINTS = 5
+
+# Initial step of the optimizer, in fraction of the design variable ranges
+INITIAL_STEP = 0.2
+
+# Default stopping tolerance and maximum number of iterations of the
+# optimizer of each point
+TOLERANCE = 1e-2
+MAX_ITERATIONS = 100
+
+WEIGHT_COLUMN = "weight"
+FEASIBLE_COLUMN = "feasible"
+
+
+class _EvaluationError(Exception):
+    pass
+
+
+def _optimize_weighted_sum(
+    weight: float,
+    start_point: np.ndarray,
+    references: Tuple[float, float],
+    second_objective: dict,
+    tolerance: float,
+    output_directory_path: Union[str, PathLike],
+    *configuration,
+) -> Tuple[np.ndarray, float, float, np.ndarray]:
+    """
+    Minimizes a weighted sum of the two objectives of the front, on a new MDO
+    problem. Made to be run in a worker process.
+
+    :param weight: the weight of the first objective, the second one has the
+        complementary weight.
+    :param start_point: the starting design point.
+    :param references: values the objectives are divided by, so that they have
+        comparable magnitudes.
+    :param second_objective: the second objective, the first one being the
+        objective of the problem.
+    :param tolerance: the stopping tolerance of the optimizer.
+    :param output_directory_path: the directory the files of the model are
+        written in.
+    :return: the best design point, its two objectives and constraint margins.
+    """
+    evaluator = DesignPointEvaluator.from_configuration(
+        *configuration, output_directory_path=output_directory_path
+    )
+    lower = evaluator.lower_bounds
+    span = evaluator.upper_bounds - lower
+    span[span <= 0.0] = 1.0
+
+    # Evaluations by normalized design point, as the optimizer asks for the
+    # objective and the constraints separately.
+    evaluations: Dict[tuple, Tuple[np.ndarray, float, float, np.ndarray]] = {}
+
+    def evaluate(point):
+        key = tuple(point)
+        if key not in evaluations:
+            design_point = lower + np.clip(point, 0.0, 1.0) * span
+            result = evaluator.evaluate(design_point)
+            if result is None:
+                raise _EvaluationError()
+            first, margins = result
+            second = evaluator.get_objective(second_objective)
+            evaluations[key] = (design_point, first, second, margins)
+        return evaluations[key]
+
+    def weighted_sum(first, second):
+        return weight * first / references[0] + (1.0 - weight) * second / references[1]
+
+    constraints = [
+        {"type": "ineq", "fun": lambda point: evaluate(point)[3]},
+        # Bounds of the design variables
+        {"type": "ineq", "fun": lambda point: point},
+        {"type": "ineq", "fun": lambda point: 1.0 - point},
+    ]
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            minimize(
+                lambda point: weighted_sum(*evaluate(point)[1:3]),
+                (start_point - lower) / span,
+                method="COBYLA",
+                constraints=constraints,
+                options={
+                    "rhobeg": INITIAL_STEP,
+                    "tol": tolerance,
+                    "maxiter": MAX_ITERATIONS,
+                },
+            )
+    except _EvaluationError:
+        _LOGGER.warning("Pareto point of weight %f stopped: an MDA failed", weight)
+
+    if not evaluations:
+        raise _EvaluationError()
+
+    return min(
+        evaluations.values(),
+        key=lambda result: DesignPointEvaluator.rank(
+            weighted_sum(*result[1:3]), result[3]
+        ),
+    )
+
+
+class ParetoExplorer:
+    """
+    Computes the Pareto front of an MDO problem between its objective and a
+    second one. Each point of the front minimizes a weighted sum of the two
+    objectives, and all the points are optimized at the same time in worker
+    processes that each have their own copy of the problem.
+
+    The points are written in a .csv file, with the weight, the design variables,
+    the two objectives (unscaled) and the feasibility of each point.
+    """
+
+    def __init__(
+        self,
+        evaluator: DesignPointEvaluator,
+        second_objective: dict,
+        configuration_file_path: Union[str, PathLike],
+        input_file_path: Union[str, PathLike],
+        settings: Dict[str, float] = None,
+        point_queue: Queue = None,
+        pareto_file_path: Union[str, PathLike] = None,
+        points: int = PARETO_POINTS,
+        tolerance: float = TOLERANCE,
+        workers: int = None,
+        **kwargs,
+    ):
+        """
+        :param evaluator: the evaluator running the MDA of the main problem.
+        :param second_objective: the second objective of the front, as given to
+            add_objective.
+        :param configuration_file_path: the MDO configuration file, to build
+            the problems of the workers.
+        :param input_file_path: the input file of the main problem.
+        :param settings: values set in the main problem after its setup.
+        :param point_queue: queue in which (point, objective) points are
+            published for each point of the front once computed.
+        :param pareto_file_path: the .csv file to write the front in.
+        :param points: the number of points of the front.
+        :param tolerance: the stopping tolerance of the optimizer.
+        :param workers: the number of worker processes, by default one per
+            point up to the number of cores.
+        """
+        super().__init__(**kwargs)
+
+        self.evaluator = evaluator
+        self.second_objective = second_objective
+        self.point_queue = point_queue
+        self.pareto_file_path = pareto_file_path
+        self.points = max(2, points)
+        self.tolerance = tolerance
+        self.workers = workers or min(self.points, os.cpu_count() or 1)
+
+        self._configuration = (
+            configuration_file_path,
+            input_file_path,
+            evaluator.design_variables,
+            evaluator.objective,
+            evaluator.constraints,
+            settings,
+        )
+
+        # Points of the front as (weight, design point, first objective,
+        # second objective, constraint margins)
+        self.front: List[Tuple[float, np.ndarray, float, float, np.ndarray]] = []
+
+    def optimize(self) -> Optional[np.ndarray]:
+        """
+        Computes the front. The main problem is left evaluated at the point that
+        balances best the two objectives.
+
+        :return: the design point balancing best the two objectives, or None if
+            no point of the front could be computed.
+        """
+        start_point = self.evaluator.get_design_point()
+        result = self.evaluator.evaluate(start_point)
+        if result is None:
+            _LOGGER.warning("Pareto front failed: the MDA of the start point failed")
+            return None
+
+        references = (
+            abs(result[0]) or 1.0,
+            abs(self.evaluator.get_objective(self.second_objective)) or 1.0,
+        )
+
+        # Each point writes the files of its model in its own directory
+        with tempfile.TemporaryDirectory() as output_directory, ProcessPoolExecutor(
+            max_workers=self.workers
+        ) as pool:
+            futures = {
+                pool.submit(
+                    _optimize_weighted_sum,
+                    weight,
+                    start_point,
+                    references,
+                    self.second_objective,
+                    self.tolerance,
+                    Path(output_directory) / str(index),
+                    *self._configuration,
+                ): weight
+                for index, weight in enumerate(np.linspace(1.0, 0.0, self.points))
+            }
+
+            for future in as_completed(futures):
+                try:
+                    self.front.append((futures[future],) + future.result())
+                except Exception as error:
+                    _LOGGER.warning(
+                        "Pareto point of weight %f failed: %s", futures[future], error
+                    )
+                    continue
+
+                if self.point_queue is not None:
+                    self.point_queue.put((len(self.front), self.front[-1][2]))
+
+        if not self.front:
+            return None
+
+        self.front.sort(key=lambda point: point[0], reverse=True)
+        if self.pareto_file_path is not None:
+            self.write(self.pareto_file_path)
+
+        # Leave the main problem at the most balanced point of the front for
+        # outputs to be written
+        balanced = min(
+            self.front,
+            key=lambda point: DesignPointEvaluator.rank(
+                point[2] / references[0] + point[3] / references[1], point[4]
+            ),
+        )
+        self.evaluator.evaluate(balanced[1])
+
+        return balanced[1]
+
+    def write(self, pareto_file_path: Union[str, PathLike]):
+        """
+        Writes the front in a .csv file, the objectives being unscaled.
+
+        :param pareto_file_path: the path of the file to write.
+        """
+        objectives = [self.evaluator.objective, self.second_objective]
+
+        with open(pareto_file_path, "w", newline="") as pareto_file:
+            writer = csv.writer(pareto_file)
+            writer.writerow(
+                [WEIGHT_COLUMN]
+                + [variable["name"] for variable in self.evaluator.design_variables]
+                + [objective["name"] for objective in objectives]
+                + [FEASIBLE_COLUMN]
+            )
+            for weight, design_point, first, second, margins in self.front:
+                writer.writerow(
+                    [weight]
+                    + list(design_point)
+                    + [
+                        value / objective.get("scaler", 1.0)
+                        for value, objective in zip((first, second), objectives)
+                    ]
+                    + [bool(np.all(margins >= -FEASIBILITY_TOLERANCE))]
+                )
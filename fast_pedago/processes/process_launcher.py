@@ -1,21 +1,36 @@
+import os
 from pathlib import Path
 import re
+import uuid
 
 import numpy as np
 
-from threading import Thread, Event
-from time import sleep
+from contextlib import ExitStack
+from queue import Queue
+from threading import Thread
 
 import copy
 import warnings
 
+from typing import Callable, Dict, Optional
+
 import openmdao.api as om
 
 import fastoad.api as oad
-
-from . import ProcessPlotter
+from fastoad.openmdao.variables import VariableList
+
+from . import (
+    JobServerClient,
+    ResultsCatalogue,
+    ProcessPlotter,
+    ProcessRecorder,
+    ResidualMonitor,
+    ProcessTimer,
+    ProcessProfiler,
+)
 from fast_pedago.utils import (
     _extract_residuals,
+    _write_variables,
     PathManager,
     MDA_FILE_SUFFIX,
     MDO_FILE_SUFFIX,
@@ -23,9 +38,75 @@ from fast_pedago.utils import (
     OUTPUT_FILE_SUFFIX,
     FLIGHT_DATA_FILE_SUFFIX,
     RECORDER_FILE_SUFFIX,
+    TIMINGS_FILE_SUFFIX,
+    PROFILE_FILE_SUFFIX,
+    PARETO_FILE_SUFFIX,
     DEFAULT_PROCESS_NAME,
+    MDA,
+    MDO,
     SEPARATOR,
+    RESULTS_CATALOGUE_FILE,
 )
+from .results_catalogue import CATALOGUE_OUTPUTS
+from .mda_inputs import MDA_INPUT_NAMES, apply_mda_inputs, get_reference_mda_inputs
+from .design_point_evaluator import DesignPointEvaluator
+from .mdo_checkpoint import MDOCheckpoint
+from .evaluation_cache import EvaluationCache
+from .residual_monitor import MDAAbortedError
+from .process_timer import TIMINGS_FILE_ENV
+from .recording_profiles import (
+    MINIMAL_PROFILE,
+    RECORDING_PROFILES,
+    RECORDING_PROFILE_ENV,
+    get_driver_recording_options,
+    get_solver_recording_options,
+)
+
+
+# MDO strategies: the OpenMDAO driver of the configuration, the trust-region
+# optimization on a surrogate of the MDA, a gradient-based optimization with
+# finite differences computed in parallel processes, or the driver run from
+# several starting points in parallel processes, or the Pareto front between
+# the objective and a second one computed in parallel processes.
+DRIVER_STRATEGY = "Optimizer"
+SURROGATE_STRATEGY = "Surrogate"
+PARALLEL_GRADIENT_STRATEGY = "Parallel gradients"
+MULTI_START_STRATEGY = "Multi-start"
+PARETO_STRATEGY = "Pareto front"
+MDO_STRATEGIES = [
+    DRIVER_STRATEGY,
+    SURROGATE_STRATEGY,
+    PARALLEL_GRADIENT_STRATEGY,
+    MULTI_START_STRATEGY,
+    PARETO_STRATEGY,
+]
+
+# Solvers of the MDA coupling: the Gauss-Seidel solver of the configuration,
+# the same with Aitken relaxation, or a Newton solver whose linear systems are
+# solved by a Krylov method.
+GAUSS_SEIDEL_SOLVER = "Gauss-Seidel"
+AITKEN_SOLVER = "Gauss-Seidel with Aitken"
+NEWTON_KRYLOV_SOLVER = "Newton-Krylov"
+MDA_SOLVERS = [GAUSS_SEIDEL_SOLVER, AITKEN_SOLVER, NEWTON_KRYLOV_SOLVER]
+
+# Newton iterations are much more expensive but much fewer than the Gauss-Seidel
+# ones
+NEWTON_MAX_ITERATIONS = 20
+
+# Coupled variables whose values are plotted at each MDA iteration, as (name,
+# units) by label
+TRACKED_VARIABLES = {
+    "MTOW": ("data:weight:aircraft:MTOW", "kg"),
+    "Wing area": ("data:geometry:wing:area", "m**2"),
+    "Block fuel": ("data:mission:sizing:block_fuel", "kg"),
+}
+
+# Mission coefficients the MDO is run with
+MDO_MISSION_SETTINGS = {
+    "settings:mission:sizing:breguet:climb:mass_ratio": 0.975,
+    "settings:mission:sizing:breguet:descent:mass_ratio": 0.993,
+    "settings:mission:sizing:breguet:reserve:mass_ratio": 0.055,
+}
 
 
 class ProcessLauncher:
@@ -43,6 +124,46 @@ class ProcessLauncher:
         self.process_name = DEFAULT_PROCESS_NAME
         self.plotter = plotter
 
+        # If True, the timings of each phase of the launch are also written
+        # as JSON lines in a file next to the recorder. Set when the app is run
+        # with the --timings option.
+        self.is_timings_file_written = os.environ.get(TIMINGS_FILE_ENV) == "1"
+
+        # If True, the compute time and calls of each component are recorded
+        # during the run and written in a profile file next to the outputs. Set
+        # with the inputs of the process.
+        self.is_profiled = False
+
+        # When the app is served with a job server, processes wait for a
+        # slot of the server before running. The session id identifies this
+        # launcher's requests to serve sessions in turn.
+        self.session_id = uuid.uuid4().hex
+        self.job_server = JobServerClient.from_environment()
+
+        # Converged MDA are published in the results catalogue and to the
+        # listeners (such as the surrogate preview).
+        self.results_catalogue = ResultsCatalogue(
+            PathManager.path_to("work", RESULTS_CATALOGUE_FILE)
+        )
+        self._result_listeners = []
+
+        # Watches the residuals of the MDA being run
+        self.residual_monitor = None
+
+        self.mda_solver = GAUSS_SEIDEL_SOLVER
+
+        # Variables plotted at each MDA iteration along the residuals, none
+        # if empty
+        self.tracked_variables = dict(TRACKED_VARIABLES)
+
+        # What the recorders write in the recorder file, one of
+        # RECORDING_PROFILES. The minimal profile is all the app needs, an
+        # other one is set when the app is run with the --recording-profile
+        # option.
+        self.recording_profile = os.environ.get(RECORDING_PROFILE_ENV, MINIMAL_PROFILE)
+        if self.recording_profile not in RECORDING_PROFILES:
+            self.recording_profile = MINIMAL_PROFILE
+
     def launch_processes(self, is_MDO: bool = False):
         """
         Launches the chosen process (MDA or MDO), and launches
@@ -52,41 +173,56 @@ class ProcessLauncher:
         :param is_MDO: defines if the process is MDO or MDA
             to launch the correct process
         """
-        # Initialize event to synchronize the process thread and the plotting
-        # thread
-        process_ended = Event()
+        # Initialize the queue in which the process thread publishes its
+        # progress for the plotting thread
+        self.point_queue = Queue()
 
-        self._configure_paths(is_MDO)
+        self.timer = ProcessTimer(self.process_name, MDO if is_MDO else MDA)
 
-        # If the switch is off, MDA, else MDO
-        if is_MDO:
-            self._configure_mdo()
-        else:
-            self._configure_mda()
+        with ExitStack() as stack:
+            # The slot is held from the problem setup to the end of the run
+            if self.job_server is not None:
+                with self.timer.phase("wait_for_slot"):
+                    stack.enter_context(self.job_server.slot(self.session_id))
 
-        process_thread = Thread(
-            target=self._run_problem,
-            args=(is_MDO,),
-        )
-        plotting_thread = Thread(
-            target=self.plotter.plot,
-            args=(
-                process_ended,
-                self.recorder_database_file_path,
-                is_MDO,
-                self.process_name,
-            ),
-        )
+            with self.timer.phase("configure_paths"):
+                self._configure_paths(is_MDO)
+
+            # If the switch is off, MDA, else MDO
+            if is_MDO:
+                self._configure_mdo()
+            else:
+                self._configure_mda()
+
+            process_thread = Thread(
+                target=self._run_problem,
+                args=(is_MDO,),
+            )
+            plotting_thread = Thread(
+                target=self.plotter.plot,
+                args=(
+                    self.point_queue,
+                    is_MDO,
+                    self.process_name,
+                    self.problem.model.nonlinear_solver.options["rtol"],
+                ),
+            )
 
-        process_thread.start()
-        plotting_thread.start()
+            process_thread.start()
+            plotting_thread.start()
 
-        process_thread.join()
-        # This line is to make sure the plotting ends after the process and
-        # plots everything
-        sleep(1)
-        process_ended.set()
-        plotting_thread.join()
+            process_thread.join()
+            # All the points have been published when the process ends, this
+            # tells the plotting thread to stop once it has plotted them.
+            self.point_queue.put(None)
+            plotting_thread.join()
+
+        if not is_MDO and self.get_MDA_success():
+            self._publish_results()
+
+        self.timer.total()
+        if self.is_timings_file_written:
+            self.timer.write(self.timings_file_path)
 
     def _configure_paths(self, is_MDO: bool = False):
         """
@@ -127,10 +263,34 @@ class ProcessLauncher:
             "output", self.process_name + problem_type + RECORDER_FILE_SUFFIX
         )
 
+        # An interrupted MDO is resumed from its recorder, read before the
+        # file is deleted.
+        self.mdo_checkpoint = None
+        if is_MDO and self.is_mdo_resumed and self.mdo_strategy == DRIVER_STRATEGY:
+            self.mdo_checkpoint = MDOCheckpoint(self.recorder_database_file_path)
+
         # To avoid reading in a wrong file
         if Path.exists(self.recorder_database_file_path):
             Path.unlink(self.recorder_database_file_path)
 
+        self.timings_file_path = PathManager.path_to(
+            "output", self.process_name + problem_type + TIMINGS_FILE_SUFFIX
+        )
+
+        # A profile from a previous run would not match the new results
+        self.profile_file_path = PathManager.path_to(
+            "output", self.process_name + problem_type + PROFILE_FILE_SUFFIX
+        )
+        if Path.exists(self.profile_file_path):
+            Path.unlink(self.profile_file_path)
+
+        # Same for the Pareto front, only written by the Pareto MDO strategy
+        self.pareto_file_path = PathManager.path_to(
+            "output", self.process_name + problem_type + PARETO_FILE_SUFFIX
+        )
+        if Path.exists(self.pareto_file_path):
+            Path.unlink(self.pareto_file_path)
+
         # We also need to rename the .csv file which contains the mission
         # data. I don't see a proper way to do it other than that since
         # it is something INSIDE the configuration file which we can't
@@ -153,71 +313,135 @@ class ProcessLauncher:
         new_inputs = copy.deepcopy(self.reference_inputs)
         # Save as the new input file. We overwrite always, may need to put a
         # warning for students
-        new_inputs.save_as(self.input_file_path, overwrite=True)
+        with self.timer.phase("save_as"):
+            new_inputs.save_as(self.input_file_path, overwrite=True)
 
         # Get the problem, no need to write inputs. The fact that the
         # reference was created based on the same configuration we will
         # always use should ensure the completion of the input file
-        self.problem = self.configurator.get_problem(read_inputs=True)
+        with self.timer.phase("get_problem"):
+            self.problem = self.configurator.get_problem(read_inputs=True)
+
+        self._set_mdo_definition()
+
+        self.problem.model.add_objective(**self.mdo_objective)
+        for design_variable in self.mdo_design_variables:
+            self.problem.model.add_design_var(**design_variable)
+        for constraint in self.mdo_constraints:
+            self.problem.model.add_constraint(**constraint)
+
+        self.problem.model.approx_totals()
+        with self.timer.phase("setup"):
+            self.problem.setup()
+
+        self._configure_profiler()
 
+        # Ran the case with the proper mission and go those coefficient
+        for name, value in MDO_MISSION_SETTINGS.items():
+            self.problem.set_val(name=name, val=value)
+
+        driver = self.problem.driver
+
+        self.recorder = om.SqliteRecorder(self.recorder_database_file_path)
+        driver.add_recorder(self.recorder)
+        driver.add_recorder(ProcessRecorder(self.point_queue))
+        # All the outputs are recorded if the run is to be resumable
+        driver.recording_options.update(
+            get_driver_recording_options(
+                self.recording_profile, is_resumable=self.is_mdo_resumed
+            )
+        )
+
+        # The recorder database is created by the final setup, the hash of the
+        # input file is written in it for the run to only be resumed with the
+        # same inputs. The checkpoint also needs the final setup to be done.
+        if self.is_mdo_resumed:
+            self.problem.final_setup()
+            MDOCheckpoint.write_input_file_hash(
+                self.recorder_database_file_path, self.input_file_path
+            )
+
+        # Design points the optimizer comes back to are not evaluated again.
+        # The checkpoint is installed after, so that replayed evaluations do
+        # not go through the cache.
+        self.evaluation_cache = EvaluationCache()
+        self.evaluation_cache.install(self.problem)
+
+        if self.mdo_checkpoint is not None:
+            self.mdo_checkpoint.install(self.problem, self.input_file_path)
+
+    @staticmethod
+    def _get_objective_definition(objective: int) -> dict:
+        """
+        :param objective: the index of the objective in the objective inputs.
+        :return: the objective, as the arguments of add_objective.
+        """
         # The objective is found using the v-model of the button group
         # 0: fuel sizing, 1: MTOW, 2: OWE
-        if self.objective == 0:
+        if objective == 0:
             objective_name = "data:mission:sizing:block_fuel"
-        elif self.objective == 1:
+        elif objective == 1:
             objective_name = "data:weight:aircraft:MTOW"
         else:
             objective_name = "data:weight:aircraft:OWE"
 
-        self.problem.model.add_objective(
+        return dict(
             name=objective_name,
             units="kg",
             scaler=1e-4,
         )
 
+    def _set_mdo_definition(self):
+        """
+        Sets the objective, design variables and constraints of the MDO from
+        the user inputs, as the arguments of add_objective, add_design_var and
+        add_constraint.
+        """
+        self.mdo_objective = self._get_objective_definition(self.objective)
+        # Only used by the Pareto front strategy
+        self.mdo_pareto_objective = self._get_objective_definition(
+            self.pareto_objective
+        )
+        if (
+            self.mdo_strategy == PARETO_STRATEGY
+            and self.mdo_pareto_objective["name"] == self.mdo_objective["name"]
+        ):
+            raise ValueError(
+                "The second objective of the Pareto front must differ from the "
+                "objective"
+            )
+
+        self.mdo_design_variables = []
         if self.is_aspect_ratio_design_variable:
-            self.problem.model.add_design_var(
-                name="data:geometry:wing:aspect_ratio",
-                lower=self.aspect_ratio_lower_bound,
-                upper=self.aspect_ratio_upper_bound,
+            self.mdo_design_variables.append(
+                dict(
+                    name="data:geometry:wing:aspect_ratio",
+                    lower=self.aspect_ratio_lower_bound,
+                    upper=self.aspect_ratio_upper_bound,
+                )
             )
 
         if self.is_wing_sweep_design_variable:
-            self.problem.model.add_design_var(
-                name="data:geometry:wing:sweep_25",
-                units="deg",
-                lower=self.wing_sweep_lower_bound,
-                upper=self.wing_sweep_upper_bound,
+            self.mdo_design_variables.append(
+                dict(
+                    name="data:geometry:wing:sweep_25",
+                    units="deg",
+                    lower=self.wing_sweep_lower_bound,
+                    upper=self.wing_sweep_upper_bound,
+                )
             )
 
+        self.mdo_constraints = []
         if self.is_wing_span_constrained:
-            self.problem.model.add_constraint(
-                name="data:geometry:wing:span",
-                units="m",
-                lower=0.0,
-                upper=self.wing_span_upper_bound,
+            self.mdo_constraints.append(
+                dict(
+                    name="data:geometry:wing:span",
+                    units="m",
+                    lower=0.0,
+                    upper=self.wing_span_upper_bound,
+                )
             )
 
-        self.problem.model.approx_totals()
-        self.problem.setup()
-
-        # Ran the case with the proper mission and go those coefficient
-        self.problem.set_val(
-            name="settings:mission:sizing:breguet:climb:mass_ratio", val=0.975
-        )
-        self.problem.set_val(
-            name="settings:mission:sizing:breguet:descent:mass_ratio", val=0.993
-        )
-        self.problem.set_val(
-            name="settings:mission:sizing:breguet:reserve:mass_ratio", val=0.055
-        )
-
-        driver = self.problem.driver
-
-        self.recorder = om.SqliteRecorder(self.recorder_database_file_path)
-        driver.add_recorder(self.recorder)
-        driver.recording_options["record_objectives"] = True
-
     def _configure_mda(self) -> float:
         """
         Sets the MDA problem and all the user inputs, with the reference MDA
@@ -228,56 +452,176 @@ class ProcessLauncher:
         # Create the input file with the current value
         new_inputs = copy.deepcopy(self.reference_inputs)
 
-        # No need to provide list or numpy array for scalar values.
-        new_inputs["data:TLAR:NPAX"].value = self.n_pax
-
-        new_inputs["data:TLAR:approach_speed"].value = self.v_app
-        # Unit from the widget
-        new_inputs["data:TLAR:approach_speed"].units = "kn"
-
-        # If the Mach get too high and because we originally didn't plan on
-        # changing sweep, the compressibility drag might get too high causing
-        # the code to not converge ! We will thus adapt the sweep based on the
-        # mach number with a message to let the student know about it. We'll
-        # keep the product M_cr * cos(phi_25) constant at the value obtain with
-        # M_cr = 0.78 and phi_25 = 24.54 deg
-        if self.cruise_mach > 0.78:
-            cos_phi_25 = 0.78 / self.cruise_mach * np.cos(np.deg2rad(24.54))
-            phi_25 = np.arccos(cos_phi_25)
-            new_inputs["data:geometry:wing:sweep_25"].value = phi_25
-            new_inputs["data:geometry:wing:sweep_25"].units = "rad"
-
-        new_inputs["data:TLAR:cruise_mach"].value = self.cruise_mach
-
-        new_inputs["data:TLAR:range"].value = self.range
-        new_inputs["data:TLAR:range"].units = "NM"
-
-        new_inputs["data:weight:aircraft:payload"].value = self.payload
-        new_inputs["data:weight:aircraft:payload"].units = "kg"
-        new_inputs["data:weight:aircraft:max_payload"].value = self.max_payload
-        new_inputs["data:weight:aircraft:max_payload"].units = "kg"
-
-        new_inputs["data:geometry:wing:aspect_ratio"].value = self.wing_aspect_ratio
-
-        new_inputs["data:propulsion:rubber_engine:bypass_ratio"].value = (
-            self.bypass_ratio
+        apply_mda_inputs(
+            new_inputs, **{name: getattr(self, name) for name in MDA_INPUT_NAMES}
         )
 
         # Save as the new input file. We overwrite always, may need to put a
         # warning for students
-        new_inputs.save_as(self.input_file_path, overwrite=True)
+        with self.timer.phase("save_as"):
+            new_inputs.save_as(self.input_file_path, overwrite=True)
 
         # Get the problem, no need to write inputs. The fact that the
         # reference was created based on the same configuration we will
         # always use should ensure the completion of the input file
-        self.problem = self.configurator.get_problem(read_inputs=True)
-        self.problem.setup()
+        with self.timer.phase("get_problem"):
+            self.problem = self.configurator.get_problem(read_inputs=True)
+
+        self._configure_mda_solver()
+
+        with self.timer.phase("setup"):
+            self.problem.setup()
+
+        self._configure_profiler()
 
         model = self.problem.model
+        self.target_residuals = model.nonlinear_solver.options["rtol"]
+
+        # The MDA is stopped early if its residuals show it will not converge
+        self.residual_monitor = ResidualMonitor(
+            self.target_residuals, model.nonlinear_solver.options["maxiter"]
+        )
 
         self.recorder = om.SqliteRecorder(self.recorder_database_file_path)
         model.nonlinear_solver.add_recorder(self.recorder)
-        model.nonlinear_solver.recording_options["record_solver_residuals"] = True
+        model.nonlinear_solver.add_recorder(
+            ProcessRecorder(
+                self.point_queue, self.residual_monitor, self.tracked_variables
+            )
+        )
+        # The relative error is always recorded, to tell if the MDA converged
+        model.nonlinear_solver.recording_options.update(
+            get_solver_recording_options(
+                self.recording_profile,
+                [name for name, _ in self.tracked_variables.values()],
+            )
+        )
+
+    def _configure_mda_solver(self):
+        """
+        Replaces the coupling solver of the configuration by the chosen one,
+        with the same tolerance. To be called before the setup.
+        """
+        model = self.problem.model
+        rtol = model.nonlinear_solver.options["rtol"]
+
+        if self.mda_solver == AITKEN_SOLVER:
+            model.nonlinear_solver.options["use_aitken"] = True
+
+        elif self.mda_solver == NEWTON_KRYLOV_SOLVER:
+            model.nonlinear_solver = om.NewtonSolver(
+                solve_subsystems=True,
+                maxiter=NEWTON_MAX_ITERATIONS,
+                rtol=rtol,
+            )
+            model.linear_solver = om.ScipyKrylov()
+
+    def add_result_listener(
+        self, listener: Callable[[Dict[str, float], Dict[str, float]], None]
+    ):
+        """
+        Adds a function to call each time a MDA converges.
+
+        :param listener: a function that takes the MDA inputs and the
+            catalogue outputs, both by name.
+        """
+        self._result_listeners.append(listener)
+
+    def _publish_results(self):
+        """
+        Adds the converged MDA to the results catalogue and gives it to the
+        result listeners.
+        """
+        inputs = {name: getattr(self, name) for name in MDA_INPUT_NAMES}
+        outputs = {
+            name: float(self.problem.get_val(variable_name, units=units)[0])
+            for name, (variable_name, units) in CATALOGUE_OUTPUTS.items()
+        }
+
+        self.results_catalogue.add(self.reference_name, inputs, outputs)
+        for listener in self._result_listeners:
+            listener(inputs, outputs)
+
+    def _configure_profiler(self):
+        """
+        Instruments the components of the set up problem if the profiling
+        mode is on.
+        """
+        if self.is_profiled:
+            self.profiler = ProcessProfiler()
+            self.profiler.attach(self.problem)
+
+    def _run_mdo(self):
+        """
+        Runs the MDO pre-configured problem with the chosen strategy.
+        """
+        if self.mdo_strategy == DRIVER_STRATEGY:
+            with self.timer.phase(
+                "run_driver", recording=self.recording_profile
+            ) as record:
+                self.problem.run_driver()
+                record["iterations"] = self.problem.driver.iter_count
+                record["cache_hits"] = self.evaluation_cache.hits
+            return
+
+        evaluator = DesignPointEvaluator(
+            self.problem,
+            self.mdo_design_variables,
+            self.mdo_objective,
+            self.mdo_constraints,
+        )
+        # The other strategies build their own problems in worker processes
+        worker_configuration = (
+            PathManager.mdo_configuration_file_path,
+            self.input_file_path,
+            MDO_MISSION_SETTINGS,
+            self.point_queue,
+        )
+
+        # Imported here as they are heavy to import and not needed before
+        from . import (
+            SurrogateOptimizer,
+            ParallelGradientOptimizer,
+            MultiStartOptimizer,
+            ParetoExplorer,
+        )
+
+        if self.mdo_strategy == SURROGATE_STRATEGY:
+            optimizer = SurrogateOptimizer(evaluator, self.point_queue)
+        elif self.mdo_strategy == PARALLEL_GRADIENT_STRATEGY:
+            optimizer = ParallelGradientOptimizer(
+                evaluator,
+                *worker_configuration,
+                tolerance=self.problem.driver.options["tol"],
+            )
+        elif self.mdo_strategy == MULTI_START_STRATEGY:
+            optimizer = MultiStartOptimizer(
+                evaluator, *worker_configuration, starts=self.mdo_starts
+            )
+        else:
+            optimizer = ParetoExplorer(
+                evaluator,
+                self.mdo_pareto_objective,
+                *worker_configuration,
+                pareto_file_path=self.pareto_file_path,
+                tolerance=self.problem.driver.options["tol"],
+            )
+
+        with ExitStack() as stack:
+            # With a job server, the worker processes run in the slot of the
+            # launcher and in the free slots it can lease, so that the pools do
+            # not run more processes than the server allows.
+            if self.job_server is not None and self.mdo_strategy != SURROGATE_STRATEGY:
+                optimizer.workers = 1 + stack.enter_context(
+                    self.job_server.extra_slots(optimizer.workers - 1)
+                )
+
+            with self.timer.phase(
+                "run_optimizer", strategy=self.mdo_strategy, workers=optimizer.workers
+            ) as record:
+                optimizer.optimize()
+                record["evaluations"] = evaluator.evaluations
+                record["cache_hits"] = self.evaluation_cache.hits
 
     def _run_problem(self, is_MDO: bool = False):
         """
@@ -291,25 +635,58 @@ class ProcessLauncher:
         with warnings.catch_warnings():
             warnings.simplefilter(action="ignore", category=FutureWarning)
             if is_MDO:
-                self.problem.run_driver()
+                self._run_mdo()
+                # The flight points file is written by the model, so it is the
+                # one of the last computed design point if the last one was
+                # restored from the cache.
+                if self.evaluation_cache.is_last_evaluation_cached:
+                    with self.evaluation_cache.disabled():
+                        self.problem.run_model()
             else:
-                self.problem.run_model()
+                solver = self.problem.model.nonlinear_solver
+                with self.timer.phase(
+                    "run_model",
+                    solver=self.mda_solver,
+                    recording=self.recording_profile,
+                ) as record:
+                    try:
+                        self.problem.run_model()
+                    except MDAAbortedError:
+                        # The outputs of the last iteration are still written
+                        # for the student to see what went wrong.
+                        record["stopped"] = self.residual_monitor.status
+                    record["iterations"] = solver._iter_count
+
+        with self.timer.phase("write_outputs"):
+            self.problem.write_outputs()
+            # JSON copy of the outputs, read much faster by the figures
+            _write_variables(
+                self.output_file_path,
+                VariableList.from_problem(self.problem, promoted_only=True),
+            )
 
-        self.problem.write_outputs()
+        if self.is_profiled:
+            self.profiler.write(self.profile_file_path)
 
         # You can't rename to a file which already exists, so if one already
         # exists we delete it before renaming.
-        if Path.exists(self.new_mission_data_file_path):
-            Path.unlink(self.new_mission_data_file_path)
+        with self.timer.phase("rename_flight_data"):
+            if Path.exists(self.new_mission_data_file_path):
+                Path.unlink(self.new_mission_data_file_path)
 
-        Path.rename(
-            self.old_mission_data_file_path,
-            self.new_mission_data_file_path,
-        )
+            # A stopped MDA may not have computed its mission
+            if Path.exists(self.old_mission_data_file_path):
+                Path.rename(
+                    self.old_mission_data_file_path,
+                    self.new_mission_data_file_path,
+                )
 
         # Shut down the recorder so we can delete the .sql file later
         self.recorder.shutdown()
 
+        if is_MDO:
+            self.evaluation_cache.write(self.recorder_database_file_path)
+
     def set_mdo_inputs(
         self,
         objective: int,
@@ -321,10 +698,28 @@ class ProcessLauncher:
         wing_sweep_upper_bound: float,
         is_wing_span_constrained: bool,
         wing_span_upper_bound: float,
+        strategy: str = DRIVER_STRATEGY,
+        pareto_objective: int = 1,
+        is_resumed: bool = False,
+        is_profiled: bool = False,
+        starts: int = None,
     ):
         """
         Sets the MDO inputs as variables to use it later in in the MDO
         configuration function.
+
+        :param strategy: the MDO strategy, one of MDO_STRATEGIES.
+        :param pareto_objective: the index of the second objective of the
+            Pareto front strategy, as for the objective.
+        :param is_resumed: if True, an MDO interrupted with the same name,
+            design variables, objective and input file is resumed, replaying its
+            recorded evaluations, and all the outputs of this one are recorded
+            for it to be resumed if it is interrupted. Only for the optimizer
+            strategy.
+        :param is_profiled: if True, the compute time of each discipline is
+            recorded and written in a profile file.
+        :param starts: the number of starting points of the multi-start
+            strategy, by default one per core up to a maximum.
         """
         self.objective = objective
         self.is_aspect_ratio_design_variable = is_aspect_ratio_design_variable
@@ -335,6 +730,11 @@ class ProcessLauncher:
         self.wing_sweep_upper_bound = wing_sweep_upper_bound
         self.is_wing_span_constrained = is_wing_span_constrained
         self.wing_span_upper_bound = wing_span_upper_bound
+        self.mdo_strategy = strategy
+        self.pareto_objective = pareto_objective
+        self.is_mdo_resumed = is_resumed
+        self.mdo_starts = starts
+        self.is_profiled = is_profiled
 
     def set_mda_inputs(
         self,
@@ -346,10 +746,16 @@ class ProcessLauncher:
         max_payload: float,
         wing_aspect_ratio: float,
         bypass_ratio: float,
+        solver: str = GAUSS_SEIDEL_SOLVER,
+        is_profiled: bool = False,
     ):
         """
         Sets the MDA inputs as variables to use it later in in the MDA
         configuration function.
+
+        :param solver: the coupling solver, one of MDA_SOLVERS.
+        :param is_profiled: if True, the compute time of each discipline is
+            recorded and written in a profile file.
         """
         self.n_pax = n_pax
         self.v_app = v_app
@@ -359,6 +765,8 @@ class ProcessLauncher:
         self.max_payload = max_payload
         self.wing_aspect_ratio = wing_aspect_ratio
         self.bypass_ratio = bypass_ratio
+        self.mda_solver = solver
+        self.is_profiled = is_profiled
 
     def get_reference_inputs(self, source_data_file_name: str):
         """
@@ -368,51 +776,17 @@ class ProcessLauncher:
         without extension)
         :return: a list of int or float inputs from the source file
         """
+        self.reference_name = source_data_file_name
+
         # Read the source data file
         source_data_file_path = PathManager.to_full_source_file_name(
             source_data_file_name
         )
         self.reference_inputs = oad.DataFile(source_data_file_path)
 
-        n_pax = self.reference_inputs["data:TLAR:NPAX"].value[0]
-        v_app = om.convert_units(
-            self.reference_inputs["data:TLAR:approach_speed"].value[0],
-            self.reference_inputs["data:TLAR:approach_speed"].units,
-            "kn",
-        )
-        cruise_mach = self.reference_inputs["data:TLAR:cruise_mach"].value[0]
-        range = om.convert_units(
-            self.reference_inputs["data:TLAR:range"].value[0],
-            self.reference_inputs["data:TLAR:range"].units,
-            "NM",
-        )
-        payload = om.convert_units(
-            self.reference_inputs["data:weight:aircraft:payload"].value[0],
-            self.reference_inputs["data:weight:aircraft:payload"].units,
-            "kg",
-        )
-        max_payload = om.convert_units(
-            self.reference_inputs["data:weight:aircraft:max_payload"].value[0],
-            self.reference_inputs["data:weight:aircraft:max_payload"].units,
-            "kg",
-        )
-        wing_aspect_ratio = self.reference_inputs[
-            "data:geometry:wing:aspect_ratio"
-        ].value[0]
-        bypass_ratio = self.reference_inputs[
-            "data:propulsion:rubber_engine:bypass_ratio"
-        ].value[0]
-
-        return (
-            n_pax,
-            v_app,
-            cruise_mach,
-            range,
-            payload,
-            max_payload,
-            wing_aspect_ratio,
-            bypass_ratio,
-        )
+        reference_mda_inputs = get_reference_mda_inputs(self.reference_inputs)
+
+        return tuple(reference_mda_inputs[name] for name in MDA_INPUT_NAMES)
 
     def get_MDA_success(self) -> bool:
         """
@@ -420,6 +794,9 @@ class ProcessLauncher:
 
         :return: True if it converged, False either
         """
+        if self.get_MDA_failure() is not None:
+            return False
+
         iterations, relative_error = np.array(
             _extract_residuals(
                 recorder_database_file_path=self.recorder_database_file_path
@@ -431,6 +808,17 @@ class ProcessLauncher:
                 return True
         return False
 
+    def get_MDA_failure(self) -> Optional[str]:
+        """
+        Tells why the computed MDA was stopped before converging.
+
+        :return: DIVERGED or STAGNATED if the MDA was stopped early, None if
+            it was not.
+        """
+        if self.residual_monitor is None:
+            return None
+        return self.residual_monitor.status
+
     def set_aircraft_name(self, name: str):
         """
         Sets the process name and remove all non valid characters
@@ -1,27 +1,15 @@
-from typing import Union
+from queue import Empty, Queue
+from time import perf_counter
 
-import numpy as np
-import shutil
 
-from os import PathLike
-from pathlib import Path
-
-from time import sleep
-from threading import Event
-
-import fastoad.api as oad
-
-from fast_pedago.utils import (
-    _extract_objective,
-    _extract_residuals,
-    RECORDER_FILE_SUFFIX,
-    PathManager,
-)
+# Maximum number of figure updates per second. Points published faster than
+# that are gathered and plotted in the same update.
+MAX_FRAME_RATE = 10.0
 
 
 class ProcessPlotter:
     """
-    Recovers process data from .sql file and provides data to plot.
+    Consumes the process data published during the run and provides data to plot.
     """
 
     def __init__(self, **kwargs):
@@ -32,10 +20,10 @@ class ProcessPlotter:
 
     def plot(
         self,
-        process_ended: Event,
-        recorder_database_file_path: Union[str, PathLike],
+        point_queue: Queue,
         is_MDO: bool = False,
         aircraft_name: str = None,
+        limit: float = None,
     ):
         """
         Plots the relative error of each iteration during MDA process, and the
@@ -44,75 +32,91 @@ class ProcessPlotter:
         This method is made to be used in a separated thread from the main
         MDA/MDO process
 
-        :param process_ended: event triggered after the MDA/MDO process ends
-        :param recorder_database_file_path: path of the database used to store
-            process data
+        :param point_queue: queue in which the process publishes (iteration,
+            value) points, and None once it has ended. Processes with several
+            traces (multi-start MDO) publish (iteration, value, trace) points,
+            and MDA tracking coupled variables (iteration, value, 0, values by
+            label) points.
         :param is_MDA: boolean indicating if the program should plot
             objectives (MDO) or residuals (MDA)
         :param aircraft_name: name of the aircraft to plot, if it contains green
             the plot will be green
+        :param limit: the targeted residuals of the MDA, not used for MDO
         """
-
-        temp_recorder_database_file_path = str(recorder_database_file_path).replace(
-            RECORDER_FILE_SUFFIX,
-            "_temp" + RECORDER_FILE_SUFFIX,
-        )
-
         is_aircraft_green = (
             "green" in aircraft_name.lower() or "vert" in aircraft_name.lower()
         )
 
-        main = None
         if is_MDO:
             limit = None
-        else:
-            # Extract the target residuals from the MDA configuration file
-            mda_configurator = oad.FASTOADProblemConfigurator(
-                PathManager.mda_configuration_file_path
-            )
-            mda_problem = mda_configurator.get_problem()
-            limit = mda_problem.model.nonlinear_solver.options["rtol"]
 
-        iterations = None
+        frame_period = 1.0 / MAX_FRAME_RATE
+        last_plot_time = 0.0
+        is_plot_pending = False
 
-        while not process_ended.is_set():
-            sleep(0.1)
-            try:
-                # Copy the db file before reading it to avoid reading when an
-                # other thread is writing, which could cause the code to fail.
-                shutil.copyfile(
-                    recorder_database_file_path, temp_recorder_database_file_path
-                )
-
-                if not is_MDO:
-                    # Here "main" is the residuals.
-                    iterations, main = np.array(
-                        _extract_residuals(
-                            recorder_database_file_path=temp_recorder_database_file_path
-                        )
-                    )
+        # (iterations, values) lists by trace, and by tracked variable
+        traces = {}
+        variable_traces = {}
 
+        while True:
+            # Without points waiting to be plotted, block until the next one
+            # is published. Else, only wait until the next frame is due.
+            try:
+                if is_plot_pending:
+                    timeout = max(0.0, last_plot_time + frame_period - perf_counter())
+                    point = point_queue.get(timeout=timeout)
                 else:
-                    # Here "main" is the objective
-                    iterations, main = np.array(
-                        _extract_objective(
-                            recorder_database_file_path=temp_recorder_database_file_path
-                        )
-                    )
-
-                if self.figure:
-                    # "iterations" is the abscissa value, "main" is either the residuals or the
-                    # objectives, and "limit" is either the targeted residuals or the minimum
-                    # objective reached.
-                    self.figure.plot(iterations, main, limit, is_aircraft_green)
-           
-            except Exception:
-                pass
+                    point = point_queue.get()
+            except Empty:
+                point = ()
+
+            if point is None:
+                break
+
+            if point:
+                trace = point[2] if len(point) > 2 else 0
+                _append_point(traces, trace, point[0], point[1])
+                if len(point) > 3:
+                    for label, value in point[3].items():
+                        _append_point(variable_traces, label, point[0], value)
+                is_plot_pending = True
+
+            if is_plot_pending and perf_counter() - last_plot_time >= frame_period:
+                last_plot_time = perf_counter()
+                is_plot_pending = False
+                self._plot(traces, variable_traces, limit, is_aircraft_green)
 
         # Plot the min objective reached after the end of the process only
-        if is_MDO:
-            limit = min(main)
-            if self.figure:
-                self.figure.plot(iterations, main, limit, is_aircraft_green)
+        if is_MDO and traces:
+            limit = min(min(values) for _, values in traces.values())
+
+        if is_plot_pending or is_MDO:
+            self._plot(traces, variable_traces, limit, is_aircraft_green)
+
+    def _plot(self, traces, variable_traces, limit, is_aircraft_green):
+        if self.figure and traces:
+            # "iterations" is the abscissa value, "main" is either the residuals
+            # or the objectives, and "limit" is either the targeted residuals or
+            # the minimum objective reached. Other traces are plotted alongside.
+            (iterations, main), *other_traces = [
+                traces[trace] for trace in sorted(traces)
+            ]
+            self.figure.plot(
+                iterations, main, limit, is_aircraft_green, other_traces=other_traces
+            )
+            if variable_traces:
+                self.figure.plot_variables(variable_traces)
+
 
-        Path.unlink(Path(temp_recorder_database_file_path))
+def _append_point(traces: dict, trace, iteration: int, value: float):
+    """
+    Appends a point to a trace, created if it is the first point of the trace.
+
+    :param traces: the (iterations, values) lists of the traces, by trace.
+    :param trace: the trace the point belongs to.
+    :param iteration: the iteration of the point.
+    :param value: the value of the point.
+    """
+    iterations, values = traces.setdefault(trace, ([], []))
+    iterations.append(iteration)
+    values.append(value)
@@ -0,0 +1,128 @@
+import csv
+import logging
+
+from functools import wraps
+from os import PathLike
+from time import perf_counter
+from typing import Dict, Union
+
+import openmdao.api as om
+from openmdao.core.component import Component
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Methods through which OpenMDAO makes a component compute (evaluation of
+# outputs, of residuals, and of partial derivatives).
+PROFILED_METHODS = ["_solve_nonlinear", "_apply_nonlinear", "_linearize"]
+
+
+class ProcessProfiler:
+    """
+    Records the compute time and the number of calls of each component of a
+    problem, and gathers them by discipline (the systems declared in the
+    configuration file, such as geometry, weight, aerodynamics...).
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        # For each component path: its discipline, its number of calls and
+        # the total time spent in it.
+        self.statistics: Dict[str, dict] = {}
+
+    def attach(self, problem: om.Problem):
+        """
+        Instruments all the components of a problem that has been set up, so
+        that their compute time and calls are recorded.
+
+        :param problem: the problem to profile, must have been set up.
+        """
+        model = problem.model
+
+        for component in model.system_iter(recurse=True, typ=Component):
+            statistic = {
+                "discipline": self._get_discipline(model, component.pathname),
+                "calls": 0,
+                "time": 0.0,
+            }
+            self.statistics[component.pathname] = statistic
+
+            for method_name in PROFILED_METHODS:
+                setattr(
+                    component,
+                    method_name,
+                    self._profiled(getattr(component, method_name), statistic),
+                )
+
+    def write(self, profile_file_path: Union[str, PathLike]):
+        """
+        Writes the recorded statistics in a .csv file, one line per component.
+
+        :param profile_file_path: the path of the .csv file to write.
+        """
+        with open(profile_file_path, "w", newline="") as profile_file:
+            writer = csv.writer(profile_file)
+            writer.writerow(["discipline", "component", "calls", "time"])
+            for component, statistic in self.statistics.items():
+                writer.writerow(
+                    [
+                        statistic["discipline"],
+                        component,
+                        statistic["calls"],
+                        statistic["time"],
+                    ]
+                )
+
+        for discipline, time in sorted(
+            self.time_by_discipline().items(), key=lambda item: -item[1]
+        ):
+            _LOGGER.info("Discipline %s: %.3f s", discipline, time)
+
+    def time_by_discipline(self) -> Dict[str, float]:
+        """
+        :return: the total compute time of each discipline.
+        """
+        times = {}
+        for statistic in self.statistics.values():
+            discipline = statistic["discipline"]
+            times[discipline] = times.get(discipline, 0.0) + statistic["time"]
+
+        return times
+
+    @staticmethod
+    def _profiled(method, statistic: dict):
+        """
+        Wraps a component method to add its duration and a call to the given
+        statistic.
+        """
+
+        @wraps(method)
+        def profiled_method(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                statistic["time"] += perf_counter() - start
+                statistic["calls"] += 1
+
+        return profiled_method
+
+    @staticmethod
+    def _get_discipline(model: om.Group, component_path: str) -> str:
+        """
+        Finds the discipline of a component: its first ancestor that is not a
+        simple group used to organize the configuration file (such as
+        "subgroup"), or the component itself.
+
+        :param model: the problem model.
+        :param component_path: the path of the component in the model.
+        :return: the name of the discipline.
+        """
+        path_elements = component_path.split(".")
+        for depth in range(1, len(path_elements) + 1):
+            system = model._get_subsystem(".".join(path_elements[:depth]))
+            if type(system) is not om.Group:
+                return path_elements[depth - 1]
+
+        return path_elements[-1]
@@ -0,0 +1,90 @@
+from queue import Queue
+from typing import Dict, Tuple
+
+from openmdao.recorders.case_recorder import CaseRecorder
+
+from .residual_monitor import ResidualMonitor
+
+
+class ProcessRecorder(CaseRecorder):
+    """
+    An OpenMDAO recorder that publishes the progress of a process in a queue
+    instead of writing it in a file: the relative error of each iteration when
+    attached to a solver (MDA), or the objective of each iteration when attached
+    to a driver (MDO).
+
+    Points are put in the queue as (iteration, value) tuples, the first
+    iteration being 1.
+
+    When attached to a solver, the published relative errors can also be watched
+    by a residual monitor that stops the MDA if it will not converge, and the
+    values of some coupled variables at each iteration can be published along,
+    as (iteration, relative error, 0, values by label) tuples.
+    """
+
+    def __init__(
+        self,
+        point_queue: Queue,
+        residual_monitor: ResidualMonitor = None,
+        tracked_variables: Dict[str, Tuple[str, str]] = None,
+        **kwargs,
+    ):
+        """
+        :param point_queue: the queue to publish the points in.
+        :param residual_monitor: the monitor to give the relative errors to.
+        :param tracked_variables: the (name, units) of the variables to publish
+            the values of at each solver iteration, by label.
+        """
+        super().__init__(record_viewer_data=False, **kwargs)
+
+        self.point_queue = point_queue
+        self.residual_monitor = residual_monitor
+        self.tracked_variables = tracked_variables
+
+    def record_iteration_solver(self, recording_requester, data, metadata):
+        point = (self._counter, data["rel"])
+        if self.tracked_variables:
+            point += (0, self._get_tracked_values(recording_requester._system()))
+        self.point_queue.put(point)
+        # The point is published before the MDA is stopped, to be plotted
+        if self.residual_monitor is not None:
+            self.residual_monitor.check(data["rel"])
+
+    def _get_tracked_values(self, system) -> Dict[str, float]:
+        """
+        :param system: the system the solver is attached to.
+        :return: the current values of the tracked variables, by label. The
+            variables that are not in the system are left out.
+        """
+        values = {}
+        for label, (name, units) in self.tracked_variables.items():
+            try:
+                values[label] = float(system.get_val(name, units=units)[0])
+            except KeyError:
+                continue
+        return values
+
+    def record_iteration_driver(self, recording_requester, data, metadata):
+        objective = list(recording_requester.get_objective_values().values())[0]
+        self.point_queue.put((self._counter, float(objective)))
+
+    # Nothing else is published, but OpenMDAO expects those methods to be
+    # implemented.
+
+    def record_metadata_system(self, system, run_number=None):
+        pass
+
+    def record_metadata_solver(self, solver, run_number=None):
+        pass
+
+    def record_iteration_system(self, recording_requester, data, metadata):
+        pass
+
+    def record_iteration_problem(self, recording_requester, data, metadata):
+        pass
+
+    def record_derivatives_driver(self, recording_requester, data, metadata):
+        pass
+
+    def record_viewer_data(self, model_viewer_data):
+        pass
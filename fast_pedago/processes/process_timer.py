@@ -0,0 +1,101 @@
+import json
+import logging
+
+from contextlib import contextmanager
+from os import PathLike
+from time import perf_counter, time
+from typing import List, Union
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Environment variable set by the app for the launchers to write the timings
+# of the processes in a file
+TIMINGS_FILE_ENV = "FAST_PEDAGO_TIMINGS_FILE"
+
+
+class ProcessTimer:
+    """
+    Measures the duration of each phase of a process launch (paths configuration,
+    input writing, problem setup, run, output writing...) and emits them as
+    structured records through logging. Records can also be written as JSON lines
+    in a file.
+    """
+
+    def __init__(self, run_name: str, process_type: str, **kwargs):
+        """
+        :param run_name: the name of the run (the aircraft name).
+        :param process_type: the type of process (MDA or MDO).
+        """
+        super().__init__(**kwargs)
+
+        self.run_name = run_name
+        self.process_type = process_type
+        self.records: List[dict] = []
+
+        self._start = perf_counter()
+
+    @contextmanager
+    def phase(self, phase_name: str, **extra):
+        """
+        Context manager that times the enclosed block as a phase of the run.
+        The yielded dictionary can be completed inside the block with
+        information only known at the end of the phase (number of iterations
+        for instance).
+
+        :param phase_name: the name of the phase.
+        :param extra: additional information to put in the record.
+        """
+        record = {
+            "run": self.run_name,
+            "process": self.process_type,
+            "phase": phase_name,
+            "timestamp": time(),
+        }
+        record.update(extra)
+
+        start = perf_counter()
+        try:
+            yield record
+        finally:
+            record["duration"] = perf_counter() - start
+            self._emit(record)
+
+    def total(self, **extra):
+        """
+        Emits a record with the total duration of the run since the timer was
+        created.
+
+        :param extra: additional information to put in the record.
+        """
+        record = {
+            "run": self.run_name,
+            "process": self.process_type,
+            "phase": "total",
+            "timestamp": time(),
+            "duration": perf_counter() - self._start,
+        }
+        record.update(extra)
+        self._emit(record)
+
+    def write(self, timings_file_path: Union[str, PathLike]):
+        """
+        Writes all the records of the run as JSON lines, overwriting any
+        previous file.
+
+        :param timings_file_path: the path of the file to write.
+        """
+        with open(timings_file_path, "w") as timings_file:
+            for record in self.records:
+                timings_file.write(json.dumps(record) + "\n")
+
+    def _emit(self, record: dict):
+        self.records.append(record)
+        _LOGGER.info(
+            "%s %s - %s: %.3f s",
+            record["process"],
+            record["run"],
+            record["phase"],
+            record["duration"],
+            extra={"timing": record},
+        )
@@ -0,0 +1,103 @@
+"""
+The recording profiles of the processes, which set what the OpenMDAO recorders
+write in the recorder file, from the least needed by the app to everything.
+"""
+
+from typing import Iterable
+
+
+MINIMAL_PROFILE = "minimal"
+LIVE_PLOT_PROFILE = "live-plot"
+FULL_DEBUG_PROFILE = "full-debug"
+RECORDING_PROFILES = [MINIMAL_PROFILE, LIVE_PLOT_PROFILE, FULL_DEBUG_PROFILE]
+
+# Environment variable set by the app to the recording profile of the processes
+RECORDING_PROFILE_ENV = "FAST_PEDAGO_RECORDING_PROFILE"
+
+# Recording options of the MDA coupling solver, by profile. The minimal profile
+# only records the relative error, which tells if the MDA converged. The live
+# plot one also records the absolute error and the outputs of the tracked
+# coupled variables, for the recorder file to be followed during the run.
+SOLVER_RECORDING_OPTIONS = {
+    MINIMAL_PROFILE: dict(
+        record_abs_error=False,
+        record_rel_error=True,
+        record_inputs=False,
+        record_outputs=False,
+        record_solver_residuals=False,
+    ),
+    LIVE_PLOT_PROFILE: dict(
+        record_abs_error=True,
+        record_rel_error=True,
+        record_inputs=False,
+        record_outputs=True,
+        record_solver_residuals=False,
+    ),
+    FULL_DEBUG_PROFILE: dict(
+        record_abs_error=True,
+        record_rel_error=True,
+        record_inputs=True,
+        record_outputs=True,
+        record_solver_residuals=True,
+        includes=["*"],
+        excludes=[],
+    ),
+}
+
+# Recording options of the MDO driver, by profile. The minimal profile only
+# records the design variables, objectives and constraints, the objective being
+# already plotted live by it.
+DRIVER_RECORDING_OPTIONS = {
+    MINIMAL_PROFILE: dict(
+        record_desvars=True,
+        record_objectives=True,
+        record_constraints=True,
+        record_responses=False,
+        record_inputs=False,
+        record_outputs=False,
+        record_derivatives=False,
+        includes=[],
+    ),
+    FULL_DEBUG_PROFILE: dict(
+        record_desvars=True,
+        record_objectives=True,
+        record_constraints=True,
+        record_responses=True,
+        record_inputs=True,
+        record_outputs=True,
+        record_derivatives=True,
+        includes=["*"],
+        excludes=[],
+    ),
+}
+DRIVER_RECORDING_OPTIONS[LIVE_PLOT_PROFILE] = DRIVER_RECORDING_OPTIONS[MINIMAL_PROFILE]
+
+
+def get_solver_recording_options(
+    profile: str, variable_names: Iterable[str] = ()
+) -> dict:
+    """
+    :param profile: the recording profile, one of RECORDING_PROFILES.
+    :param variable_names: the names of the tracked coupled variables, whose
+        outputs are recorded by the live plot profile.
+    :return: the recording options of the MDA coupling solver.
+    """
+    options = dict(SOLVER_RECORDING_OPTIONS[profile])
+    if profile == LIVE_PLOT_PROFILE:
+        options["includes"] = list(variable_names)
+    return options
+
+
+def get_driver_recording_options(profile: str, is_resumable: bool = False) -> dict:
+    """
+    :param profile: the recording profile, one of RECORDING_PROFILES.
+    :param is_resumable: if True, all the outputs are recorded whatever the
+        profile, for the MDO to be resumed from its recorder file if it is
+        interrupted.
+    :return: the recording options of the MDO driver.
+    """
+    options = dict(DRIVER_RECORDING_OPTIONS[profile])
+    if is_resumable:
+        options["record_outputs"] = True
+        options["includes"] = ["*"]
+    return options
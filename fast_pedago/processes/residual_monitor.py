@@ -0,0 +1,109 @@
+import logging
+
+from typing import List, Optional
+
+import numpy as np
+
+# Only the error is imported, OpenMDAO being heavy to import for the GUI that
+# uses the statuses
+from openmdao.core.analysis_error import AnalysisError
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Reasons for which a MDA is stopped before its maximum number of iterations
+DIVERGED = "diverged"
+STAGNATED = "stagnated"
+
+# Iterations before the trend is looked at, the first iterations of the
+# Gauss-Seidel solver being usually erratic
+MIN_ITERATIONS = 10
+
+# The MDA diverged when its relative error becomes this many times larger than
+# the best one reached
+DIVERGENCE_FACTOR = 1e2
+
+# Iterations over which the convergence rate is computed
+TREND_ITERATIONS = 10
+
+# The MDA stagnated when, at its current convergence rate, it would need more
+# than this many times its remaining iterations to converge
+STAGNATION_FACTOR = 2.0
+
+
+class MDAAbortedError(AnalysisError):
+    """
+    Raised to stop a MDA that will not converge.
+    """
+
+
+class ResidualMonitor:
+    """
+    Watches the relative errors of the iterations of a MDA solver and stops the
+    MDA as soon as it diverges, or converges too slowly to reach its tolerance
+    before its maximum number of iterations.
+    """
+
+    def __init__(self, rtol: float, maxiter: int, **kwargs):
+        """
+        :param rtol: the relative error tolerance of the solver.
+        :param maxiter: the maximum number of iterations of the solver.
+        """
+        super().__init__(**kwargs)
+
+        self.rtol = rtol
+        self.maxiter = maxiter
+
+        self.relative_errors: List[float] = []
+        # The reason the MDA was stopped for, None if it was not
+        self.status: Optional[str] = None
+
+    def check(self, relative_error: float):
+        """
+        Adds the relative error of an iteration to the history.
+
+        :param relative_error: the relative error of the iteration.
+        :raise MDAAbortedError: if the MDA diverged or stagnated.
+        """
+        self.relative_errors.append(relative_error)
+
+        self.status = self._get_status()
+        if self.status is not None:
+            _LOGGER.info(
+                "MDA %s, stopped at iteration %d with a relative error of %g",
+                self.status,
+                len(self.relative_errors),
+                relative_error,
+            )
+            raise MDAAbortedError(
+                "MDA %s at iteration %d" % (self.status, len(self.relative_errors))
+            )
+
+    def _get_status(self) -> Optional[str]:
+        iteration = len(self.relative_errors)
+        relative_error = self.relative_errors[-1]
+
+        if not np.isfinite(relative_error):
+            return DIVERGED
+        if iteration < MIN_ITERATIONS or relative_error <= self.rtol:
+            return None
+
+        if relative_error > DIVERGENCE_FACTOR * min(self.relative_errors):
+            return DIVERGED
+
+        if iteration <= TREND_ITERATIONS:
+            return None
+
+        # Geometric convergence rate over the last iterations
+        previous_error = self.relative_errors[-TREND_ITERATIONS - 1]
+        if previous_error <= 0.0 or relative_error <= 0.0:
+            return None
+        rate = (relative_error / previous_error) ** (1.0 / TREND_ITERATIONS)
+        if rate >= 1.0:
+            return STAGNATED
+
+        needed_iterations = np.log(self.rtol / relative_error) / np.log(rate)
+        if needed_iterations > STAGNATION_FACTOR * (self.maxiter - iteration):
+            return STAGNATED
+
+        return None
@@ -0,0 +1,140 @@
+import csv
+import os
+import shutil
+
+from contextlib import contextmanager
+from os import PathLike
+from pathlib import Path
+from time import sleep, time
+from typing import Dict, List, Tuple, Union
+
+import numpy as np
+
+from .mda_inputs import MDA_INPUT_NAMES
+
+
+# Outputs stored in the catalogue for each converged aircraft: the name of the
+# FAST-OAD variable and the units to store it in.
+CATALOGUE_OUTPUTS = {
+    "MTOW": ("data:weight:aircraft:MTOW", "kg"),
+    "OWE": ("data:weight:aircraft:OWE", "kg"),
+    "block_fuel": ("data:mission:sizing:block_fuel", "kg"),
+    "wing_span": ("data:geometry:wing:span", "m"),
+}
+
+REFERENCE_COLUMN = "reference"
+
+# Time (in s) after which the lock of the catalogue is considered to be left by
+# a process that stopped while adding an aircraft, and period at which it is
+# checked for.
+LOCK_TIMEOUT = 10.0
+LOCK_WAIT_PERIOD = 0.05
+
+
+class ResultsCatalogue:
+    """
+    A .csv catalogue of the converged MDA, with their inputs and main outputs.
+    It is shared by all the sessions using the same working directory.
+    """
+
+    def __init__(self, catalogue_file_path: Union[str, PathLike], **kwargs):
+        """
+        :param catalogue_file_path: the path to the catalogue file, created
+            when the first aircraft is added.
+        """
+        super().__init__(**kwargs)
+
+        self.catalogue_file_path = Path(catalogue_file_path)
+        self.columns = [REFERENCE_COLUMN] + MDA_INPUT_NAMES + list(CATALOGUE_OUTPUTS)
+
+    def add(self, reference: str, inputs: Dict[str, float], outputs: Dict[str, float]):
+        """
+        Adds a converged aircraft to the catalogue.
+
+        :param reference: the name of the reference aircraft the inputs were
+            applied to.
+        :param inputs: the MDA inputs, by name.
+        :param outputs: the catalogue outputs, by name.
+        """
+        # The other sessions add aircraft to the same file: the file is
+        # completed by one of them at a time, in a copy then renamed so that a
+        # partial file is never read.
+        temporary_file_path = self.catalogue_file_path.with_name(
+            self.catalogue_file_path.name + "." + str(os.getpid())
+        )
+        with self._lock():
+            is_new_file = not Path.exists(self.catalogue_file_path)
+            if not is_new_file:
+                shutil.copy(self.catalogue_file_path, temporary_file_path)
+
+            with open(temporary_file_path, "a", newline="") as catalogue_file:
+                writer = csv.writer(catalogue_file)
+                if is_new_file:
+                    writer.writerow(self.columns)
+                writer.writerow(
+                    [reference]
+                    + [inputs[name] for name in MDA_INPUT_NAMES]
+                    + [outputs[name] for name in CATALOGUE_OUTPUTS]
+                )
+            os.replace(temporary_file_path, self.catalogue_file_path)
+
+    def read(self, reference: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reads the aircraft of the catalogue sized from a given reference.
+
+        :param reference: the name of the reference aircraft.
+        :return: an array of the inputs (one line per aircraft, one column per
+            input) and an array of the outputs.
+        """
+        inputs: List[List[float]] = []
+        outputs: List[List[float]] = []
+
+        if Path.exists(self.catalogue_file_path):
+            with open(self.catalogue_file_path, newline="") as catalogue_file:
+                for row in csv.DictReader(catalogue_file):
+                    if row[REFERENCE_COLUMN] != reference:
+                        continue
+                    inputs.append([float(row[name]) for name in MDA_INPUT_NAMES])
+                    outputs.append([float(row[name]) for name in CATALOGUE_OUTPUTS])
+
+        return (
+            np.array(inputs).reshape(-1, len(MDA_INPUT_NAMES)),
+            np.array(outputs).reshape(-1, len(CATALOGUE_OUTPUTS)),
+        )
+
+    @contextmanager
+    def _lock(self):
+        """
+        Context manager that holds the lock file of the catalogue, waiting for
+        the other sessions to release it.
+        """
+        lock_file_path = self.catalogue_file_path.with_name(
+            self.catalogue_file_path.name + ".lock"
+        )
+        while True:
+            try:
+                os.close(os.open(lock_file_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                break
+            except FileExistsError:
+                pass
+            try:
+                if time() - lock_file_path.stat().st_mtime > LOCK_TIMEOUT:
+                    lock_file_path.unlink()
+                    continue
+            except FileNotFoundError:
+                continue
+            sleep(LOCK_WAIT_PERIOD)
+
+        try:
+            yield
+        finally:
+            lock_file_path.unlink()
+
+    def modification_time(self) -> float:
+        """
+        :return: the last modification time of the catalogue file, 0.0 if it
+            does not exist yet.
+        """
+        if Path.exists(self.catalogue_file_path):
+            return self.catalogue_file_path.stat().st_mtime
+        return 0.0
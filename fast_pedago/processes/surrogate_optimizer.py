@@ -0,0 +1,271 @@
+import logging
+import warnings
+
+from queue import Queue
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+import openmdao.api as om
+
+from scipy.optimize import minimize
+
+from .design_point_evaluator import DesignPointEvaluator
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Trust region radii, in fraction of the design variable ranges
+INITIAL_RADIUS = 0.2
+MIN_RADIUS = 1e-3
+MAX_RADIUS = 0.5
+
+# Limits on the ratio between the actual and the predicted objective
+# reduction, below which the trust region shrinks and above which it grows.
+SHRINK_RATIO = 0.25
+EXPAND_RATIO = 0.75
+
+# Default maximum number of MDA run during an optimization
+MAX_EVALUATIONS = 40
+
+# Weight of the uncertainty of the surrogate subtracted from its predicted
+# objective when looking for a candidate point. Away from the evaluated points,
+# a kriging surrogate goes back to the mean of the objectives, so that without
+# it the candidate would stick to the best point.
+EXPLORATION_WEIGHT = 2.0
+
+
+class SurrogateOptimizer:
+    """
+    Optimizes an MDO problem on a kriging surrogate of its objective and
+    constraints, fitted on the MDA run so far. Each iteration minimizes the
+    surrogate inside a trust region around the best point, and runs the MDA
+    only to validate the candidate point. The trust region grows when the
+    surrogate predicts well and shrinks when it doesn't.
+
+    For the few design variables of the course, it needs far fewer MDA than the
+    driver, which also runs MDA to approximate gradients.
+    """
+
+    def __init__(
+        self,
+        evaluator: DesignPointEvaluator,
+        point_queue: Queue = None,
+        max_evaluations: int = MAX_EVALUATIONS,
+        **kwargs,
+    ):
+        """
+        :param evaluator: the evaluator running the MDA of the problem.
+        :param point_queue: queue in which (evaluation, objective) points are
+            published for each successful MDA.
+        :param max_evaluations: maximum number of MDA to run.
+        """
+        super().__init__(**kwargs)
+
+        self.evaluator = evaluator
+        self.point_queue = point_queue
+        self.max_evaluations = max_evaluations
+
+        # A design variable with equal bounds is kept from dividing by zero
+        self._lower = evaluator.lower_bounds
+        self._range = evaluator.upper_bounds - self._lower
+        self._range[self._range <= 0.0] = 1.0
+
+        # Successful evaluations, with design points normalized in [0, 1]
+        self._points: List[np.ndarray] = []
+        self._objectives: List[float] = []
+        self._margins: List[np.ndarray] = []
+
+        # Index of the evaluation the problem was last run at, None if its MDA
+        # failed and the problem was left in a failed state
+        self._last_index: Optional[int] = None
+
+    def optimize(self) -> Optional[np.ndarray]:
+        """
+        Runs the optimization from the current design point of the problem.
+        The problem is left evaluated at the best point found.
+
+        :return: the best design point, or None if no MDA succeeded.
+        """
+        center = np.clip(self._normalize(self.evaluator.get_design_point()), 0.0, 1.0)
+        radius = INITIAL_RADIUS
+
+        # Initial points around the starting point, one step along each axis
+        initial_points = [center]
+        for axis in range(len(center)):
+            for sign in (-1.0, 1.0):
+                point = center.copy()
+                point[axis] = np.clip(point[axis] + sign * radius, 0.0, 1.0)
+                if not any(np.allclose(point, known) for known in initial_points):
+                    initial_points.append(point)
+
+        for point in initial_points:
+            self._evaluate(point)
+
+        if not self._points:
+            _LOGGER.warning("Surrogate optimization failed: no MDA succeeded")
+            return None
+
+        best = self._best_index()
+        center = self._points[best]
+
+        while (
+            self.evaluator.evaluations < self.max_evaluations and radius >= MIN_RADIUS
+        ):
+            surrogate = self._fit()
+            if surrogate is None:
+                break
+
+            candidate, predicted_objective = self._minimize_surrogate(
+                surrogate, center, radius
+            )
+            step = np.max(np.abs(candidate - center))
+
+            # Nothing to learn from a point the surrogate was fitted on
+            if step < MIN_RADIUS or any(
+                np.allclose(candidate, known, atol=MIN_RADIUS) for known in self._points
+            ):
+                radius *= 0.5
+                continue
+
+            if not self._evaluate(candidate):
+                radius *= 0.5
+                continue
+
+            predicted_reduction = self._objectives[best] - predicted_objective
+            actual_reduction = self._objectives[best] - self._objectives[-1]
+
+            if self._is_better(len(self._points) - 1, best):
+                ratio = (
+                    actual_reduction / predicted_reduction
+                    if predicted_reduction > 0.0
+                    else 1.0
+                )
+                best = len(self._points) - 1
+                center = candidate
+
+                if ratio > EXPAND_RATIO and step >= 0.99 * radius:
+                    radius = min(2.0 * radius, MAX_RADIUS)
+                elif ratio < SHRINK_RATIO:
+                    radius *= 0.5
+            else:
+                radius *= 0.5
+
+        _LOGGER.info(
+            "Surrogate optimization ended after %d MDA, objective: %f",
+            self.evaluator.evaluations,
+            self._objectives[best],
+        )
+
+        # Leave the problem at the optimum for outputs to be written
+        if best != self._last_index:
+            self.evaluator.evaluate(self._denormalize(self._points[best]))
+
+        return self._denormalize(self._points[best])
+
+    def _evaluate(self, point: np.ndarray) -> bool:
+        """
+        Runs the MDA at a normalized design point and stores the result.
+
+        :return: True if the MDA succeeded.
+        """
+        result = self.evaluator.evaluate(self._denormalize(point))
+        if result is None:
+            self._last_index = None
+            return False
+
+        objective, margins = result
+        self._points.append(point)
+        self._objectives.append(objective)
+        self._margins.append(margins)
+        self._last_index = len(self._points) - 1
+
+        if self.point_queue is not None:
+            self.point_queue.put((self.evaluator.evaluations, objective))
+
+        return True
+
+    def _fit(self) -> Optional[om.KrigingSurrogate]:
+        """
+        Fits the surrogate of the objective and constraint margins on all the
+        successful evaluations.
+        """
+        outputs = np.column_stack(
+            [self._objectives, np.array(self._margins).reshape(len(self._points), -1)]
+        )
+        surrogate = om.KrigingSurrogate(nugget=1e-10, eval_rmse=True)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                surrogate.train(np.array(self._points), outputs)
+        except (ValueError, np.linalg.LinAlgError) as error:
+            _LOGGER.warning("Could not fit the optimization surrogate: %s", error)
+            return None
+
+        return surrogate
+
+    def _minimize_surrogate(
+        self, surrogate: om.KrigingSurrogate, center: np.ndarray, radius: float
+    ) -> Tuple[np.ndarray, float]:
+        """
+        Minimizes the lower confidence bound of the objective in the trust
+        region, under the predicted constraints.
+
+        :return: the candidate point and its predicted objective.
+        """
+
+        def predict(point):
+            return surrogate.predict(np.atleast_2d(point))[0][0]
+
+        def lower_confidence_bound(point):
+            prediction, error = surrogate.predict(np.atleast_2d(point))
+            return prediction[0, 0] - EXPLORATION_WEIGHT * error[0, 0]
+
+        constraints = []
+        if len(self.evaluator.constraints):
+            constraints.append(
+                {"type": "ineq", "fun": lambda point: predict(point)[1:]}
+            )
+
+        bounds = list(
+            zip(np.maximum(center - radius, 0.0), np.minimum(center + radius, 1.0))
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = minimize(
+                lower_confidence_bound,
+                center,
+                method="SLSQP",
+                bounds=bounds,
+                constraints=constraints,
+            )
+
+        lower, upper = np.array(bounds).T
+        candidate = np.clip(result.x, lower, upper)
+
+        return candidate, predict(candidate)[0]
+
+    def _best_index(self) -> int:
+        best = 0
+        for index in range(1, len(self._points)):
+            if self._is_better(index, best):
+                best = index
+        return best
+
+    def _is_better(self, index: int, other_index: int) -> bool:
+        """
+        Tells if an evaluation is better than an other: feasibility comes first,
+        then the objective.
+        """
+        return DesignPointEvaluator.rank(
+            self._objectives[index], self._margins[index]
+        ) < DesignPointEvaluator.rank(
+            self._objectives[other_index], self._margins[other_index]
+        )
+
+    def _normalize(self, design_point: np.ndarray) -> np.ndarray:
+        return (design_point - self._lower) / self._range
+
+    def _denormalize(self, point: np.ndarray) -> np.ndarray:
+        return self._lower + point * self._range
@@ -0,0 +1,122 @@
+import logging
+import warnings
+
+from typing import Dict, Optional
+
+import numpy as np
+
+import openmdao.api as om
+
+from .mda_inputs import MDA_INPUT_NAMES
+from .results_catalogue import ResultsCatalogue, CATALOGUE_OUTPUTS
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of converged aircraft needed before predicting anything.
+MIN_TRAINING_POINTS = 3
+
+# Only the most recent aircraft are used to keep the training time low.
+MAX_TRAINING_POINTS = 200
+
+
+class SurrogatePreview:
+    """
+    Predicts the main outputs of a sizing (MTOW, OWE, block fuel, wing span)
+    from the MDA inputs with a kriging surrogate model, fitted on the converged
+    aircraft of the results catalogue. It gives an instant preview of the
+    sizing while inputs are being changed.
+    """
+
+    def __init__(self, catalogue: ResultsCatalogue, **kwargs):
+        """
+        :param catalogue: the catalogue of converged aircraft to fit on.
+        """
+        super().__init__(**kwargs)
+
+        self.catalogue = catalogue
+        self.reference = None
+
+        self._inputs = np.zeros((0, len(MDA_INPUT_NAMES)))
+        self._outputs = np.zeros((0, len(CATALOGUE_OUTPUTS)))
+        self._surrogate: Optional[om.KrigingSurrogate] = None
+        self._catalogue_time = 0.0
+
+    @property
+    def training_points(self) -> int:
+        """
+        The number of aircraft the surrogate is fitted on.
+        """
+        return self._inputs.shape[0]
+
+    def set_reference(self, reference: str):
+        """
+        Changes the reference aircraft, only the aircraft sized from it are
+        used to fit the surrogate.
+
+        :param reference: the name of the reference aircraft.
+        """
+        if reference != self.reference:
+            self.reference = reference
+            self._load_catalogue()
+
+    def add(self, inputs: Dict[str, float], outputs: Dict[str, float]):
+        """
+        Refits the surrogate with a newly converged aircraft, once it is added
+        to the catalogue. The catalogue is read again, as other sessions may
+        have added aircraft to it since it was last read.
+
+        :param inputs: the MDA inputs, by name.
+        :param outputs: the catalogue outputs, by name.
+        """
+        self._load_catalogue()
+
+    def predict(self, inputs: Dict[str, float]) -> Optional[Dict[str, float]]:
+        """
+        Predicts the catalogue outputs for the given inputs.
+
+        :param inputs: the MDA inputs, by name.
+        :return: the predicted outputs by name, or None if there are not
+            enough converged aircraft yet.
+        """
+        # Other sessions may have added aircraft to the catalogue
+        if self.catalogue.modification_time() != self._catalogue_time:
+            self._load_catalogue()
+
+        if self._surrogate is None:
+            return None
+
+        x = np.array([[float(inputs[name]) for name in MDA_INPUT_NAMES]])
+        y = self._surrogate.predict(x)[0]
+
+        return dict(zip(CATALOGUE_OUTPUTS, y))
+
+    def _load_catalogue(self):
+        self._catalogue_time = self.catalogue.modification_time()
+        self._inputs, self._outputs = self.catalogue.read(self.reference)
+        self._fit()
+
+    def _fit(self):
+        """
+        Fits the surrogate on the most recent distinct aircraft.
+        """
+        # Identical inputs would make the kriging matrix singular, only the
+        # most recent results are kept.
+        _, last_indices = np.unique(self._inputs[::-1], axis=0, return_index=True)
+        indices = np.sort(len(self._inputs) - 1 - last_indices)[-MAX_TRAINING_POINTS:]
+
+        if len(indices) < MIN_TRAINING_POINTS:
+            self._surrogate = None
+            return
+
+        surrogate = om.KrigingSurrogate()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                surrogate.train(self._inputs[indices], self._outputs[indices])
+        except (ValueError, np.linalg.LinAlgError) as error:
+            _LOGGER.warning("Could not fit the surrogate preview: %s", error)
+            self._surrogate = None
+            return
+
+        self._surrogate = surrogate
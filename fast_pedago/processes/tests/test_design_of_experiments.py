@@ -0,0 +1,76 @@
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.design_of_experiments import (
+    DOE_METHODS,
+    FULL_FACTORIAL,
+    LATIN_HYPERCUBE,
+    generate_cases,
+    is_solver_converged,
+)
+
+
+BOUNDS = {"n_pax": (100, 200), "wing_aspect_ratio": (8.0, 12.0)}
+
+# Iterations of Gauss-Seidel for the coupled problem to converge
+CONVERGENCE_ITERATIONS = 12
+
+
+@pytest.mark.parametrize("method", DOE_METHODS)
+def test_generate_cases(method):
+    cases = generate_cases(method, BOUNDS, 4, seed=1)
+
+    assert len(cases) == (16 if method == FULL_FACTORIAL else 4)
+    for case in cases:
+        assert sorted(case) == sorted(BOUNDS)
+        assert isinstance(case["n_pax"], int)
+        for name, (lower, upper) in BOUNDS.items():
+            assert lower <= case[name] <= upper
+
+    # The same seed gives the same cases, for a DOE to be resumed
+    assert generate_cases(method, BOUNDS, 4, seed=1) == cases
+
+
+def test_generate_unknown_method():
+    with pytest.raises(ValueError):
+        generate_cases("Unknown", BOUNDS, 4)
+
+
+def test_latin_hypercube_strata():
+    cases = generate_cases(LATIN_HYPERCUBE, BOUNDS, 8)
+    aspect_ratios = np.array([case["wing_aspect_ratio"] for case in cases])
+
+    # One case in each eighth of the range
+    strata = np.floor((aspect_ratios - 8.0) / 0.5).astype(int)
+    assert sorted(strata) == list(range(8))
+
+
+def _run_coupled_problem(maxiter: int) -> om.Problem:
+    problem = om.Problem()
+    model = problem.model
+    model.add_subsystem("first", om.ExecComp("y1 = 0.5 * y2 + 1.0"), promotes=["*"])
+    model.add_subsystem("second", om.ExecComp("y2 = 0.5 * y1 + 1.0"), promotes=["*"])
+    model.nonlinear_solver = om.NonlinearBlockGS(maxiter=maxiter, rtol=1e-6)
+    model.nonlinear_solver.options["iprint"] = -1
+
+    problem.setup()
+    problem.run_model()
+    return problem
+
+
+@pytest.mark.parametrize(
+    "maxiter, is_converged",
+    [
+        (CONVERGENCE_ITERATIONS + 10, True),
+        (CONVERGENCE_ITERATIONS, True),
+        (CONVERGENCE_ITERATIONS - 1, False),
+    ],
+)
+def test_is_solver_converged(maxiter, is_converged):
+    # The solver only keeps a weak reference to its system, the problem is kept
+    problem = _run_coupled_problem(maxiter)
+    solver = problem.model.nonlinear_solver
+
+    assert solver._iter_count == min(maxiter, CONVERGENCE_ITERATIONS)
+    assert is_solver_converged(solver) is is_converged
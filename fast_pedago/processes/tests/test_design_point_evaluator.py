@@ -0,0 +1,76 @@
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.design_point_evaluator import (
+    DesignPointEvaluator,
+    FEASIBILITY_TOLERANCE,
+)
+
+
+class Paraboloid(om.ExplicitComponent):
+    """
+    A paraboloid, whose evaluation fails for x above a limit.
+    """
+
+    def setup(self):
+        self.add_input("x", val=0.0)
+        self.add_input("y", val=0.0)
+        self.add_output("f", val=0.0)
+        self.add_output("g", val=0.0)
+
+    def compute(self, inputs, outputs):
+        if inputs["x"] > 8.0:
+            raise om.AnalysisError("No convergence")
+        outputs["f"] = (inputs["x"] - 3.0) ** 2 + (inputs["y"] + 4.0) ** 2
+        outputs["g"] = inputs["x"] + inputs["y"]
+
+
+@pytest.fixture
+def evaluator():
+    problem = om.Problem()
+    problem.model.add_subsystem("paraboloid", Paraboloid(), promotes=["*"])
+    problem.setup()
+
+    return DesignPointEvaluator(
+        problem,
+        design_variables=[
+            dict(name="x", lower=-10.0, upper=10.0),
+            dict(name="y", lower=-10.0, upper=10.0),
+        ],
+        objective=dict(name="f", scaler=0.1),
+        constraints=[dict(name="g", lower=-2.0, upper=1.0)],
+    )
+
+
+def test_evaluate(evaluator):
+    objective, margins = evaluator.evaluate(np.array([1.0, 2.0]))
+
+    assert objective == pytest.approx(4.0)
+    assert margins == pytest.approx([-2.0])
+    assert evaluator.get_design_point() == pytest.approx([1.0, 2.0])
+
+    assert evaluator.evaluate(np.array([9.0, 0.0])) is None
+    assert evaluator.evaluations == 2
+
+
+def test_rank():
+    rank = DesignPointEvaluator.rank
+
+    # Feasible points by objective, then the other ones by violation
+    feasible = rank(2.0, np.array([0.5, 0.0]))
+    better_feasible = rank(1.0, np.array([0.1, 0.2]))
+    infeasible = rank(0.5, np.array([-0.1, 1.0]))
+    more_infeasible = rank(0.0, np.array([-0.1, -0.2]))
+
+    assert sorted([more_infeasible, feasible, infeasible, better_feasible]) == [
+        better_feasible,
+        feasible,
+        infeasible,
+        more_infeasible,
+    ]
+
+    # A violation within the tolerance is feasible
+    assert rank(1.0, np.array([-0.1 * FEASIBILITY_TOLERANCE])) < feasible
+    # Without constraint, the objective alone ranks the points
+    assert rank(1.0, np.array([])) < rank(2.0, np.array([]))
@@ -0,0 +1,102 @@
+import sqlite3
+
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.evaluation_cache import (
+    CACHE_TABLE,
+    KEY_DECIMALS,
+    EvaluationCache,
+)
+from fast_pedago.processes.parallel_gradient_optimizer import FINITE_DIFFERENCE_STEP
+
+
+def _problem(cache: EvaluationCache) -> om.Problem:
+    problem = om.Problem()
+    problem.model.add_subsystem(
+        "paraboloid",
+        om.ExecComp("f = (x - 3.0) ** 2 + (y[0] + 4.0) ** 2 + y[1]", y=np.zeros(2)),
+        promotes=["*"],
+    )
+    problem.model.add_design_var("x", lower=-10.0, upper=10.0)
+    problem.model.add_design_var("y", lower=-10.0, upper=10.0)
+    problem.model.add_objective("f")
+    problem.setup()
+    cache.install(problem)
+    return problem
+
+
+def _run(problem: om.Problem, x: float, y) -> float:
+    problem.set_val("x", x)
+    problem.set_val("y", y)
+    problem.run_model()
+    return problem.get_val("f")[0]
+
+
+def test_same_point_restored():
+    cache = EvaluationCache()
+    problem = _problem(cache)
+
+    assert _run(problem, 1.0, [2.0, 0.5]) == pytest.approx(40.5)
+    _run(problem, 0.0, [0.0, 0.0])
+    assert cache.misses == 2
+
+    # The outputs of the first point are restored, not left from the last run
+    assert _run(problem, 1.0, [2.0, 0.5]) == pytest.approx(40.5)
+    assert (cache.hits, cache.misses) == (1, 2)
+    assert cache.is_last_evaluation_cached
+
+
+def test_keys():
+    cache = EvaluationCache()
+    problem = _problem(cache)
+    _run(problem, 1.0, [2.0, 0.5])
+
+    # Differences below the rounding of the keys are the same point
+    _run(problem, 1.0 + 0.1 ** (KEY_DECIMALS + 2), [2.0, 0.5])
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Finite difference perturbations of each component are other points
+    step = FINITE_DIFFERENCE_STEP * 20.0
+    _run(problem, 1.0 + step, [2.0, 0.5])
+    _run(problem, 1.0, [2.0 + step, 0.5])
+    _run(problem, 1.0, [2.0, 0.5 + step])
+    assert (cache.hits, cache.misses) == (1, 4)
+    assert not cache.is_last_evaluation_cached
+
+
+def test_least_recently_used_dropped():
+    cache = EvaluationCache(max_size=2)
+    problem = _problem(cache)
+    _run(problem, 1.0, [0.0, 0.0])
+    _run(problem, 2.0, [0.0, 0.0])
+
+    # The first point is used again, the second one is dropped for the third
+    _run(problem, 1.0, [0.0, 0.0])
+    _run(problem, 3.0, [0.0, 0.0])
+    _run(problem, 1.0, [0.0, 0.0])
+    assert (cache.hits, cache.misses) == (2, 3)
+
+    _run(problem, 2.0, [0.0, 0.0])
+    assert (cache.hits, cache.misses) == (2, 4)
+
+
+def test_disabled(tmp_path):
+    cache = EvaluationCache()
+    problem = _problem(cache)
+    _run(problem, 1.0, [0.0, 0.0])
+
+    with cache.disabled():
+        _run(problem, 1.0, [0.0, 0.0])
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert not cache.is_last_evaluation_cached
+
+    database_file_path = tmp_path / "cases.sql"
+    cache.write(database_file_path)
+    connection = sqlite3.connect(str(database_file_path))
+    try:
+        rows = connection.execute("SELECT * FROM " + CACHE_TABLE).fetchall()
+    finally:
+        connection.close()
+    assert rows == [(0, 1, cache.max_size)]
@@ -0,0 +1,173 @@
+import multiprocessing
+import os
+
+from threading import Thread
+from time import sleep
+
+import pytest
+
+from fast_pedago.processes import job_server
+from fast_pedago.processes.job_server import (
+    JobServerClient,
+    SlotScheduler,
+    run_job_server,
+)
+
+
+# Short lease and periods for the tests not to wait
+LEASE_DURATION = 0.5
+PERIOD = 0.05
+
+# Time (in s) after which a slot that should be granted is considered not to be
+TIMEOUT = 5.0
+
+
+@pytest.fixture(autouse=True)
+def short_lease(monkeypatch):
+    monkeypatch.setattr(job_server, "SLOT_LEASE_DURATION", LEASE_DURATION)
+    monkeypatch.setattr(job_server, "HEARTBEAT_PERIOD", PERIOD)
+    monkeypatch.setattr(job_server, "WAIT_PERIOD", PERIOD)
+
+
+def _acquire_in_thread(scheduler: SlotScheduler, session_id: str, granted: list):
+    thread = Thread(
+        target=lambda: granted.append((session_id, scheduler.acquire(session_id))),
+        daemon=True,
+    )
+    thread.start()
+    return thread
+
+
+def _wait_for(condition):
+    for _ in range(int(TIMEOUT / PERIOD)):
+        if condition():
+            return True
+        sleep(PERIOD)
+    return False
+
+
+def test_acquire_release():
+    scheduler = SlotScheduler(2)
+
+    first_ticket = scheduler.acquire("first")
+    scheduler.acquire("second")
+    assert scheduler.status() == {"slots": 2, "running": 2, "waiting": 0}
+
+    granted = []
+    _acquire_in_thread(scheduler, "third", granted)
+    assert _wait_for(lambda: scheduler.status()["waiting"] == 1)
+
+    scheduler.release(first_ticket)
+    assert _wait_for(lambda: granted)
+    assert scheduler.status() == {"slots": 2, "running": 2, "waiting": 0}
+
+
+def test_acquire_free():
+    scheduler = SlotScheduler(3)
+    ticket = scheduler.acquire("first")
+
+    # Capped by the free slots
+    tickets = scheduler.acquire_free(4)
+    assert len(tickets) == 2
+    assert scheduler.acquire_free(1) == []
+
+    # Not granted while a session waits for a slot
+    granted = []
+    scheduler.release(ticket)
+    _acquire_in_thread(scheduler, "second", granted)
+    _acquire_in_thread(scheduler, "third", granted)
+    assert _wait_for(lambda: scheduler.status()["waiting"] == 1)
+    assert scheduler.acquire_free(1) == []
+
+    scheduler.release(tickets[0])
+    assert _wait_for(lambda: len(granted) == 2)
+
+
+def test_sessions_served_in_turn():
+    scheduler = SlotScheduler(1)
+    ticket = scheduler.acquire("holder")
+
+    # The first session queues two requests before the second one
+    granted = []
+    for session_id in ["first", "first", "second"]:
+        _acquire_in_thread(scheduler, session_id, granted)
+        assert _wait_for(lambda: len(granted) == 0 and scheduler.status()["waiting"])
+        sleep(PERIOD)
+
+    for index in range(3):
+        scheduler.release(ticket)
+        assert _wait_for(lambda: len(granted) == index + 1)
+        ticket = granted[-1][1]
+
+    assert [session_id for session_id, _ in granted] == ["first", "second", "first"]
+
+
+def test_lease_expires_if_not_renewed():
+    scheduler = SlotScheduler(1)
+    ticket = scheduler.acquire("dead")
+
+    granted = []
+    _acquire_in_thread(scheduler, "alive", granted)
+
+    assert _wait_for(lambda: granted)
+    assert not scheduler.renew([ticket])
+
+
+def test_renewed_lease_is_kept():
+    scheduler = SlotScheduler(1)
+    ticket = scheduler.acquire("holder")
+
+    granted = []
+    _acquire_in_thread(scheduler, "other", granted)
+    for _ in range(int(3.0 * LEASE_DURATION / PERIOD)):
+        assert scheduler.renew([ticket])
+        sleep(PERIOD)
+    assert not granted
+
+    scheduler.release(ticket)
+    assert _wait_for(lambda: granted)
+
+
+def _use_slot(client: JobServerClient, session_id: str, granted: list):
+    with client.slot(session_id):
+        granted.append(session_id)
+
+
+def _hold_slot_and_die(address, authkey):
+    client = JobServerClient(address, authkey)
+    with client.slot("dead"):
+        os._exit(0)
+
+
+def test_slot_of_dead_client_is_granted_again():
+    # Forked for the short lease to be the one of the server too
+    context = multiprocessing.get_context("fork")
+    authkey = b"test"
+    address_queue = context.Queue()
+    server = context.Process(
+        target=run_job_server, args=(1, authkey, address_queue), daemon=True
+    )
+    server.start()
+    try:
+        address = address_queue.get(timeout=TIMEOUT)
+
+        client = context.Process(target=_hold_slot_and_die, args=(address, authkey))
+        client.start()
+        client.join(TIMEOUT)
+
+        # Without the lease, the slot would never be released
+        granted = []
+        other_client = JobServerClient(address, authkey)
+        with JobServerClient(address, authkey).slot("alive"):
+            Thread(
+                target=_use_slot, args=(other_client, "other", granted), daemon=True
+            ).start()
+
+            # The heartbeat keeps the slot of the client alive
+            sleep(3.0 * LEASE_DURATION)
+            assert not granted
+            assert other_client.status()["waiting"] == 1
+
+        assert _wait_for(lambda: granted)
+    finally:
+        server.kill()
@@ -0,0 +1,81 @@
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.mdo_checkpoint import MDOCheckpoint
+from fast_pedago.processes.recording_profiles import (
+    MINIMAL_PROFILE,
+    get_driver_recording_options,
+)
+
+
+def _mdo_problem(recorder_file_path=None) -> om.Problem:
+    """
+    :return: the minimization of a paraboloid, whose driver is recorded to be
+        resumed if a recorder file is given.
+    """
+    problem = om.Problem()
+    problem.model.add_subsystem(
+        "paraboloid", om.ExecComp("f = (x - 3.0) ** 2 + 1.0"), promotes=["*"]
+    )
+    problem.model.add_design_var("x", lower=-10.0, upper=10.0)
+    problem.model.add_objective("f")
+    problem.driver = om.ScipyOptimizeDriver(optimizer="SLSQP", tol=1e-8)
+
+    if recorder_file_path is not None:
+        problem.driver.add_recorder(om.SqliteRecorder(recorder_file_path))
+        problem.driver.recording_options.update(
+            get_driver_recording_options(MINIMAL_PROFILE, is_resumable=True)
+        )
+
+    problem.setup()
+    problem.set_val("x", 0.0)
+    problem.final_setup()
+    return problem
+
+
+@pytest.fixture
+def input_file_path(tmp_path):
+    input_file_path = tmp_path / "inputs.xml"
+    input_file_path.write_text("<FASTOAD_model/>")
+    return input_file_path
+
+
+@pytest.fixture
+def recorder_file_path(tmp_path, input_file_path):
+    recorder_file_path = tmp_path / "cases.sql"
+    problem = _mdo_problem(recorder_file_path)
+    MDOCheckpoint.write_input_file_hash(recorder_file_path, input_file_path)
+    problem.run_driver()
+    problem.cleanup()
+    return recorder_file_path
+
+
+def test_resume(recorder_file_path, input_file_path):
+    checkpoint = MDOCheckpoint(recorder_file_path)
+    problem = _mdo_problem()
+
+    assert checkpoint.install(problem, input_file_path)
+
+    problem.run_driver()
+
+    assert checkpoint.replayed > 0
+    assert problem.get_val("x") == pytest.approx(3.0, abs=1e-4)
+
+
+def test_other_input_file(recorder_file_path, input_file_path):
+    checkpoint = MDOCheckpoint(recorder_file_path)
+    input_file_path.write_text("<FASTOAD_model><data/></FASTOAD_model>")
+
+    assert not checkpoint.install(_mdo_problem(), input_file_path)
+
+
+def test_not_resumable(tmp_path, input_file_path):
+    # Recorded without the hash of the input file
+    recorder_file_path = tmp_path / "cases.sql"
+    problem = _mdo_problem(recorder_file_path)
+    problem.run_driver()
+    problem.cleanup()
+
+    assert not MDOCheckpoint(recorder_file_path).install(
+        _mdo_problem(), input_file_path
+    )
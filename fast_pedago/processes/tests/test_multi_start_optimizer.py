@@ -0,0 +1,49 @@
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.design_point_evaluator import DesignPointEvaluator
+from fast_pedago.processes.multi_start_optimizer import MultiStartOptimizer
+
+
+def _evaluator() -> DesignPointEvaluator:
+    problem = om.Problem()
+    problem.model.add_subsystem(
+        "paraboloid",
+        om.ExecComp("f = (x - 3.0) ** 2 + (y + 4.0) ** 2"),
+        promotes=["*"],
+    )
+    problem.setup()
+
+    evaluator = DesignPointEvaluator(
+        problem,
+        design_variables=[
+            dict(name="x", lower=-10.0, upper=10.0),
+            dict(name="y", lower=0.0, upper=1.0),
+        ],
+        objective=dict(name="f"),
+        constraints=[],
+    )
+    evaluator.set_design_point(np.array([1.0, 0.5]))
+    return evaluator
+
+
+def _starting_points(**kwargs) -> np.ndarray:
+    optimizer = MultiStartOptimizer(
+        _evaluator(), "configuration.yml", "inputs.xml", starts=5, **kwargs
+    )
+    return np.array(optimizer.get_starting_points())
+
+
+def test_starting_points():
+    starting_points = _starting_points()
+
+    # From the current design point, the others inside the bounds
+    assert starting_points.shape == (5, 2)
+    assert starting_points[0] == pytest.approx([1.0, 0.5])
+    assert np.all(starting_points >= [-10.0, 0.0])
+    assert np.all(starting_points <= [10.0, 1.0])
+
+    # The same for the same seed
+    np.testing.assert_array_equal(_starting_points(), starting_points)
+    assert not np.array_equal(_starting_points(seed=1), starting_points)
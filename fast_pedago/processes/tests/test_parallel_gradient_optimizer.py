@@ -0,0 +1,90 @@
+import logging
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes import parallel_gradient_optimizer
+from fast_pedago.processes.design_point_evaluator import DesignPointEvaluator
+from fast_pedago.processes.parallel_gradient_optimizer import (
+    ParallelGradientOptimizer,
+)
+
+
+DESIGN_VARIABLES = [
+    dict(name="x", lower=-10.0, upper=10.0),
+    dict(name="y", lower=-10.0, upper=10.0),
+]
+OBJECTIVE = dict(name="f")
+
+
+class Paraboloid(om.ExplicitComponent):
+    """
+    A paraboloid, whose evaluation fails for x above a limit and for y in a
+    band below its upper bound.
+    """
+
+    def setup(self):
+        self.add_input("x", val=0.0)
+        self.add_input("y", val=0.0)
+        self.add_output("f", val=0.0)
+
+    def compute(self, inputs, outputs):
+        if inputs["x"] > 8.0 or 9.5 < inputs["y"] < 9.8:
+            raise om.AnalysisError("No convergence")
+        outputs["f"] = (inputs["x"] - 3.0) ** 2 + (inputs["y"] + 4.0) ** 2
+
+
+def _evaluator() -> DesignPointEvaluator:
+    problem = om.Problem()
+    problem.model.add_subsystem("paraboloid", Paraboloid(), promotes=["*"])
+    problem.setup()
+
+    return DesignPointEvaluator(problem, DESIGN_VARIABLES, OBJECTIVE, [])
+
+
+def _initialize_worker(*arguments):
+    # The workers are forked, they get the paraboloid instead of an aircraft
+    parallel_gradient_optimizer._worker_evaluator = _evaluator()
+
+
+@pytest.fixture
+def optimizer(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        parallel_gradient_optimizer, "_initialize_worker", _initialize_worker
+    )
+    return ParallelGradientOptimizer(
+        _evaluator(),
+        tmp_path / "configuration.yml",
+        tmp_path / "inputs.xml",
+        workers=3,
+    )
+
+
+def test_gradient_with_failed_perturbations(optimizer, caplog):
+    # The forward perturbation of x fails, the backward one of y too and the
+    # forward one is out of bounds
+    point = optimizer._normalize(np.array([7.9, 9.9]))
+    with ProcessPoolExecutor(
+        max_workers=optimizer.workers, initializer=_initialize_worker
+    ) as optimizer._pool:
+        with caplog.at_level(logging.WARNING):
+            objective_gradient, _ = optimizer._gradient(point)
+
+    assert optimizer._evaluate(point)[0] == pytest.approx(4.9 ** 2 + 13.9 ** 2)
+    # Backward difference, in normalized design variables
+    assert objective_gradient[0] == pytest.approx(20.0 * 2.0 * 4.8)
+    assert objective_gradient[1] == 0.0
+    assert "MDA failed on both sides of y" in caplog.text
+
+
+def test_optimize(optimizer):
+    optimizer.evaluator.set_design_point(np.array([7.9, 0.0]))
+
+    best = optimizer.optimize()
+
+    assert best == pytest.approx([3.0, -4.0], abs=0.1)
+    # The problem is left at the best point
+    assert optimizer.evaluator.get_design_point() == pytest.approx(best)
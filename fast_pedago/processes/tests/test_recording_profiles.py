@@ -0,0 +1,83 @@
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.recording_profiles import (
+    RECORDING_PROFILES,
+    MINIMAL_PROFILE,
+    LIVE_PLOT_PROFILE,
+    FULL_DEBUG_PROFILE,
+    get_driver_recording_options,
+    get_solver_recording_options,
+)
+
+
+def _coupled_problem(recorder_file_path, solver_options: dict) -> om.Problem:
+    """
+    :return: a problem of two coupled components solved by Gauss-Seidel, whose
+        solver is recorded with the given recording options.
+    """
+    problem = om.Problem()
+    model = problem.model
+    model.add_subsystem("first", om.ExecComp("y1 = 0.5 * y2 + 1.0"), promotes=["*"])
+    model.add_subsystem("second", om.ExecComp("y2 = 0.5 * y1 + 1.0"), promotes=["*"])
+    model.nonlinear_solver = om.NonlinearBlockGS(maxiter=50, rtol=1e-10)
+    model.nonlinear_solver.add_recorder(om.SqliteRecorder(recorder_file_path))
+    model.nonlinear_solver.recording_options.update(solver_options)
+
+    problem.setup()
+    return problem
+
+
+@pytest.mark.parametrize("profile", RECORDING_PROFILES)
+def test_options_exist(profile):
+    # Unknown options would raise
+    om.ScipyOptimizeDriver().recording_options.update(
+        get_driver_recording_options(profile, is_resumable=True)
+    )
+    om.NonlinearBlockGS().recording_options.update(
+        get_solver_recording_options(profile, ["y1"])
+    )
+
+
+def test_minimal_solver_profile(tmp_path):
+    recorder_file_path = tmp_path / "cases.sql"
+    problem = _coupled_problem(
+        recorder_file_path, get_solver_recording_options(MINIMAL_PROFILE)
+    )
+    problem.run_model()
+    problem.cleanup()
+
+    reader = om.CaseReader(str(recorder_file_path))
+    cases = [
+        reader.get_case(case_id)
+        for case_id in reader.list_cases("root.nonlinear_solver", out_stream=None)
+    ]
+
+    # Only the relative error, which tells if the MDA converged
+    assert cases
+    assert cases[-1].rel_err < 1e-8 < cases[0].rel_err
+    assert not cases[-1].outputs
+    assert not cases[-1].inputs
+
+
+def test_live_plot_solver_profile():
+    options = get_solver_recording_options(LIVE_PLOT_PROFILE, ["y1", "y2"])
+
+    assert options["record_outputs"]
+    assert options["includes"] == ["y1", "y2"]
+    assert not options["record_solver_residuals"]
+
+
+def test_driver_profiles():
+    minimal_options = get_driver_recording_options(MINIMAL_PROFILE)
+    resumable_options = get_driver_recording_options(MINIMAL_PROFILE, is_resumable=True)
+
+    assert not minimal_options["record_outputs"]
+    assert minimal_options["includes"] == []
+    assert minimal_options["record_objectives"]
+
+    # The outputs are needed to resume the MDO
+    assert resumable_options["record_outputs"]
+    assert resumable_options["includes"] == ["*"]
+
+    assert get_driver_recording_options(FULL_DEBUG_PROFILE)["record_inputs"]
@@ -0,0 +1,92 @@
+from queue import Queue
+
+import numpy as np
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.process_recorder import ProcessRecorder
+from fast_pedago.processes.residual_monitor import (
+    DIVERGED,
+    MIN_ITERATIONS,
+    STAGNATED,
+    MDAAbortedError,
+    ResidualMonitor,
+)
+
+
+RTOL = 1e-6
+MAXITER = 50
+
+
+def _check_all(monitor: ResidualMonitor, relative_errors) -> int:
+    """
+    :return: the number of relative errors checked before the MDA was stopped.
+    """
+    for relative_error in relative_errors:
+        monitor.check(relative_error)
+    return len(monitor.relative_errors)
+
+
+def test_converging():
+    monitor = ResidualMonitor(RTOL, MAXITER)
+
+    # Erratic first iterations, then a fast enough convergence
+    relative_errors = [1.0, 5.0, 0.1, 20.0] + list(0.5 ** np.arange(1, 25))
+    assert _check_all(monitor, relative_errors) == len(relative_errors)
+    assert monitor.status is None
+
+
+@pytest.mark.parametrize(
+    "relative_errors, status, iterations",
+    [
+        # Not finite, at once
+        ([1.0, np.nan], DIVERGED, 2),
+        # Much larger than the best relative error, after the first iterations
+        ([1.0] + list(10.0 ** np.arange(-1, 30)), DIVERGED, MIN_ITERATIONS),
+        # Not decreasing
+        ([1.0] * 30, STAGNATED, 11),
+        # Decreasing too slowly to reach the tolerance in the iterations left
+        (list(0.95 ** np.arange(30)), STAGNATED, 11),
+    ],
+)
+def test_stopped(relative_errors, status, iterations):
+    monitor = ResidualMonitor(RTOL, MAXITER)
+
+    with pytest.raises(MDAAbortedError):
+        _check_all(monitor, relative_errors)
+    assert monitor.status == status
+    assert len(monitor.relative_errors) == iterations
+
+
+def _coupled_problem(factor: float, monitor: ResidualMonitor) -> om.Problem:
+    problem = om.Problem()
+    model = problem.model
+    model.add_subsystem(
+        "first", om.ExecComp("y1 = %g * y2 + 1.0" % factor), promotes=["*"]
+    )
+    model.add_subsystem(
+        "second", om.ExecComp("y2 = %g * y1 + 1.0" % factor), promotes=["*"]
+    )
+    model.nonlinear_solver = om.NonlinearBlockGS(maxiter=MAXITER, rtol=RTOL)
+    model.nonlinear_solver.add_recorder(ProcessRecorder(Queue(), monitor))
+    problem.setup()
+    return problem
+
+
+def test_solver_stopped():
+    monitor = ResidualMonitor(RTOL, MAXITER)
+    problem = _coupled_problem(2.0, monitor)
+
+    with pytest.raises(MDAAbortedError):
+        problem.run_model()
+    assert monitor.status == DIVERGED
+    assert len(monitor.relative_errors) < MAXITER
+
+
+def test_solver_converged():
+    monitor = ResidualMonitor(RTOL, MAXITER)
+    problem = _coupled_problem(0.5, monitor)
+
+    problem.run_model()
+    assert monitor.status is None
+    assert problem.get_val("y1") == pytest.approx([2.0])
@@ -0,0 +1,77 @@
+import multiprocessing
+import os
+
+from time import time
+
+import numpy as np
+
+from fast_pedago.processes.mda_inputs import MDA_INPUT_NAMES
+from fast_pedago.processes.results_catalogue import (
+    CATALOGUE_OUTPUTS,
+    LOCK_TIMEOUT,
+    ResultsCatalogue,
+)
+
+
+PROCESSES = 4
+AIRCRAFT_BY_PROCESS = 10
+
+
+def _add_aircraft(catalogue_file_path, process_index: int):
+    catalogue = ResultsCatalogue(catalogue_file_path)
+    for index in range(AIRCRAFT_BY_PROCESS):
+        value = process_index * AIRCRAFT_BY_PROCESS + index
+        catalogue.add(
+            "reference",
+            {name: value for name in MDA_INPUT_NAMES},
+            {name: value for name in CATALOGUE_OUTPUTS},
+        )
+
+
+def test_add_read(tmp_path):
+    catalogue = ResultsCatalogue(tmp_path / "catalogue.csv")
+    assert catalogue.modification_time() == 0.0
+
+    _add_aircraft(catalogue.catalogue_file_path, 0)
+    catalogue.add(
+        "other",
+        {name: -1.0 for name in MDA_INPUT_NAMES},
+        {name: -1.0 for name in CATALOGUE_OUTPUTS},
+    )
+
+    inputs, outputs = catalogue.read("reference")
+    assert inputs.shape == (AIRCRAFT_BY_PROCESS, len(MDA_INPUT_NAMES))
+    np.testing.assert_array_equal(outputs[:, 0], np.arange(AIRCRAFT_BY_PROCESS))
+    assert catalogue.read("other")[0].shape == (1, len(MDA_INPUT_NAMES))
+    assert catalogue.read("unknown")[0].shape == (0, len(MDA_INPUT_NAMES))
+
+
+def test_add_from_several_processes(tmp_path):
+    catalogue_file_path = tmp_path / "catalogue.csv"
+    processes = [
+        multiprocessing.Process(
+            target=_add_aircraft, args=(catalogue_file_path, process_index)
+        )
+        for process_index in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    # No aircraft lost, a single header line
+    _, outputs = ResultsCatalogue(catalogue_file_path).read("reference")
+    assert sorted(outputs[:, 0]) == list(range(PROCESSES * AIRCRAFT_BY_PROCESS))
+    assert sorted(os.listdir(tmp_path)) == ["catalogue.csv"]
+
+
+def test_stale_lock(tmp_path):
+    # Left by a process that stopped while adding an aircraft
+    lock_file_path = tmp_path / "catalogue.csv.lock"
+    lock_file_path.touch()
+    mtime = time() - 2.0 * LOCK_TIMEOUT
+    os.utime(lock_file_path, (mtime, mtime))
+
+    _add_aircraft(tmp_path / "catalogue.csv", 0)
+
+    assert not lock_file_path.exists()
@@ -0,0 +1,67 @@
+import openmdao.api as om
+import pytest
+
+from fast_pedago.processes.design_point_evaluator import DesignPointEvaluator
+from fast_pedago.processes.surrogate_optimizer import SurrogateOptimizer
+
+
+# The initial points are the starting one and a step on each side along each
+# axis, the last one is evaluated after the best one, at (1, -3)
+INITIAL_EVALUATIONS = 5
+
+
+class FailingEvaluator(DesignPointEvaluator):
+    """
+    An evaluator whose MDA fails for the last initial point, leaving the
+    problem at the failed point.
+    """
+
+    def evaluate(self, design_point):
+        if self.evaluations == INITIAL_EVALUATIONS - 1:
+            self.set_design_point(design_point)
+            self.evaluations += 1
+            return None
+        return super().evaluate(design_point)
+
+
+def _evaluator(evaluator_class=DesignPointEvaluator) -> DesignPointEvaluator:
+    problem = om.Problem()
+    problem.model.add_subsystem(
+        "paraboloid",
+        om.ExecComp("f = (x - 3.0) ** 2 + (y + 4.0) ** 2 + 1.0"),
+        promotes=["*"],
+    )
+    problem.setup()
+
+    return evaluator_class(
+        problem,
+        design_variables=[
+            dict(name="x", lower=-10.0, upper=10.0),
+            dict(name="y", lower=-10.0, upper=10.0),
+        ],
+        objective=dict(name="f"),
+        constraints=[],
+    )
+
+
+def test_problem_left_at_best_point_after_failed_mda():
+    evaluator = _evaluator(FailingEvaluator)
+
+    best = SurrogateOptimizer(evaluator, max_evaluations=INITIAL_EVALUATIONS).optimize()
+
+    # The best point is evaluated again after the failed MDA
+    assert best == pytest.approx([1.0, -3.0])
+    assert evaluator.evaluations == INITIAL_EVALUATIONS + 1
+    assert evaluator.get_design_point() == pytest.approx(best)
+    assert evaluator.problem.get_val("f").item() == pytest.approx(
+        (best[0] - 3.0) ** 2 + (best[1] + 4.0) ** 2 + 1.0
+    )
+
+
+def test_optimize():
+    evaluator = _evaluator()
+
+    best = SurrogateOptimizer(evaluator, max_evaluations=20).optimize()
+
+    assert best == pytest.approx([3.0, -4.0], abs=0.1)
+    assert evaluator.get_design_point() == pytest.approx(best)
@@ -0,0 +1,29 @@
+import pytest
+
+from fast_pedago.processes.mda_inputs import MDA_INPUT_NAMES
+from fast_pedago.processes.results_catalogue import CATALOGUE_OUTPUTS, ResultsCatalogue
+from fast_pedago.processes.surrogate_preview import SurrogatePreview
+
+
+def _aircraft(value: float):
+    inputs = {name: value * (index + 1) for index, name in enumerate(MDA_INPUT_NAMES)}
+    outputs = {name: value for name in CATALOGUE_OUTPUTS}
+    return inputs, outputs
+
+
+def test_add_loads_other_sessions(tmp_path):
+    catalogue = ResultsCatalogue(tmp_path / "catalogue.csv")
+    other_session_catalogue = ResultsCatalogue(tmp_path / "catalogue.csv")
+    preview = SurrogatePreview(catalogue)
+    preview.set_reference("reference")
+    assert preview.predict(_aircraft(1.0)[0]) is None
+
+    # Another session adds aircraft, then this one adds its own
+    for value in [1.0, 2.0, 3.0]:
+        other_session_catalogue.add("reference", *_aircraft(value))
+    inputs, outputs = _aircraft(4.0)
+    catalogue.add("reference", inputs, outputs)
+    preview.add(inputs, outputs)
+
+    assert preview.training_points == 4
+    assert preview.predict(_aircraft(2.0)[0])["MTOW"] == pytest.approx(2.0, rel=1e-2)
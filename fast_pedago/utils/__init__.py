@@ -2,6 +2,8 @@ from .functions import (
     _image_from_path,
     _extract_objective,
     _extract_residuals,
+    _read_variables,
+    _write_variables,
 )
 
 from .path_manager import PathManager
@@ -11,6 +13,11 @@ from .paths import (
     OUTPUT_FILE_SUFFIX,
     FLIGHT_DATA_FILE_SUFFIX,
     RECORDER_FILE_SUFFIX,
+    TIMINGS_FILE_SUFFIX,
+    PROFILE_FILE_SUFFIX,
+    PARETO_FILE_SUFFIX,
+    DOE_FILE_SUFFIX,
+    VARIABLES_FILE_EXTENSION,
     MDA_FILE_SUFFIX,
     MDO_FILE_SUFFIX,
     MDA,
@@ -22,8 +29,13 @@ from .paths import (
     OUTPUTS_DIRECTORY,
     RESOURCES_DIRECTORY,
     TUTORIAL_DIRECTORY,
+    CACHE_DIRECTORY_ENV,
+    CACHE_DIRECTORY,
+    GENERATED_INPUTS_DIRECTORY,
+    DIAGRAMS_DIRECTORY,
     MDA_CONFIGURATION_FILE,
     MDO_CONFIGURATION_FILE,
+    RESULTS_CATALOGUE_FILE,
     REFERENCE_AIRCRAFT,
     DEFAULT_PROCESS_NAME,
 )
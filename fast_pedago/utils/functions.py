@@ -2,16 +2,35 @@
 Utility functions to use punctually in the code.
 """
 
-from typing import Union
+import io
+import json
+import logging
+import os
+import re
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
 
 from os import PathLike
 from pathlib import Path
+from xml.etree import ElementTree
 
-import openmdao.api as om
+import numpy as np
 
 import ipywidgets as widgets
 import ipyvuetify as v
 
+from .paths import VARIABLES_FILE_EXTENSION
+
+
+_LOGGER = logging.getLogger(__name__)
+
+# Screen height the heights in vh are converted to pixels with, and ratio of
+# device pixels to CSS pixels of high density screens. Images are downscaled
+# to the height they are displayed with on such a screen.
+REFERENCE_SCREEN_HEIGHT = 1080
+PIXEL_RATIO = 2
+
 
 def _image_from_path(file_path: str, max_height: str = "52px") -> v.Html:
     """
@@ -23,11 +42,12 @@ def _image_from_path(file_path: str, max_height: str = "52px") -> v.Html:
     :return: an Image widget
     """
 
-    file = open(file_path, "rb")
     # Remove the "." in the extension string
     file_extension = Path(file_path).suffix.replace(".", "")
 
-    image = file.read()
+    # The modification time is part of the cache key for regenerated images
+    # (N2, XDSM) to be read again.
+    image = _read_image(str(file_path), Path(file_path).stat().st_mtime, max_height)
     # Encapsulate the image in a "a" tag to be able to provide a "click" event and links
     image_widget = v.Html(
         tag="a",
@@ -46,6 +66,63 @@ def _image_from_path(file_path: str, max_height: str = "52px") -> v.Html:
     return image_widget
 
 
+@lru_cache(maxsize=None)
+def _read_image(file_path: str, modification_time: float, max_height: str) -> bytes:
+    """
+    Reads an image, downscaled to the height it is displayed with if Pillow is
+    installed. Images are cached for the whole process, so that each session
+    does not read them again.
+
+    :param file_path: path to the picture.
+    :param modification_time: modification time of the picture.
+    :param max_height: height the picture is displayed with, in px or vh.
+    :return: the content of the picture file.
+    """
+    with open(file_path, "rb") as file:
+        image = file.read()
+
+    target_height = _to_device_pixels(max_height)
+    if target_height is None:
+        return image
+
+    try:
+        from PIL import Image
+    except ImportError:
+        return image
+
+    with Image.open(io.BytesIO(image)) as picture:
+        # Animations are kept as they are
+        if getattr(picture, "is_animated", False) or picture.height <= target_height:
+            return image
+
+        image_format = picture.format
+        width = max(1, round(picture.width * target_height / picture.height))
+        resized_picture = picture.resize((width, target_height), Image.LANCZOS)
+
+    buffer = io.BytesIO()
+    resized_picture.save(buffer, format=image_format, optimize=True)
+    resized_image = buffer.getvalue()
+
+    return resized_image if len(resized_image) < len(image) else image
+
+
+def _to_device_pixels(height: str) -> Optional[int]:
+    """
+    :param height: a CSS height, in px or vh.
+    :return: the height in pixels of a high density screen, None if the unit is
+        not handled.
+    """
+    match = re.fullmatch(r"\s*([0-9.]+)\s*(px|vh)\s*", height)
+    if match is None:
+        return None
+
+    value = float(match.group(1))
+    if match.group(2) == "vh":
+        value *= REFERENCE_SCREEN_HEIGHT / 100.0
+
+    return int(round(value * PIXEL_RATIO))
+
+
 def _extract_residuals(recorder_database_file_path: Union[str, PathLike]) -> list:
     """
     From the file path to a recorder data base, extract the value of the
@@ -55,6 +132,8 @@ def _extract_residuals(recorder_database_file_path: Union[str, PathLike]) -> lis
     :return: two arrays containing the iterations and the associated values of
         the relative error.
     """
+    # Imported here to keep the import of the utilities light
+    import openmdao.api as om
 
     case_reader = om.CaseReader(str(recorder_database_file_path))
 
@@ -81,6 +160,8 @@ def _extract_objective(recorder_database_file_path: Union[str, PathLike]) -> lis
     :return: an array containing the iterations and the associated values of
         the objective.
     """
+    # Imported here to keep the import of the utilities light
+    import openmdao.api as om
 
     case_reader = om.CaseReader(str(recorder_database_file_path))
 
@@ -99,3 +180,160 @@ def _extract_objective(recorder_database_file_path: Union[str, PathLike]) -> lis
     )
 
     return iterations, objective
+
+
+def _variables_file_path(output_file_path: Union[str, PathLike]) -> Path:
+    """
+    :param output_file_path: path to an output file.
+    :return: path to the copy of its variables.
+    """
+    return Path(output_file_path).with_suffix(VARIABLES_FILE_EXTENSION)
+
+
+def _write_variables(output_file_path: Union[str, PathLike], variables):
+    """
+    Writes a copy of the variables of an output file next to it, as JSON
+    [value, units] by name, which is much faster to read than the .xml file.
+    JSON is used rather than pickle so that reading a file found next to an
+    output file can not execute code.
+
+    :param output_file_path: path to the output file the variables are the
+        ones of.
+    :param variables: the VariableList of the output file.
+    """
+    variables_file_path = _variables_file_path(output_file_path)
+    content = {
+        variable.name: [np.asarray(variable.value).tolist(), variable.units]
+        for variable in variables
+    }
+
+    # Written then renamed, so that a partial file is never read
+    temporary_file_path = variables_file_path.with_name(
+        variables_file_path.name + "." + str(os.getpid())
+    )
+    with open(temporary_file_path, "w") as variables_file:
+        json.dump(content, variables_file)
+    os.replace(temporary_file_path, variables_file_path)
+
+
+def _read_variables(
+    output_file_path: Union[str, PathLike],
+    file_formatter=None,
+    names: Optional[List[str]] = None,
+):
+    """
+    Reads the variables of an output file, from its JSON copy if there is
+    one more recent than the file. Else, the .xml file is read and, if all the
+    variables are read, its copy is written for the next reads.
+
+    :param output_file_path: path to the output file.
+    :param file_formatter: the formatter that defines the format of the file,
+        the JSON copy and the partial reading are only used for the default
+        format.
+    :param names: the names of the variables to read, all of them if None.
+        Only those are parsed from the .xml file, which stops as soon as they
+        are all found.
+    :return: the VariableList of the output file.
+    """
+    # Imported here as FAST-OAD is heavy to import
+    from fastoad.io import VariableIO
+
+    if file_formatter is not None:
+        return VariableIO(output_file_path, file_formatter).read()
+
+    variables_file_path = _variables_file_path(output_file_path)
+    try:
+        if (
+            variables_file_path.stat().st_mtime
+            >= Path(output_file_path).stat().st_mtime
+        ):
+            with open(variables_file_path) as variables_file:
+                content = json.load(variables_file)
+            if names is not None:
+                content = {name: content[name] for name in names if name in content}
+            return _to_variable_list(content)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, TypeError) as error:
+        _LOGGER.warning("Could not read %s: %s", variables_file_path, error)
+
+    if names is not None:
+        return _to_variable_list(_parse_variables(output_file_path, names))
+
+    variables = VariableIO(output_file_path).read()
+    try:
+        _write_variables(output_file_path, variables)
+    except (OSError, TypeError, ValueError) as error:
+        _LOGGER.warning("Could not write %s: %s", variables_file_path, error)
+
+    return variables
+
+
+def _parse_variables(
+    output_file_path: Union[str, PathLike], names: List[str]
+) -> Dict[str, tuple]:
+    """
+    Parses some variables of an output file in FAST-OAD format, where each
+    section of the name of a variable is an element, without building the
+    whole tree.
+
+    :param output_file_path: path to the output file.
+    :param names: the names of the variables to parse.
+    :return: the (value, units) of the variables found, by name.
+    """
+    missing_names = set(names)
+    content = {}
+    path = []
+
+    for event, element in ElementTree.iterparse(
+        str(output_file_path), events=("start", "end")
+    ):
+        if event == "start":
+            path.append(element.tag)
+            continue
+
+        # The root element is not part of the names. A variable can also be
+        # the parent of other ones (a value and its target for instance).
+        name = ":".join(path[1:])
+        path.pop()
+        if name in missing_names:
+            content[name] = (_parse_value(element.text), element.get("units"))
+            missing_names.remove(name)
+            if not missing_names:
+                break
+        if len(element) == 0:
+            element.clear()
+
+    return content
+
+
+def _parse_value(text: Optional[str]) -> list:
+    """
+    :param text: the text of a variable element, a number or a list of numbers.
+    :return: the value of the variable, as a list.
+    """
+    value = []
+    for item in re.split(r"[\s,]+", (text or "").strip().strip("[]")):
+        if not item:
+            continue
+        try:
+            value.append(float(item))
+        except ValueError:
+            value.append(item)
+    return value
+
+
+def _to_variable_list(content: Dict[str, tuple]):
+    """
+    :param content: the (value, units) of variables, by name.
+    :return: the VariableList of the variables.
+    """
+    # Imported here as FAST-OAD is heavy to import
+    from fastoad.openmdao.variables import Variable, VariableList
+
+    return VariableList(
+        [
+            Variable(name, val=value, units=units)
+            for name, (value, units) in content.items()
+        ]
+    )
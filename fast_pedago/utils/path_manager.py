@@ -1,13 +1,13 @@
+import hashlib
+import os
 from pathlib import Path
 import shutil
 
+from importlib.metadata import version, PackageNotFoundError
 from typing import List
 
-import fastoad.api as oad
-
 from fast_pedago import (
     configuration,
-    gui,
     source_data_files,
 )
 
@@ -18,6 +18,9 @@ from .paths import (
     OUTPUTS_DIRECTORY,
     RESOURCES_DIRECTORY,
     TUTORIAL_DIRECTORY,
+    CACHE_DIRECTORY_ENV,
+    CACHE_DIRECTORY,
+    GENERATED_INPUTS_DIRECTORY,
     MDA_CONFIGURATION_FILE,
     MDO_CONFIGURATION_FILE,
     REFERENCE_AIRCRAFT,
@@ -55,6 +58,8 @@ class PathManager:
     resources_directory_path = ""
     tutorial_directory_path = ""
 
+    cache_directory_path = ""
+
     @staticmethod
     def _build_working_directory():
         """
@@ -95,17 +100,86 @@ class PathManager:
         PathManager.reference_input_file_path = (
             PathManager.working_directory_path
             / INPUTS_DIRECTORY
-            / PathManager.reference_input_file_path
+            / PathManager.reference_input_file_name
         )
 
         # Technically, we could simply copy the reference file because I
         # already did the input generation but to be more generic we will
-        # do it like this which will make it longer on the first execution.
+        # do it like this. The generation being long, generated files are
+        # cached for all the working directories.
         if not Path.exists(PathManager.reference_input_file_path):
-            oad.generate_inputs(
-                configuration_file_path=PathManager.mda_configuration_file_path,
-                source_data_path=Path(source_data_files.__file__).parent
+            PathManager._generate_input_file(
+                PathManager.mda_configuration_file_path,
+                Path(source_data_files.__file__).parent
                 / PathManager.reference_source_file_name,
+                PathManager.reference_input_file_path,
+            )
+
+    @staticmethod
+    def _generate_input_file(
+        configuration_file_path: Path,
+        source_data_file_path: Path,
+        input_file_path: Path,
+    ):
+        """
+        Generates an input file, or copies it from the cache if it was already
+        generated with the same configuration and source data file contents.
+
+        :param configuration_file_path: the configuration file, whose input file
+            must be input_file_path.
+        :param source_data_file_path: the source data file.
+        :param input_file_path: the input file to generate.
+        """
+        content_hash = hashlib.sha256()
+        for file_path in (configuration_file_path, source_data_file_path):
+            content_hash.update(Path(file_path).read_bytes())
+        # The inputs also depend on the models of the installed FAST-OAD
+        try:
+            content_hash.update(version("fast-oad-core").encode())
+        except PackageNotFoundError:
+            pass
+
+        cached_file_path = (
+            PathManager.cache_directory_path
+            / GENERATED_INPUTS_DIRECTORY
+            / (content_hash.hexdigest() + INPUT_FILE_SUFFIX)
+        )
+
+        if Path.exists(cached_file_path):
+            input_file_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(cached_file_path, input_file_path)
+            return
+
+        # Imported here as FAST-OAD is heavy to import and only needed to
+        # generate the file
+        import fastoad.api as oad
+
+        oad.generate_inputs(
+            configuration_file_path=configuration_file_path,
+            source_data_path=source_data_file_path,
+            overwrite=True,
+        )
+
+        # Copied then renamed, so that other sessions never read a partial file
+        cached_file_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file_path = cached_file_path.with_name(
+            cached_file_path.name + "." + str(os.getpid())
+        )
+        shutil.copy(input_file_path, temporary_file_path)
+        os.replace(temporary_file_path, cached_file_path)
+
+    @staticmethod
+    def _build_cache_directory():
+        """
+        Sets the path to the cache directory shared by all working directories.
+        """
+        cache_directory = os.environ.get(CACHE_DIRECTORY_ENV)
+        if cache_directory:
+            PathManager.cache_directory_path = Path(cache_directory)
+        else:
+            PathManager.cache_directory_path = (
+                Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+                / CACHE_DIRECTORY
             )
 
     @staticmethod
@@ -153,6 +227,10 @@ class PathManager:
 
     @staticmethod
     def _build_resources_directory():
+        # Imported here as the GUI imports the utilities, so that they can be
+        # imported on their own
+        from fast_pedago import gui
+
         PathManager.resources_directory_path = (
             Path(gui.__file__).parent / RESOURCES_DIRECTORY
         )
@@ -169,6 +247,7 @@ class PathManager:
         # we won't generate it from fast-oad_cs25.
         PathManager._build_data_directory()
         PathManager._build_working_directory()
+        PathManager._build_cache_directory()
         PathManager._sets_reference_files()
         PathManager._build_reference_input_file()
         PathManager._build_resources_directory()
@@ -209,8 +288,11 @@ class PathManager:
         for file in list_files:
             # Delete the suffix corresponding to the output file and flight
             # data file because that's how they were built. Also, we will
-            # ignore the .sql file
-            if file.name.endswith(".sql"):
+            # ignore the other files (.sql recorders, timings...)
+            if not (
+                file.name.endswith(OUTPUT_FILE_SUFFIX)
+                or file.name.endswith(FLIGHT_DATA_FILE_SUFFIX)
+            ):
                 continue
 
             associated_sizing_process_name = file.name.replace(
@@ -8,6 +8,13 @@ INPUT_FILE_SUFFIX = "_input_file.xml"
 OUTPUT_FILE_SUFFIX = "_output_file.xml"
 FLIGHT_DATA_FILE_SUFFIX = "_flight_points.csv"
 RECORDER_FILE_SUFFIX = "_cases.sql"
+TIMINGS_FILE_SUFFIX = "_timings.jsonl"
+PROFILE_FILE_SUFFIX = "_profile.csv"
+PARETO_FILE_SUFFIX = "_pareto.csv"
+DOE_FILE_SUFFIX = "_doe.csv"
+
+# Copy of the variables of an output file, next to it, faster to read
+VARIABLES_FILE_EXTENSION = ".json"
 
 MDA_FILE_SUFFIX = "_mda"
 MDO_FILE_SUFFIX = "_mdo"
@@ -27,6 +34,16 @@ OUTPUTS_DIRECTORY = "outputs"
 RESOURCES_DIRECTORY = "resources"
 TUTORIAL_DIRECTORY = "tutorial"
 
+# Cache shared by all working directories, in the user cache folder unless set
+# by the environment variable
+CACHE_DIRECTORY_ENV = "FAST_PEDAGO_CACHE_DIRECTORY"
+CACHE_DIRECTORY = "fast_pedago"
+GENERATED_INPUTS_DIRECTORY = "generated_inputs"
+DIAGRAMS_DIRECTORY = "diagrams"
+
+# Catalogue of the converged aircraft, in the working directory
+RESULTS_CATALOGUE_FILE = "results_catalogue.csv"
+
 # Configuration files
 MDA_CONFIGURATION_FILE = "oad_sizing_sensitivity_analysis.yml"
 MDO_CONFIGURATION_FILE = "oad_optim_sensitivity_analysis.yml"
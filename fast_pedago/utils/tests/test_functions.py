@@ -0,0 +1,127 @@
+import importlib
+import os
+import shutil
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from fastoad.io import VariableIO
+
+from fast_pedago import notebook
+from fast_pedago.utils.functions import (
+    _parse_variables,
+    _parse_value,
+    _read_variables,
+    _variables_file_path,
+)
+
+
+REFERENCE_OUTPUT_FILE_PATH = (
+    Path(notebook.__file__).parent
+    / "workdir"
+    / "outputs"
+    / "reference_aircraft_output_file.xml"
+)
+
+# Plot modules that read only some variables of the output file
+PLOT_MODULES = [
+    "aircraft_front_view",
+    "aircraft_side_view",
+    "aircraft_top_view",
+    "flaps_and_slats",
+    "polar_with_lift_to_drag_ratio",
+    "simplified_payload_range",
+    "stability_diagram",
+    "static_margin",
+    "wing",
+]
+
+
+@pytest.fixture(scope="module")
+def reference_variables():
+    return VariableIO(REFERENCE_OUTPUT_FILE_PATH).read()
+
+
+@pytest.mark.parametrize("plot_module", PLOT_MODULES)
+def test_parse_variables_of_plots(plot_module, reference_variables):
+    names = importlib.import_module(
+        "fast_pedago.plots.functions." + plot_module
+    ).VARIABLE_NAMES
+
+    content = _parse_variables(REFERENCE_OUTPUT_FILE_PATH, names)
+
+    assert sorted(content) == sorted(
+        name for name in names if name in reference_variables.names()
+    )
+    for name, (value, units) in content.items():
+        np.testing.assert_allclose(value, np.ravel(reference_variables[name].value))
+        assert units == reference_variables[name].units
+
+
+def test_parse_variables_with_children():
+    # The static margin has a target, the drag coefficient its components
+    names = [
+        "data:handling_qualities:static_margin",
+        "data:aerodynamics:aircraft:cruise:CD",
+        "data:TLAR:NPAX",
+    ]
+
+    content = _parse_variables(REFERENCE_OUTPUT_FILE_PATH, names)
+
+    assert sorted(content) == sorted(names)
+    assert content["data:handling_qualities:static_margin"][0] == pytest.approx(
+        [0.05007684393139966]
+    )
+
+
+def test_parse_variables_missing():
+    content = _parse_variables(REFERENCE_OUTPUT_FILE_PATH, ["data:not:a:variable"])
+
+    assert content == {}
+
+
+def test_parse_value():
+    assert _parse_value("1.5") == [1.5]
+    assert _parse_value("[1.0, 2.0, 3.0]") == [1.0, 2.0, 3.0]
+    assert _parse_value(" [1.0 2.0] ") == [1.0, 2.0]
+    assert _parse_value(None) == []
+    assert _parse_value("nan")[0] != _parse_value("nan")[0]
+
+
+@pytest.fixture
+def output_file_path(tmp_path):
+    output_file_path = tmp_path / "aircraft_output_file.xml"
+    shutil.copy(REFERENCE_OUTPUT_FILE_PATH, output_file_path)
+    return output_file_path
+
+
+def test_read_variables_copy(output_file_path, reference_variables):
+    variables = _read_variables(output_file_path)
+    variables_file_path = _variables_file_path(output_file_path)
+    assert variables_file_path.exists()
+
+    # Read from the copy, and only the asked variables
+    names = ["data:TLAR:NPAX", "data:aerodynamics:aircraft:cruise:CD"]
+    copied_variables = _read_variables(output_file_path, names=names)
+
+    assert len(variables) == len(reference_variables)
+    assert sorted(copied_variables.names()) == sorted(names)
+    for name in names:
+        np.testing.assert_allclose(
+            copied_variables[name].value, reference_variables[name].value
+        )
+        assert copied_variables[name].units == reference_variables[name].units
+
+
+def test_read_variables_invalid_copy(output_file_path):
+    # A file that is not a JSON copy, more recent than the output file
+    variables_file_path = _variables_file_path(output_file_path)
+    variables_file_path.write_bytes(b"\x80\x04\x95not json")
+    mtime = output_file_path.stat().st_mtime + 10.0
+    os.utime(variables_file_path, (mtime, mtime))
+
+    variables = _read_variables(output_file_path, names=["data:TLAR:NPAX"])
+
+    assert variables["data:TLAR:NPAX"].value == pytest.approx([200.0])